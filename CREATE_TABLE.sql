@@ -19,6 +19,7 @@ CREATE TABLE tbl_quiz (
     selected_questions INTEGER DEFAULT 10,
     is_randomized_questions BOOLEAN DEFAULT FALSE,
     is_randomized_choices BOOLEAN DEFAULT FALSE,
+    version INTEGER NOT NULL DEFAULT 1,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     updated_at TIMESTAMP WITH TIME ZONE,
     FOREIGN KEY (user_id) REFERENCES tbl_user (id)
@@ -79,6 +80,7 @@ CREATE TABLE tbl_quiz_session (
     completed_at TIMESTAMP,
     is_completed BOOLEAN NOT NULL DEFAULT FALSE,
     score FLOAT,
+    seed INTEGER,
     FOREIGN KEY (quiz_id) REFERENCES tbl_quiz (id) ON DELETE CASCADE,
     FOREIGN KEY (user_id) REFERENCES tbl_user (id) ON DELETE CASCADE
 );
@@ -108,7 +110,8 @@ CREATE TABLE tbl_choice_session (
 
 -- 인덱스 생성
 CREATE INDEX idx_quiz_user_id ON tbl_quiz(user_id);
-CREATE INDEX idx_question_quiz_id ON tbl_question(quiz_id);
+CREATE INDEX idx_quiz_created_at_id ON tbl_quiz(created_at DESC, id DESC);
+CREATE INDEX idx_question_quiz_id_id ON tbl_question(quiz_id, id);
 CREATE INDEX idx_choice_question_id ON tbl_choice(question_id);
 CREATE INDEX idx_quiz_attempt_quiz_id ON tbl_quiz_attempt(quiz_id);
 CREATE INDEX idx_quiz_attempt_user_id ON tbl_quiz_attempt(user_id);
@@ -0,0 +1,68 @@
+"""
+로그인 폭주 시 비밀번호 검증이 이벤트 루프를 막는지 비교
+
+    python -m bench.bench_login --logins 200 --concurrency 50
+
+- inline: 이벤트 루프에서 바로 CryptContext.verify (이전 방식에 해시를 도입했을 때)
+- executor: PASSWORD_HASHER (스레드 풀, AuthConfig.password_hash_workers)
+
+로그인 처리량과 함께, 10ms 간격으로 깨어나는 다른 요청(티커)의 최대/평균 지연을 출력합니다.
+"""
+import argparse
+import asyncio
+import time
+from passlib.context import CryptContext
+from commons.utils.password import PASSWORD_HASHER
+from config.config import auth_config
+
+
+TICK_SEC = 0.01
+
+
+async def ticker(stop: asyncio.Event, lags: list) -> None:
+    # 다른 요청을 흉내: 10ms 마다 깨어나 예정보다 얼마나 늦었는지 기록
+    while not stop.is_set():
+        expected = time.perf_counter() + TICK_SEC
+        await asyncio.sleep(TICK_SEC)
+        lags.append(max(0.0, time.perf_counter() - expected))
+
+
+async def run(name: str, verify, password_hash: str, logins: int, concurrency: int) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def login():
+        async with semaphore:
+            await verify("password", password_hash)
+
+    stop, lags = asyncio.Event(), []
+    ticker_task = asyncio.create_task(ticker(stop, lags))
+    started = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await ticker_task
+
+    lags = lags or [0.0]
+    print(f"{name:<10}{logins / elapsed:>12.1f}{max(lags) * 1000:>14.1f}{sum(lags) / len(lags) * 1000:>14.1f}")
+
+
+async def main(logins: int, concurrency: int) -> None:
+    context = CryptContext(schemes=[auth_config.password_scheme])
+    password_hash = context.hash("password")
+
+    async def inline_verify(password: str, stored: str):
+        return context.verify(password, stored)
+
+    print(f"scheme={auth_config.password_scheme}, workers={auth_config.password_hash_workers}, logins={logins}, concurrency={concurrency}")
+    print(f"{'mode':<10}{'logins/s':>12}{'max lag ms':>14}{'avg lag ms':>14}")
+    await run("inline", inline_verify, password_hash, logins, concurrency)
+    await run("executor", PASSWORD_HASHER.verify, password_hash, logins, concurrency)
+    PASSWORD_HASHER.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.concurrency))
@@ -0,0 +1,90 @@
+"""
+응답 직렬화 비용 비교 (큰 제출 결과 / 응시 세션 응답)
+
+    python -m bench.bench_serialize --questions 200
+
+- remove_none: 이전 RemoveNoneResponse (obj.model_dump() -> RemoveNoneValues -> orjson)
+- exclude_none: commons.utils.serializer.dumps_without_none (현재 RemoveNoneResponse, model_dump(exclude_none=True) -> orjson)
+"""
+import argparse
+import time
+from datetime import datetime
+import orjson
+from commons.utils.serializer import dumps_without_none
+from router.v1.quiz.protocol import QuizResultQuestion, QuizSessionChoice, QuizSessionQuestion, Res_QuizSession, Res_QuizSubmit
+from router.v1.validator.dependencies import RemoveNoneValues
+
+
+def build_submit(question_count: int) -> Res_QuizSubmit:
+    res = Res_QuizSubmit()
+    res.quiz_id = 1
+    res.session_id = "00000000-0000-0000-0000-000000000000"
+    res.title = "benchmark"
+    res.total_questions = question_count
+    res.correct_answers = question_count // 2
+    res.score = 50.0
+    res.started_at = datetime.now()
+    res.completed_at = datetime.now()
+    # model_dump 는 필드에 직접 넣은 dict 안의 None 을 빼지 못하므로 두 방식 모두 같은 결과가 나오도록 모델로 넣음
+    res.questions = [
+        QuizResultQuestion(
+            question_id=i,
+            question_text=f"question {i}",
+            selected_choice_id=i * 4 if i % 3 else None,
+            selected_choice_text=f"choice {i * 4}" if i % 3 else None,
+            correct_choice_id=i * 4,
+            correct_choice_text=f"choice {i * 4}",
+            is_correct=i % 2 == 0
+        )
+        for i in range(question_count)
+    ]
+    return res
+
+
+def build_session(question_count: int) -> Res_QuizSession:
+    res = Res_QuizSession()
+    res.quiz_id = 1
+    res.session_id = "00000000-0000-0000-0000-000000000000"
+    res.title = "benchmark"
+    res.started_at = datetime.now()
+    res.is_completed = False
+    res.questions = [
+        QuizSessionQuestion(
+            question_id=i,
+            question_text=f"question {i}",
+            choices=[QuizSessionChoice(choice_id=i * 4 + j, text=f"choice {j}") for j in range(4)],
+            selected_choice_id=None
+        )
+        for i in range(question_count)
+    ]
+    return res
+
+
+SERIALIZERS = {
+    "remove_none": lambda obj: orjson.dumps(RemoveNoneValues(obj.model_dump()), option=orjson.OPT_NON_STR_KEYS),
+    "exclude_none": dumps_without_none,
+}
+
+
+def main(question_count: int, iterations: int) -> None:
+    print(f"questions={question_count}, iterations={iterations} (microseconds per response)")
+    print(f"{'response':<10}" + "".join(f"{name:>14}" for name in SERIALIZERS))
+    for name, res in (("submit", build_submit(question_count)), ("session", build_session(question_count))):
+        # 같은 결과인지 먼저 확인
+        expected = orjson.loads(SERIALIZERS["remove_none"](res))
+        row = f"{name:<10}"
+        for serializer in SERIALIZERS.values():
+            assert orjson.loads(serializer(res)) == expected
+            started = time.perf_counter()
+            for _ in range(iterations):
+                serializer(res)
+            row += f"{(time.perf_counter() - started) / iterations * 1_000_000:>14.1f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--questions", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+    main(args.questions, args.iterations)
@@ -0,0 +1,136 @@
+"""
+자주 실행되는 CRUD 쿼리의 컴파일 / prepare 비용 비교
+
+    python -m bench.bench_statements             # 컴파일 비용만 (DB 불필요)
+    python -m bench.bench_statements --db        # config.local.toml 의 DB 에서 prepare 포함 실행 시간
+
+- compile: 요청마다 select(...) 를 새로 조립하던 이전 방식과 crud/statements.py 의 미리 만든 문장을 비교합니다.
+  "no cache" 는 매번 SQL 문자열까지 컴파일하는 비용(컴파일 캐시가 넘칠 때)입니다.
+- db: prepared_statement_cache_size=0 (매번 prepare) 과 설정값을 비교합니다.
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+from sqlalchemy.ext.asyncio import create_async_engine
+from crud.statements import ANSWER_TARGET_STMT, SESSION_DETAIL_STMT
+from db.database import db_url, engine_options
+from config.config import db_config
+from models.quiz import tbl_choice, tbl_choice_session, tbl_question, tbl_question_session, tbl_quiz, tbl_quiz_session
+
+
+def build_answer_target(session_id: str, question_id: int, user_id: int):
+    # 이전 save_answer 방식: 요청마다 조립
+    return select(
+        tbl_question_session.id,
+        tbl_quiz_session.quiz_id,
+        tbl_quiz.version
+    ).join(
+        tbl_quiz_session, tbl_question_session.session_id == tbl_quiz_session.id
+    ).join(
+        tbl_quiz, tbl_quiz_session.quiz_id == tbl_quiz.id
+    ).where(
+        tbl_question_session.session_id == session_id,
+        tbl_question_session.question_id == question_id,
+        tbl_quiz_session.user_id == user_id,
+        tbl_quiz_session.is_completed == False
+    )
+
+
+def build_session_detail(session_id: str, user_id: int):
+    # 이전 get_quiz_session 방식: 요청마다 조립
+    return select(
+        tbl_quiz_session.quiz_id, tbl_quiz_session.started_at, tbl_quiz_session.is_completed,
+        tbl_quiz_session.completed_at, tbl_quiz_session.score, tbl_quiz.title, tbl_quiz.description,
+        tbl_question_session.question_id, tbl_question_session.selected_choice_id, tbl_question.question_text,
+        tbl_choice.id.label("choice_id"), tbl_choice.content.label("choice_text")
+    ).join(
+        tbl_quiz, tbl_quiz_session.quiz_id == tbl_quiz.id
+    ).outerjoin(
+        tbl_question_session, tbl_question_session.session_id == tbl_quiz_session.id
+    ).outerjoin(
+        tbl_question, tbl_question_session.question_id == tbl_question.id
+    ).outerjoin(
+        tbl_choice_session, tbl_choice_session.question_session_id == tbl_question_session.id
+    ).outerjoin(
+        tbl_choice, tbl_choice_session.choice_id == tbl_choice.id
+    ).where(
+        tbl_quiz_session.id == session_id,
+        tbl_quiz_session.user_id == user_id
+    ).order_by(
+        tbl_question_session.question_order,
+        tbl_choice_session.choice_order
+    )
+
+
+def per_call_us(func, iterations: int) -> float:
+    started = time.perf_counter()
+    for i in range(iterations):
+        func(i)
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def cached_compile(make_stmt, dialect):
+    # Engine 컴파일 캐시와 같은 경로: 캐시 키 생성 후 조회, 없으면 컴파일
+    # (CacheKey 자체는 해시할 수 없으므로 Engine 과 같이 구조 부분인 key.key 를 사용)
+    cache = {}
+
+    def run(i):
+        stmt = make_stmt(i)
+        key = stmt._generate_cache_key().key
+        if key not in cache:
+            cache[key] = stmt.compile(dialect=dialect)
+    return run
+
+
+def bench_compile(iterations: int) -> None:
+    dialect = asyncpg_dialect()
+    session_id = str(uuid.uuid4())
+
+    cases = {
+        "answer_target": (lambda i: build_answer_target(session_id, i, 1), ANSWER_TARGET_STMT),
+        "session_detail": (lambda i: build_session_detail(session_id, 1), SESSION_DETAIL_STMT),
+    }
+
+    print(f"compile cost per call ({iterations} iterations, microseconds)")
+    print(f"{'query':<16}{'rebuilt+cached':>16}{'prebuilt+cached':>17}{'no cache':>12}")
+    for name, (build, prebuilt) in cases.items():
+        rebuilt_us = per_call_us(cached_compile(build, dialect), iterations)
+        prebuilt_us = per_call_us(cached_compile(lambda i: prebuilt, dialect), iterations)
+        no_cache_us = per_call_us(lambda i: prebuilt.compile(dialect=dialect), iterations)
+        print(f"{name:<16}{rebuilt_us:>16.1f}{prebuilt_us:>17.1f}{no_cache_us:>12.1f}")
+
+
+async def bench_db(iterations: int) -> None:
+    params = {"session_id": str(uuid.uuid4()), "question_id": 1, "user_id": 1}
+    url = db_url(db_config.db_host, db_config.db_port)
+
+    print(f"\nanswer_target on DB ({iterations} iterations, microseconds per call)")
+    for cache_size in (0, db_config.prepared_statement_cache_size):
+        options = engine_options()
+        options.update(pool_size=1, max_overflow=0)
+        options["connect_args"] = {**options["connect_args"], "prepared_statement_cache_size": cache_size}
+        engine = create_async_engine(url, **options)
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(ANSWER_TARGET_STMT, params)  # 워밍업
+                started = time.perf_counter()
+                for _ in range(iterations):
+                    await conn.execute(ANSWER_TARGET_STMT, params)
+                elapsed = (time.perf_counter() - started) / iterations * 1_000_000
+            print(f"prepared_statement_cache_size={cache_size:<6}{elapsed:>10.1f}")
+        finally:
+            await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--db", action="store_true", help="DB 에 접속해 prepare 캐시 효과까지 측정")
+    args = parser.parse_args()
+
+    bench_compile(args.iterations)
+    if args.db:
+        asyncio.run(bench_db(args.iterations))
@@ -0,0 +1,110 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Optional, Tuple
+from commons.utils.enums import ErrorType
+from commons.utils.metrics import METRICS
+
+
+CACHE_REQUESTS = METRICS.counter("cache_requests_total", "Cache lookups by backend and result (hit / miss)")
+CACHE_ERRORS = METRICS.counter("cache_errors_total", "Cache backend operations that failed")
+CACHE_LOADS = METRICS.counter("cache_loads_total", "Loader calls made after a miss (after single-flight)")
+
+
+class ICacheBackend(ABC):
+    """
+    캐시 백엔드 인터페이스
+
+    백엔드 장애는 예외로 전파하지 않고 미스(get) / 무시(set, delete)로 처리합니다.
+    캐시는 항상 원본(DB)에서 다시 만들 수 있는 값만 담아야 합니다.
+    """
+    name = "cache"
+    # 워커 / 노드 간 공유 여부 (False 면 다른 워커의 set / delete 가 보이지 않음)
+    shared = False
+
+    def __init__(self):
+        # 키별 진행 중인 로드 (프로세스 내 single-flight)
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl_sec: float = 0) -> None:
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    async def incr(self, key: str) -> int:
+        """카운터를 1 증가시키고 증가된 값을 반환합니다. (없으면 0 에서 시작, 만료 없음)"""
+        pass
+
+    @abstractmethod
+    async def get_counter(self, key: str) -> int:
+        """incr 로 올린 카운터 값 (없으면 0)"""
+        pass
+
+    @abstractmethod
+    async def compare_and_set(self, key: str, expected: Any, value: Any, ttl_sec: float = 0) -> bool:
+        """
+        현재 값이 expected 일 때만 value 로 바꿉니다. (원자적, 키가 없거나 백엔드 오류면 False)
+
+        Args:
+            key: 캐시 키
+            expected: 기대하는 현재 값 (문자열 / 정수 같은 단순 값)
+            value: 새 값
+            ttl_sec: 새 값 유지 시간 (0: 백엔드 기본값)
+
+        Returns:
+            교체 여부
+        """
+        pass
+
+    async def close(self) -> None:
+        """종료 시 커넥션 정리 (필요한 백엔드만 구현)"""
+        pass
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[Tuple[Any, ErrorType]]], ttl_sec: float = 0) -> Tuple[Any, ErrorType]:
+        """
+        캐시 값을 반환하고, 없으면 loader 로 만들어 저장합니다.
+
+        같은 키에 대한 동시 미스는 loader 를 한 번만 실행하고 나머지는 그 결과를 기다립니다. (캐시 스탬피드 방지)
+        loader 는 CRUD 와 같은 (데이터, 오류 타입) 을 반환하며, SUCCESS 인 결과만 저장합니다.
+
+        Args:
+            key: 캐시 키
+            loader: 미스 시 실행할 코루틴 함수
+            ttl_sec: 유지 시간 (0: 백엔드 기본값)
+
+        Returns:
+            데이터, 오류 타입
+        """
+        value = await self.get(key)
+        if value is not None:
+            CACHE_REQUESTS.inc(backend=self.name, result="hit")
+            return value, ErrorType.SUCCESS
+        CACHE_REQUESTS.inc(backend=self.name, result="miss")
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            CACHE_LOADS.inc(backend=self.name)
+            result = await loader()
+            if result[1] == ErrorType.SUCCESS and result[0] is not None:
+                await self.set(key, result[0], ttl_sec)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            # 기다리는 요청이 없으면 "exception was never retrieved" 경고가 나지 않도록 소비
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
@@ -0,0 +1,61 @@
+from typing import Any, Optional
+from commons.cache.backend import ICacheBackend
+from commons.utils.lru_cache import LRUCache
+
+
+# 크기 제한이 없을 때 만료 항목을 정리하는 set 횟수 간격
+_PURGE_INTERVAL = 1024
+
+
+class LocalCacheBackend(ICacheBackend):
+    """
+    프로세스 내 LRU + TTL 캐시 (워커별)
+
+    값을 직렬화하지 않고 그대로 저장하므로 꺼낸 값을 수정하면 안 됩니다.
+    incr 카운터(캐시 세대 번호 등)는 LRU 와 별도의 dict 에 두어, 캐시 항목이 많아져도 밀려나 0 으로 되돌아가지 않습니다.
+    max_size 가 None 이면 축출 없이 TTL 로만 정리하는 저장소로 동작합니다. (세션 상태처럼 유실되면 안 되는 값)
+    """
+    name = "local"
+
+    def __init__(self, max_size: Optional[int], default_ttl_sec: float = 0):
+        super().__init__()
+        self.__CACHE = LRUCache(max_size=max_size, ttl_sec=default_ttl_sec)
+        self.__COUNTERS: dict[str, int] = {}
+        self.__SETS_SINCE_PURGE = 0
+
+    async def get(self, key: str) -> Optional[Any]:
+        return self.__CACHE.get(key)
+
+    async def set(self, key: str, value: Any, ttl_sec: float = 0) -> None:
+        self.__CACHE.set(key, value, ttl_sec or None)
+        self._purge_if_unbounded()
+
+    async def delete(self, key: str) -> None:
+        self.__CACHE.pop(key)
+
+    async def incr(self, key: str) -> int:
+        # 카운터는 만료/축출되면 안 되므로 LRU 밖에 저장
+        value = self.__COUNTERS.get(key, 0) + 1
+        self.__COUNTERS[key] = value
+        return value
+
+    async def get_counter(self, key: str) -> int:
+        return self.__COUNTERS.get(key, 0)
+
+    async def compare_and_set(self, key: str, expected: Any, value: Any, ttl_sec: float = 0) -> bool:
+        # 비교와 저장 사이에 await 가 없으므로 이벤트 루프 안에서 원자적
+        current = self.__CACHE.get(key)
+        if current is None or current != expected:
+            return False
+        self.__CACHE.set(key, value, ttl_sec or None)
+        self._purge_if_unbounded()
+        return True
+
+    def _purge_if_unbounded(self) -> None:
+        # 축출이 없으면 다시 읽히지 않는 만료 항목이 쌓이므로 일정 횟수마다 정리 (분할 상환 O(1))
+        if self.__CACHE.max_size is not None:
+            return
+        self.__SETS_SINCE_PURGE += 1
+        if self.__SETS_SINCE_PURGE >= _PURGE_INTERVAL:
+            self.__SETS_SINCE_PURGE = 0
+            self.__CACHE.purge_expired()
@@ -0,0 +1,59 @@
+from commons.cache.backend import ICacheBackend
+from commons.cache.local_backend import LocalCacheBackend
+from commons.cache.redis_backend import RedisCacheBackend
+from config.config import cache_config
+from db.database import worker_count
+
+
+def create_cache_backend() -> ICacheBackend:
+    """CacheConfig.backend 에 따라 캐시 백엔드를 만듭니다. ("local" | "redis")"""
+    if cache_config.backend == "redis":
+        return RedisCacheBackend(
+            host=cache_config.redis_host,
+            port=cache_config.redis_port,
+            db=cache_config.redis_db,
+            password=cache_config.redis_password,
+            pool_size=cache_config.redis_pool_size,
+            timeout_sec=cache_config.redis_timeout_ms / 1000,
+            key_prefix=cache_config.key_prefix,
+            default_ttl_sec=cache_config.default_ttl_sec,
+        )
+    if cache_config.backend != "local":
+        raise ValueError(f"unknown cache backend: {cache_config.backend}")
+    return LocalCacheBackend(max_size=cache_config.local_max_size, default_ttl_sec=cache_config.default_ttl_sec)
+
+
+def create_session_backend() -> ICacheBackend:
+    """
+    로그인 세션 상태 저장소를 만듭니다.
+
+    폐기 목록 / 리프레시 토큰이 캐시 항목에 밀려 사라지면 로그아웃한 세션이 되살아나므로,
+    응답 캐시와 공유하지 않고 축출이 없는 저장소를 따로 씁니다.
+    """
+    if cache_config.backend == "redis":
+        return RedisCacheBackend(
+            host=cache_config.session_redis_host or cache_config.redis_host,
+            port=cache_config.session_redis_port or cache_config.redis_port,
+            db=cache_config.redis_db,
+            password=cache_config.redis_password,
+            pool_size=cache_config.redis_pool_size,
+            timeout_sec=cache_config.redis_timeout_ms / 1000,
+            key_prefix=cache_config.key_prefix,
+        )
+    if worker_count() > 1:
+        print("[CACHE_WARNING] local session store is per worker; refresh / logout only work on the worker that issued the session")
+    return LocalCacheBackend(max_size=None)
+
+
+CACHE_BACKEND = create_cache_backend()
+SESSION_BACKEND = create_session_backend()
+
+
+def get_cache() -> ICacheBackend:
+    """서비스 주입용 캐시 백엔드 의존성 (테스트에서는 dependency_overrides 로 교체)"""
+    return CACHE_BACKEND
+
+
+def get_session_backend() -> ICacheBackend:
+    """로그인 세션 상태 저장소 의존성"""
+    return SESSION_BACKEND
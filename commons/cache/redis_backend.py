@@ -0,0 +1,188 @@
+import asyncio
+import pickle
+from typing import Any, Optional
+from commons.cache.backend import CACHE_ERRORS, ICacheBackend
+
+
+class RedisError(Exception):
+    pass
+
+
+# GET 비교와 SET 을 서버에서 한 번에 실행 (ARGV: 기대 값, 새 값, PX 밀리초(0: 만료 없음))
+_COMPARE_AND_SET_SCRIPT = """
+if redis.call('GET', KEYS[1]) ~= ARGV[1] then
+    return 0
+end
+if tonumber(ARGV[3]) > 0 then
+    redis.call('SET', KEYS[1], ARGV[2], 'PX', ARGV[3])
+else
+    redis.call('SET', KEYS[1], ARGV[2])
+end
+return 1
+"""
+
+
+class _RedisConnection:
+    """RESP2 프로토콜 커넥션 하나 (명령은 한 번에 하나씩)"""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    async def command(self, *args) -> Any:
+        self.writer.write(self._encode(args))
+        await self.writer.drain()
+        return await self._read_reply()
+
+    def close(self) -> None:
+        self.writer.close()
+
+    def _encode(self, args: tuple) -> bytes:
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            if isinstance(arg, str):
+                arg = arg.encode()
+            elif isinstance(arg, int):
+                arg = str(arg).encode()
+            parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+        return b"".join(parts)
+
+    async def _read_reply(self) -> Any:
+        line = await self.reader.readuntil(b"\r\n")
+        prefix, payload = line[:1], line[1:-2]
+        if prefix == b"+":
+            return payload.decode()
+        if prefix == b"-":
+            raise RedisError(payload.decode())
+        if prefix == b":":
+            return int(payload)
+        if prefix == b"$":
+            length = int(payload)
+            if length < 0:
+                return None
+            data = await self.reader.readexactly(length + 2)
+            return data[:-2]
+        if prefix == b"*":
+            length = int(payload)
+            if length < 0:
+                return None
+            return [await self._read_reply() for _ in range(length)]
+        raise RedisError(f"unknown reply: {line!r}")
+
+
+class RedisCacheBackend(ICacheBackend):
+    """
+    Redis(RESP 호환) 공유 캐시
+
+    외부 클라이언트 라이브러리 없이 GET / SET PX / DEL / INCR / EVAL(compare_and_set) 만 사용합니다.
+    값은 pickle 로 직렬화하므로 신뢰할 수 있는 내부 Redis 에만 연결해야 합니다.
+    커넥션은 pool_size 까지 만들어 재사용하며, 오류가 난 커넥션은 버립니다.
+    """
+    name = "redis"
+    shared = True
+
+    def __init__(self, host: str, port: int, db: int = 0, password: str = "", pool_size: int = 10,
+                 timeout_sec: float = 1.0, key_prefix: str = "", default_ttl_sec: float = 0):
+        super().__init__()
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.timeout_sec = timeout_sec
+        self.key_prefix = key_prefix
+        self.default_ttl_sec = default_ttl_sec
+        self.__POOL_SIZE = pool_size
+        self.__IDLE: list[_RedisConnection] = []
+        # 이벤트 루프 생성 이후에 만들어야 하므로 지연 생성
+        self.__SEMAPHORE: Optional[asyncio.Semaphore] = None
+
+    async def get(self, key: str) -> Optional[Any]:
+        try:
+            data = await self._execute("GET", self.key_prefix + key)
+        except Exception as e:
+            self._on_error("GET", e)
+            return None
+        return None if data is None else pickle.loads(data)
+
+    async def set(self, key: str, value: Any, ttl_sec: float = 0) -> None:
+        args = ["SET", self.key_prefix + key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)]
+        ttl_sec = ttl_sec or self.default_ttl_sec
+        if ttl_sec:
+            args += ["PX", int(ttl_sec * 1000)]
+        try:
+            await self._execute(*args)
+        except Exception as e:
+            self._on_error("SET", e)
+
+    async def delete(self, key: str) -> None:
+        try:
+            await self._execute("DEL", self.key_prefix + key)
+        except Exception as e:
+            self._on_error("DEL", e)
+
+    async def incr(self, key: str) -> int:
+        try:
+            return await self._execute("INCR", self.key_prefix + key)
+        except Exception as e:
+            self._on_error("INCR", e)
+            return 0
+
+    async def get_counter(self, key: str) -> int:
+        # INCR 값은 pickle 이 아닌 정수 문자열로 저장됩니다.
+        try:
+            data = await self._execute("GET", self.key_prefix + key)
+        except Exception as e:
+            self._on_error("GET", e)
+            return 0
+        return int(data) if data is not None else 0
+
+    async def compare_and_set(self, key: str, expected: Any, value: Any, ttl_sec: float = 0) -> bool:
+        # 값은 pickle 바이트로 비교하므로 expected 는 직렬화 결과가 항상 같은 단순 값이어야 함
+        ttl_sec = ttl_sec or self.default_ttl_sec
+        try:
+            replaced = await self._execute(
+                "EVAL", _COMPARE_AND_SET_SCRIPT, 1, self.key_prefix + key,
+                pickle.dumps(expected, protocol=pickle.HIGHEST_PROTOCOL),
+                pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
+                int(ttl_sec * 1000),
+            )
+        except Exception as e:
+            self._on_error("EVAL", e)
+            return False
+        return replaced == 1
+
+    async def close(self) -> None:
+        while self.__IDLE:
+            self.__IDLE.pop().close()
+
+    async def _execute(self, *args) -> Any:
+        if self.__SEMAPHORE is None:
+            self.__SEMAPHORE = asyncio.Semaphore(self.__POOL_SIZE)
+
+        async with self.__SEMAPHORE:
+            conn = self.__IDLE.pop() if self.__IDLE else await self._connect()
+            try:
+                result = await asyncio.wait_for(conn.command(*args), timeout=self.timeout_sec)
+            except BaseException:
+                # 응답을 다 읽지 못했을 수 있으므로 재사용하지 않음
+                conn.close()
+                raise
+            self.__IDLE.append(conn)
+            return result
+
+    async def _connect(self) -> _RedisConnection:
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(self.host, self.port), timeout=self.timeout_sec)
+        conn = _RedisConnection(reader, writer)
+        try:
+            if self.password:
+                await asyncio.wait_for(conn.command("AUTH", self.password), timeout=self.timeout_sec)
+            if self.db:
+                await asyncio.wait_for(conn.command("SELECT", self.db), timeout=self.timeout_sec)
+        except BaseException:
+            conn.close()
+            raise
+        return conn
+
+    def _on_error(self, command: str, e: Exception) -> None:
+        CACHE_ERRORS.inc(backend=self.name, command=command)
+        print(f"[CACHE_ERROR] redis {command} failed: {e!r}")
@@ -0,0 +1,35 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional
+
+
+# 키셋(커서) 페이지네이션용 불투명 커서
+# 클라이언트는 내용을 해석하지 않고 응답의 next_cursor 를 그대로 되돌려 보냅니다.
+
+def encode_cursor(values: dict) -> str:
+    raw = json.dumps(values, separators=(",", ":"), default=_json_default).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Optional[dict]:
+    """잘못된 커서면 None 을 반환합니다."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return values if isinstance(values, dict) else None
+    except (ValueError, UnicodeError):
+        return None
+
+
+def parse_cursor_datetime(value) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _json_default(obj):
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"{type(obj).__name__} is not cursor serializable")
@@ -11,4 +11,8 @@ class ErrorType(Enum):
     NOT_ADMIN = 5
     QUIZ_NOT_FOUND = 6
     QUIZ_SESSION_NOT_FOUND = 7
+    INVALID_CURSOR = 8
+    QUESTIONS_NOT_FOUND = 9
     DB_RUN_FAILED = 10
+    INVALID_TOKEN = 11
+    INVALID_IMPORT_ROW = 12
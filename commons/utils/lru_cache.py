@@ -0,0 +1,59 @@
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    크기 제한(LRU) + 선택적 TTL 을 가진 프로세스 내 캐시
+
+    asyncio 단일 스레드에서 사용하는 것을 전제로 하며 잠금을 사용하지 않습니다.
+    max_size 가 0 이면 저장하지 않고(사용 안 함), None 이면 크기 제한(축출) 없이 TTL 로만 정리합니다. (purge_expired 로 만료 항목 제거)
+    """
+
+    def __init__(self, max_size: Optional[int] = 1024, ttl_sec: float = 0):
+        self.max_size = max_size
+        self.ttl_sec = ttl_sec
+        self._items: "OrderedDict[Hashable, tuple[Any, float]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        item = self._items.get(key, _MISSING)
+        if item is _MISSING:
+            return default
+
+        value, expire_at = item
+        if expire_at and expire_at <= time.monotonic():
+            del self._items[key]
+            return default
+
+        self._items.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl_sec: Optional[float] = None) -> None:
+        ttl_sec = self.ttl_sec if ttl_sec is None else ttl_sec
+        expire_at = time.monotonic() + ttl_sec if ttl_sec else 0
+        self._items[key] = (value, expire_at)
+        self._items.move_to_end(key)
+        while self.max_size is not None and len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        item = self._items.pop(key, _MISSING)
+        return default if item is _MISSING else item[0]
+
+    def purge_expired(self) -> int:
+        """만료된 항목을 모두 제거하고 제거한 개수를 반환합니다. (O(n))"""
+        now = time.monotonic()
+        expired = [key for key, (_, expire_at) in self._items.items() if expire_at and expire_at <= now]
+        for key in expired:
+            del self._items[key]
+        return len(expired)
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
@@ -0,0 +1,107 @@
+from collections import defaultdict
+from typing import Callable, Iterable, Optional
+from commons.utils.singleton import Singleton
+
+
+# Prometheus 텍스트 포맷(0.0.4) 지표
+# 외부 라이브러리 없이 /metrics 에서 바로 내보낼 수 있는 최소 구현입니다.
+
+def _format_labels(labels: tuple) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in labels) + "}"
+
+
+class Counter:
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self._values: dict[tuple, float] = defaultdict(float)
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        self._values[tuple(sorted(labels.items()))] += amount
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.description}"
+        yield f"# TYPE {self.name} counter"
+        for labels, value in self._values.items():
+            yield f"{self.name}{_format_labels(labels)} {value}"
+
+
+class Gauge:
+    """수집 시점에 콜백으로 값을 읽는 게이지"""
+
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self._functions: dict[tuple, Callable[[], float]] = {}
+
+    def set_function(self, function: Callable[[], float], **labels) -> None:
+        self._functions[tuple(sorted(labels.items()))] = function
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.description}"
+        yield f"# TYPE {self.name} gauge"
+        for labels, function in self._functions.items():
+            yield f"{self.name}{_format_labels(labels)} {function()}"
+
+
+class Histogram:
+    def __init__(self, name: str, description: str, buckets: tuple):
+        self.name = name
+        self.description = description
+        self.buckets = tuple(sorted(buckets))
+        self._counts: dict[tuple, list[int]] = {}
+        self._sums: dict[tuple, float] = defaultdict(float)
+
+    def observe(self, value: float, **labels) -> None:
+        key = tuple(sorted(labels.items()))
+        counts = self._counts.get(key)
+        if counts is None:
+            counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[i] += 1
+        counts[-1] += 1
+        self._sums[key] += value
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.description}"
+        yield f"# TYPE {self.name} histogram"
+        for labels, counts in self._counts.items():
+            for bound, count in zip(self.buckets, counts):
+                yield f"{self.name}_bucket{_format_labels(labels + (('le', bound),))} {count}"
+            yield f"{self.name}_bucket{_format_labels(labels + (('le', '+Inf'),))} {counts[-1]}"
+            yield f"{self.name}_sum{_format_labels(labels)} {self._sums[labels]}"
+            yield f"{self.name}_count{_format_labels(labels)} {counts[-1]}"
+
+
+class MetricsRegistry(Singleton):
+    def __init__(self):
+        if not MetricsRegistry.is_init():
+            MetricsRegistry.set_init()
+            self.__METRICS: dict[str, object] = {}
+
+    def counter(self, name: str, description: str) -> Counter:
+        return self._register(name, lambda: Counter(name, description))
+
+    def gauge(self, name: str, description: str) -> Gauge:
+        return self._register(name, lambda: Gauge(name, description))
+
+    def histogram(self, name: str, description: str, buckets: tuple) -> Histogram:
+        return self._register(name, lambda: Histogram(name, description, buckets))
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.__METRICS.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def _register(self, name: str, factory: Callable[[], object]):
+        metric: Optional[object] = self.__METRICS.get(name)
+        if metric is None:
+            metric = self.__METRICS[name] = factory()
+        return metric
+
+
+METRICS = MetricsRegistry()
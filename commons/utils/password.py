@@ -0,0 +1,47 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+from passlib.context import CryptContext
+from commons.utils.singleton import Singleton
+from config.config import auth_config
+
+
+class PasswordHasher(Singleton):
+    """
+    비밀번호 해시 / 검증 (passlib)
+
+    해시 계산은 CPU 를 많이 쓰므로 이벤트 루프가 아닌 크기가 제한된 스레드 풀에서 실행합니다.
+    (pbkdf2 / bcrypt / argon2 구현은 계산 중 GIL 을 놓습니다)
+    평문으로 저장된 기존 계정은 plaintext 스킴으로 검증하고, 로그인 성공 시 새 해시를 돌려줘 교체하게 합니다.
+    """
+
+    def __init__(self):
+        if not PasswordHasher.is_init():
+            PasswordHasher.set_init()
+            self.__CONTEXT = CryptContext(
+                schemes=[auth_config.password_scheme, "plaintext"],
+                default=auth_config.password_scheme,
+                deprecated=["plaintext"],
+            )
+            self.__EXECUTOR = ThreadPoolExecutor(max_workers=auth_config.password_hash_workers, thread_name_prefix="password")
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self.__CONTEXT.hash, password)
+
+    async def verify(self, password: str, password_hash: str) -> Tuple[bool, Optional[str]]:
+        """
+        비밀번호를 검증합니다.
+
+        Returns:
+            일치 여부, 교체할 새 해시 (평문/이전 스킴이면 새 해시, 아니면 None)
+        """
+        return await self._run(self.__CONTEXT.verify_and_update, password, password_hash)
+
+    def shutdown(self) -> None:
+        self.__EXECUTOR.shutdown(wait=False)
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.__EXECUTOR, func, *args)
+
+
+PASSWORD_HASHER = PasswordHasher()
@@ -0,0 +1,107 @@
+import codecs
+import csv
+from itertools import islice
+from typing import AsyncIterator, Iterator
+import orjson
+from fastapi import HTTPException, UploadFile
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
+from router.v1.quiz.protocol import Choice, Question
+
+
+class QuestionImportError(Exception):
+    """업로드 파일의 행이 문제 형식/규칙(Question.validate_choices)에 맞지 않음"""
+
+    def __init__(self, line: int, detail: str):
+        super().__init__(f"{line}: {detail}")
+        self.line = line
+        self.detail = detail
+
+
+def guess_import_format(filename: str | None) -> str | None:
+    """파일 확장자로 형식을 추정합니다. (.ndjson / .jsonl / .csv)"""
+    extension = (filename or "").rsplit(".", 1)[-1].lower()
+    if extension in ("ndjson", "jsonl"):
+        return "ndjson"
+    if extension == "csv":
+        return "csv"
+    return None
+
+
+def _validate(line: int, question_text, choices: list) -> Question:
+    try:
+        return Question(question_text=question_text, choices=choices)
+    except HTTPException as e:
+        # validate_choices 는 HTTPException 을 발생시킴
+        raise QuestionImportError(line, e.detail)
+    except ValidationError as e:
+        raise QuestionImportError(line, "; ".join(f"{'.'.join(map(str, error['loc']))}: {error['msg']}" for error in e.errors()))
+
+
+def _parse_ndjson(lines: Iterator[str]) -> Iterator[Question]:
+    """
+    한 줄에 문제 하나 (Req_QuizCreate.questions 항목과 같은 형식)
+        {"question_text": "...", "choices": [{"text": "...", "is_correct": true}, ...]}
+    """
+    for line_num, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = orjson.loads(line)
+        except orjson.JSONDecodeError as e:
+            raise QuestionImportError(line_num, f"JSON 형식 오류 ({e})")
+        if not isinstance(row, dict):
+            raise QuestionImportError(line_num, "문제는 JSON 객체여야 합니다")
+        yield _validate(line_num, row.get("question_text"), row.get("choices"))
+
+
+def _parse_csv(lines: Iterator[str]) -> Iterator[Question]:
+    """
+    첫 행은 헤더, 이후 한 행에 문제 하나
+        question_text, correct_choice(정답 선택지 번호, 1부터), choice_1, choice_2, ...
+    빈 선택지 칸은 무시합니다.
+    """
+    reader = csv.reader(lines)
+    next(reader, None)
+    for row in reader:
+        if not any(cell.strip() for cell in row):
+            continue
+        if len(row) < 2:
+            raise QuestionImportError(reader.line_num, "question_text, correct_choice, 선택지 컬럼이 필요합니다")
+        question_text, correct_choice, *choice_texts = row
+        try:
+            correct_index = int(correct_choice) - 1
+        except ValueError:
+            raise QuestionImportError(reader.line_num, f"correct_choice 는 선택지 번호여야 합니다 ({correct_choice!r})")
+        if not 0 <= correct_index < len(choice_texts) or not choice_texts[correct_index].strip():
+            raise QuestionImportError(reader.line_num, f"correct_choice 에 해당하는 선택지가 없습니다 ({correct_choice})")
+        choices = [
+            Choice(text=text, is_correct=index == correct_index)
+            for index, text in enumerate(choice_texts)
+            if text.strip()
+        ]
+        yield _validate(reader.line_num, question_text, choices)
+
+
+async def iter_question_chunks(file: UploadFile, import_format: str, chunk_size: int) -> AsyncIterator[list[Question]]:
+    """
+    업로드 파일을 chunk_size 문제씩 읽어 검증된 Question 목록으로 반환합니다.
+
+    업로드 파일은 일정 크기 이상이면 디스크에 저장되므로(SpooledTemporaryFile) 전체를 메모리에 올리지 않고,
+    파일 읽기와 파싱/검증은 이벤트 루프를 막지 않도록 스레드 풀에서 수행합니다.
+
+    Raises:
+        QuestionImportError: 형식이 잘못되었거나 검증 규칙에 맞지 않는 행 (행 번호 포함)
+    """
+    await file.seek(0)
+    lines = codecs.iterdecode(iter(file.file), "utf-8-sig")
+    questions = _parse_csv(lines) if import_format == "csv" else _parse_ndjson(lines)
+
+    while True:
+        try:
+            chunk = await run_in_threadpool(list, islice(questions, chunk_size))
+        except UnicodeDecodeError as e:
+            raise QuestionImportError(0, f"UTF-8 로 읽을 수 없습니다 ({e.reason})")
+        if not chunk:
+            return
+        yield chunk
@@ -0,0 +1,31 @@
+from decimal import Decimal
+from typing import Any
+import orjson
+from pydantic import BaseModel
+from models.read_models import ReadModel
+
+
+def _default(value: Any) -> Any:
+    # model_dump 가 변환하지 않고 그대로 남기는 값: 필드에 넣은 CRUD 조회 DTO(ReadModel) 와 orjson 이 모르는 Decimal
+    if isinstance(value, ReadModel):
+        result = {}
+        for name in type(value).__slots__:
+            field_value = getattr(value, name)
+            if field_value is not None:
+                result[name] = field_value
+        return result
+    if isinstance(value, Decimal):
+        # pydantic JSON 직렬화와 같이 문자열로 (정밀도 유지)
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps_without_none(model: BaseModel) -> bytes:
+    """
+    None 값을 뺀 응답 JSON bytes (datetime 등은 orjson 기본 형식)
+
+    pydantic model_dump(exclude_none=True) 로 변환하고 orjson 으로 직렬화합니다.
+    서비스가 필드에 그대로 넘긴 ReadModel 은 필드 타입과 달라 pydantic 이 경고 없이(warnings=False) 그대로 두고,
+    orjson 의 default 훅에서 None 슬롯을 뺀 dict 로 바꿉니다.
+    """
+    return orjson.dumps(model.model_dump(exclude_none=True, warnings=False), default=_default, option=orjson.OPT_NON_STR_KEYS)
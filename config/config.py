@@ -1,7 +1,7 @@
 import os
 import sys
 from config.config_loader import Configs
-from config.config_models import DataBaseConfig, WebServerConfig, JwtToken
+from config.config_models import AuthConfig, CacheConfig, DataBaseConfig, QuizConfig, WebServerConfig, JwtToken
 
 
 config_file = f"config.local.toml"
@@ -9,4 +9,7 @@ configs = Configs(config_file)
 
 web_server_config = configs.get(WebServerConfig)
 db_config = configs.get(DataBaseConfig)
-jwt_config = configs.get(JwtToken)
\ No newline at end of file
+jwt_config = configs.get(JwtToken)
+auth_config = configs.get(AuthConfig)
+quiz_config = configs.get(QuizConfig)
+cache_config = configs.get(CacheConfig)
\ No newline at end of file
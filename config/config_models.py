@@ -6,6 +6,9 @@ class WebServerConfig(ConfigModel):
     port: int = 0
     is_web_server: bool = False
     is_ssl: bool = False
+    workers: int = 1
+    # 응답 헤더에 요청별 DB 쿼리 수/시간(X-DB-Query-Count, X-DB-Time-Ms) 표시
+    debug: bool = False
 
 class JwtToken(ConfigModel):
     access_key: str = ""
@@ -13,6 +16,17 @@ class JwtToken(ConfigModel):
     access_expire_min: int = 0
     refresh_expire_day: int = 0
     check_duplicate: bool = True
+    # 검증된 액세스 토큰 캐시 크기 (워커별, 0: 사용 안 함)
+    token_cache_size: int = 10000
+
+class AuthConfig(ConfigModel):
+    # passlib 스킴 (pbkdf2_sha256 은 추가 패키지 불필요, bcrypt / argon2 는 해당 패키지 설치 필요)
+    password_scheme: str = "pbkdf2_sha256"
+    # 비밀번호 해시 계산 스레드 수 (워커별 동시 해시 계산 상한)
+    password_hash_workers: int = 4
+    # 사용자 조회 캐시 유지 시간 / 없는 사용자 캐시 유지 시간 (0: 사용 안 함)
+    user_cache_ttl_sec: int = 300
+    user_negative_ttl_sec: int = 30
 
 class DataBaseConfig(ConfigModel):
     db_host: str = ""
@@ -20,4 +34,57 @@ class DataBaseConfig(ConfigModel):
     db_name: str = ""
     db_username: str = ""
     db_password: str = ""
+
+    # 커넥션 풀 (워커 프로세스별)
+    pool_size: int = 10
+    max_overflow: int = 10
+    pool_timeout: int = 30
+    pool_pre_ping: bool = True
+    pool_recycle: int = 600
+    # 전체 워커 합산 커넥션 상한 (0: 제한 없음). 지정 시 워커 수로 나눠 워커별 풀 크기를 줄입니다.
+    max_connections: int = 0
+
+    # SQLAlchemy 컴파일 캐시 크기 (엔진별, 문장 종류 수보다 넉넉하게)
+    query_cache_size: int = 1200
+    # SQLAlchemy asyncpg 어댑터의 커넥션별 prepared statement 캐시 크기 (0: 매번 prepare)
+    prepared_statement_cache_size: int = 256
+    # asyncpg 자체 statement 캐시 크기, 서버 측 statement_timeout (0: 사용 안 함)
+    statement_cache_size: int = 100
+    statement_timeout_ms: int = 0
+    # 이 시간(ms) 이상 걸린 쿼리는 로그로 남깁니다. (0: 사용 안 함)
+    slow_query_ms: int = 500
+
+    # 읽기 전용 복제본 ("host:port", 계정/DB 이름은 primary 와 동일), 장애 복제본 재시도 간격
+    replica_hosts: list[str] = []
+    replica_retry_sec: int = 30
+
+class CacheConfig(ConfigModel):
+    # "local": 워커별 메모리 LRU, "redis": 워커/노드 간 공유 (RESP 호환 서버)
+    backend: str = "local"
+    key_prefix: str = "quiz:"
+    default_ttl_sec: int = 60
+    local_max_size: int = 10000
+    redis_host: str = "localhost"
+    redis_port: int = 6379
+    redis_db: int = 0
+    redis_password: str = ""
+    redis_pool_size: int = 10
+    redis_timeout_ms: int = 200
+    # 로그인 세션 상태(폐기 목록 / 리프레시 토큰) 저장소, 캐시와 달리 축출되면 안 되므로
+    # maxmemory-policy noeviction 인 Redis 를 지정 (비우면 redis_host / redis_port 사용)
+    session_redis_host: str = ""
+    session_redis_port: int = 0
+
+class QuizConfig(ConfigModel):
+    answer_key_cache_size: int = 256
+    question_id_cache_size: int = 64
+    answer_write_behind: bool = False
+    answer_flush_interval_ms: int = 500
+    answer_flush_max_pending: int = 5000
+    # 퀴즈 상세 조회 응답 캐시 유지 시간 (CacheConfig 백엔드 사용, 0: 사용 안 함)
+    detail_cache_ttl_sec: int = 30
+    # 결과 내보내기 시 서버 측 커서에서 한 번에 가져올 행 수
+    export_batch_size: int = 1000
+    # 문제 가져오기 시 한 번에 검증/COPY 할 문제 수
+    import_batch_size: int = 1000
     
\ No newline at end of file
@@ -0,0 +1,140 @@
+import asyncio
+from typing import Optional
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from commons.utils.singleton import Singleton
+from config.config import quiz_config
+from db.database import DB_SESSION_MNG, worker_count
+
+
+# 버퍼된 답안 일괄 반영 (완료된 세션에는 쓰지 않음)
+FLUSH_ANSWERS_SQL = text("""
+    UPDATE tbl_question_session AS qs
+    SET selected_choice_id = buffered.selected_choice_id
+    FROM unnest(
+        CAST(:ids AS INTEGER[]),
+        CAST(:selected_choice_ids AS INTEGER[])
+    ) AS buffered(id, selected_choice_id),
+    tbl_quiz_session AS s
+    WHERE qs.id = buffered.id
+      AND s.id = qs.session_id
+      AND s.is_completed = FALSE
+""")
+
+
+class AnswerBuffer(Singleton):
+    """
+    답안 저장 write-behind 버퍼 (워커 프로세스별)
+
+    검증된 답안을 메모리에 모아 두었다가 주기적으로 한 번의 UPDATE 로 tbl_question_session 에 반영합니다.
+    같은 문제에 대한 답안은 마지막 값만 남습니다.
+    제출(submit) 전에는 해당 세션을, 종료 시에는 전체를 강제로 반영합니다.
+
+    버퍼가 프로세스 메모리에 있어 제출을 받은 워커는 다른 워커에 쌓인 답안을 반영할 수 없고,
+    FLUSH_ANSWERS_SQL 은 완료된 세션에 쓰지 않으므로 그 답안은 유실됩니다.
+    따라서 워커가 여러 개면 설정과 무관하게 사용하지 않고 답안을 바로 저장합니다. (단일 워커 단일 노드 전용)
+    """
+
+    def __init__(self):
+        if not AnswerBuffer.is_init():
+            AnswerBuffer.set_init()
+            # session_id -> {question_id: (question_session_id, choice_id)}
+            self.__PENDING: dict[str, dict[int, tuple[int, int]]] = {}
+            self.__PENDING_COUNT = 0
+            # 이벤트 루프 생성 이후에 만들어야 하므로 지연 생성
+            self.__LOCK: Optional[asyncio.Lock] = None
+            self.__WAKE: Optional[asyncio.Event] = None
+            self.__TASK: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return quiz_config.answer_write_behind and worker_count() == 1
+
+    def put(self, session_id: str, question_id: int, question_session_id: int, choice_id: int) -> None:
+        answers = self.__PENDING.setdefault(session_id, {})
+        if question_id not in answers:
+            self.__PENDING_COUNT += 1
+        answers[question_id] = (question_session_id, choice_id)
+
+        if self.__WAKE is not None and self.__PENDING_COUNT >= quiz_config.answer_flush_max_pending:
+            self.__WAKE.set()
+
+    def pending_answers(self, session_id: str) -> dict[int, int]:
+        """아직 반영되지 않은 세션 답안 (question_id -> choice_id)"""
+        return {question_id: choice_id for question_id, (_, choice_id) in self.__PENDING.get(session_id, {}).items()}
+
+    async def flush(self, session_id: Optional[str] = None) -> None:
+        """버퍼된 답안을 반영합니다. session_id 를 지정하면 해당 세션만 반영합니다."""
+        if self.__LOCK is None:
+            self.__LOCK = asyncio.Lock()
+
+        # 다른 flush 가 반영 중인 답안도 완료될 때까지 기다려야 하므로 항상 잠금을 거칩니다.
+        async with self.__LOCK:
+            if session_id is None:
+                pending, self.__PENDING = self.__PENDING, {}
+            else:
+                answers = self.__PENDING.pop(session_id, None)
+                pending = {session_id: answers} if answers else {}
+
+            entries = [entry for answers in pending.values() for entry in answers.values()]
+            self.__PENDING_COUNT -= len(entries)
+            if not entries:
+                return
+
+            try:
+                await DB_SESSION_MNG.execute_lambda(lambda s: self._write(s, entries))
+            except Exception as e:
+                print("answer buffer flush error:", e)
+                self._restore(pending)
+                raise
+
+    async def start(self) -> None:
+        if quiz_config.answer_write_behind and not self.enabled:
+            print(f"[ANSWER_BUFFER] answer_write_behind ignored: {worker_count()} workers do not share the buffer")
+        if self.enabled and self.__TASK is None:
+            self.__WAKE = asyncio.Event()
+            self.__TASK = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self.__TASK is not None:
+            self.__TASK.cancel()
+            try:
+                await self.__TASK
+            except asyncio.CancelledError:
+                pass
+            self.__TASK = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        interval = quiz_config.answer_flush_interval_ms / 1000
+        while True:
+            try:
+                await asyncio.wait_for(self.__WAKE.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+            self.__WAKE.clear()
+
+            try:
+                await self.flush()
+            except Exception:
+                # 실패한 답안은 버퍼로 복구되어 다음 주기에 재시도
+                pass
+
+    async def _write(self, db: AsyncSession, entries: list[tuple[int, int]]) -> None:
+        await db.execute(FLUSH_ANSWERS_SQL, {
+            "ids": [question_session_id for question_session_id, _ in entries],
+            "selected_choice_ids": [choice_id for _, choice_id in entries]
+        })
+        await db.commit()
+
+    def _restore(self, pending: dict[str, dict[int, tuple[int, int]]]) -> None:
+        # 반영 중에 들어온 더 새로운 답안이 있으면 그 값을 유지
+        for session_id, answers in pending.items():
+            current = self.__PENDING.setdefault(session_id, {})
+            for question_id, entry in answers.items():
+                if question_id not in current:
+                    current[question_id] = entry
+                    self.__PENDING_COUNT += 1
+
+
+ANSWER_BUFFER = AnswerBuffer()
@@ -0,0 +1,98 @@
+from array import array
+from sqlalchemy.ext.asyncio import AsyncSession
+from commons.utils.lru_cache import LRUCache
+from commons.utils.singleton import Singleton
+from config.config import quiz_config
+from crud.statements import ANSWER_KEY_STMT, QUESTION_IDS_STMT
+
+
+class AnswerKey:
+    """퀴즈 한 개의 정답표 (문제 -> 정답 선택지, 선택지 -> 소속 문제 / 내용)"""
+    __slots__ = ("version", "correct_choice_ids", "choice_question_ids", "choice_texts")
+
+    def __init__(self, version: int):
+        self.version = version
+        self.correct_choice_ids: dict[int, int] = {}
+        self.choice_question_ids: dict[int, int] = {}
+        self.choice_texts: dict[int, str] = {}
+
+    def is_valid_choice(self, question_id: int, choice_id: int) -> bool:
+        return self.choice_question_ids.get(choice_id) == question_id
+
+
+class AnswerKeyCache(Singleton):
+    """
+    quiz_id -> AnswerKey 프로세스 내 LRU 캐시
+
+    tbl_quiz.version 이 다르면 다시 적재하므로 다른 워커에서 수정된 퀴즈도 다음 요청에서 반영됩니다.
+    같은 워커의 수정/삭제는 invalidate 로 즉시 제거합니다.
+    """
+
+    def __init__(self):
+        if not AnswerKeyCache.is_init():
+            AnswerKeyCache.set_init()
+            self.__CACHE = LRUCache(max_size=quiz_config.answer_key_cache_size)
+
+    async def get(self, db: AsyncSession, quiz_id: int, version: int) -> AnswerKey:
+        answer_key = self.__CACHE.get(quiz_id)
+        if answer_key is not None and answer_key.version == version:
+            return answer_key
+
+        answer_key = await self._load(db, quiz_id, version)
+        self.__CACHE.set(quiz_id, answer_key)
+        return answer_key
+
+    def invalidate(self, quiz_id: int) -> None:
+        self.__CACHE.pop(quiz_id)
+
+    async def _load(self, db: AsyncSession, quiz_id: int, version: int) -> AnswerKey:
+        result = await db.execute(ANSWER_KEY_STMT, {"quiz_id": quiz_id})
+
+        answer_key = AnswerKey(version)
+        for choice_id, question_id, is_correct, content in result.all():
+            answer_key.choice_question_ids[choice_id] = question_id
+            answer_key.choice_texts[choice_id] = content
+            if is_correct:
+                answer_key.correct_choice_ids[question_id] = choice_id
+        return answer_key
+
+
+class QuestionIds:
+    """퀴즈 한 개의 문제 ID 목록 (ID 순, random.sample 에 바로 넘길 수 있는 시퀀스)"""
+    __slots__ = ("version", "ids")
+
+    def __init__(self, version: int, ids: array):
+        self.version = version
+        self.ids = ids
+
+
+class QuestionIdCache(Singleton):
+    """
+    quiz_id -> QuestionIds 프로세스 내 LRU 캐시
+
+    문제 샘플링 때마다 문제 은행 전체 ID 를 array_agg 로 다시 읽지 않도록 퀴즈 버전별로 보관합니다.
+    ID 는 int 객체 목록 대신 array('q') 로 저장해 큰 문제 은행도 ID 당 8바이트만 씁니다.
+    버전 비교 / invalidate 는 AnswerKeyCache 와 같습니다.
+    """
+
+    def __init__(self):
+        if not QuestionIdCache.is_init():
+            QuestionIdCache.set_init()
+            self.__CACHE = LRUCache(max_size=quiz_config.question_id_cache_size)
+
+    async def get(self, db: AsyncSession, quiz_id: int, version: int) -> array:
+        question_ids = self.__CACHE.get(quiz_id)
+        if question_ids is not None and question_ids.version == version:
+            return question_ids.ids
+
+        result = await db.execute(QUESTION_IDS_STMT, {"quiz_id": quiz_id})
+        question_ids = QuestionIds(version, array("q", result.scalar() or []))
+        self.__CACHE.set(quiz_id, question_ids)
+        return question_ids.ids
+
+    def invalidate(self, quiz_id: int) -> None:
+        self.__CACHE.pop(quiz_id)
+
+
+ANSWER_KEY_CACHE = AnswerKeyCache()
+QUESTION_ID_CACHE = QuestionIdCache()
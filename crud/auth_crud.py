@@ -1,5 +1,6 @@
-from sqlalchemy import select
-from typing import Tuple
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
+from typing import Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends
 from commons.utils.enums import ErrorType
@@ -10,7 +11,7 @@ from abc import ABC, abstractmethod
 class IAuthCRUD(ABC):
 
     @abstractmethod
-    async def create_user(self, db: AsyncSession, username: str) -> Tuple[tbl_user, ErrorType]:
+    async def create_user(self, db: AsyncSession, username: str, password_hash: str, is_admin: bool) -> Tuple[Optional[tbl_user], ErrorType]:
         pass
 
     @abstractmethod
@@ -18,21 +19,38 @@ class IAuthCRUD(ABC):
         pass
 
     @abstractmethod
-    async def update_user(self, db: AsyncSession, username: str) -> ErrorType:
+    async def update_password(self, db: AsyncSession, user_id: int, password_hash: str) -> ErrorType:
         pass    
     
 
 class AuthCRUD(IAuthCRUD):
-    async def create_user(self, db: AsyncSession, user: tbl_user) -> ErrorType:
+    async def create_user(self, db: AsyncSession, username: str, password_hash: str, is_admin: bool) -> Tuple[Optional[tbl_user], ErrorType]:
+        """
+        사용자를 생성합니다.
+
+        INSERT ... ON CONFLICT DO NOTHING RETURNING 으로 중복 확인과 생성을 한 번에 처리합니다.
+        (동시에 같은 username 으로 가입해도 한 명만 성공)
+
+        Returns:
+            생성된 사용자 (id, username, is_admin, created_at), 오류 타입 (중복이면 USER_ALREADY_EXISTS)
+        """
         try:
-            db.add(user)
+            result = await db.execute(
+                insert(tbl_user)
+                .values(username=username, password=password_hash, is_admin=is_admin)
+                .on_conflict_do_nothing(index_elements=[tbl_user.username])
+                .returning(tbl_user.id, tbl_user.username, tbl_user.is_admin, tbl_user.created_at)
+            )
+            created_user = result.first()
             await db.commit()
-            await db.refresh(user)
-            return ErrorType.SUCCESS
+
+            if created_user is None:
+                return None, ErrorType.USER_ALREADY_EXISTS
+            return created_user, ErrorType.SUCCESS
         except Exception as e:
             print("db create user error :", e)
             await db.rollback()
-            return ErrorType.DB_RUN_FAILED
+            return None, ErrorType.DB_RUN_FAILED
 
     async def get_user(self, db: AsyncSession, username: str) -> Tuple[tbl_user, ErrorType]:
         try:
@@ -45,6 +63,18 @@ class AuthCRUD(IAuthCRUD):
             print("db get user error :", e)
             return None, ErrorType.DB_RUN_FAILED
 
-    async def update_user(self, username: str) -> ErrorType:
-        pass    
+    async def update_password(self, db: AsyncSession, user_id: int, password_hash: str) -> ErrorType:
+        try:
+            await db.execute(
+                update(tbl_user)
+                .where(tbl_user.id == user_id)
+                .values(password=password_hash)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+            return ErrorType.SUCCESS
+        except Exception as e:
+            print("db update password error :", e)
+            await db.rollback()
+            return ErrorType.DB_RUN_FAILED
 
@@ -1,18 +1,55 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Tuple, Dict
+from typing import AsyncIterator, Optional, Tuple, Dict
+import random
 import uuid
-from sqlalchemy import desc, func, or_, select, and_
+from sqlalchemy import desc, func, insert, select, and_, text, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from commons.utils.cursor import decode_cursor, encode_cursor, parse_cursor_datetime
 from commons.utils.enums import ErrorType
-from db.database import DB_SESSION_MNG
-from router.v1.quiz.protocol import Choice, Req_Quiz_Update, Req_QuizCreate, Req_QuizSaveAnswer, Req_QuizSubmit, Res_QuizCreate
+from commons.utils.question_import import QuestionImportError
+from crud.answer_buffer import ANSWER_BUFFER
+from crud.answer_key_cache import ANSWER_KEY_CACHE, QUESTION_ID_CACHE
+from crud.statements import ANSWER_TARGET_STMT, COMPLETE_SESSION_STMT, QUIZ_RESULTS_EXPORT_STMT, QUIZ_VERSION_STMT, SAVE_ANSWER_STMT, SESSION_DETAIL_STMT, SESSION_QUESTIONS_STMT, SUBMIT_SESSION_STMT
+from router.v1.quiz.protocol import Choice, Question, Req_Quiz_Update, Req_QuizCreate, Req_QuizSaveAnswer
+from models.principal import Principal
+from models.read_models import DetailChoice, DetailQuestion, QuizDetail, QuizSessionDetail, QuizSubmitResult, SessionChoice, SessionQuestion, SubmitQuestion
 from models.quiz import tbl_choice, tbl_choice_session, tbl_question_session, tbl_quiz, tbl_question, tbl_quiz_attempt, tbl_quiz_session, tbl_user
 
+# 다중 행 INSERT 한 번에 담을 최대 행 수 (PostgreSQL 바인드 파라미터 한도 32767 이내)
+BULK_INSERT_CHUNK_SIZE = 1000
+
+# 랜덤 출제 세션 시드 범위 (tbl_quiz_session.seed INTEGER 에 들어가는 값)
+SESSION_SEED_RANGE = 2 ** 31
+_SEED_RANDOM = random.SystemRandom()
+
+# 채점 결과 일괄 저장: 배열 3개를 unnest 해 한 번의 UPDATE ... FROM 으로 반영 (행 수와 무관하게 파라미터 3개)
+GRADE_QUESTION_SESSIONS_SQL = text("""
+    UPDATE tbl_question_session AS qs
+    SET selected_choice_id = graded.selected_choice_id,
+        is_correct = graded.is_correct
+    FROM unnest(
+        CAST(:ids AS INTEGER[]),
+        CAST(:selected_choice_ids AS INTEGER[]),
+        CAST(:is_corrects AS BOOLEAN[])
+    ) AS graded(id, selected_choice_id, is_correct)
+    WHERE qs.id = graded.id
+""")
+
+# 문제 가져오기: 묶음 크기만큼 문제 ID 를 시퀀스에서 미리 받아 선택지 행을 만든 뒤 COPY 로 적재
+ALLOCATE_QUESTION_IDS_SQL = text("""
+    SELECT nextval(pg_get_serial_sequence('tbl_question', 'id'))
+    FROM generate_series(1, :count)
+""")
+
+
+def _chunked(items: list, size: int):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
 class IQuizCRUD(ABC):
     @abstractmethod
-    async def create_quiz(self, db: AsyncSession, quiz_data: Req_QuizCreate, user_id: int) -> Tuple[tbl_quiz, ErrorType]:
+    async def create_quiz(self, db: AsyncSession, quiz_data: Req_QuizCreate, user_id: int) -> Tuple[dict, ErrorType]:
         pass
 
     @abstractmethod
@@ -32,19 +69,23 @@ class IQuizCRUD(ABC):
         pass    
     
     @abstractmethod
-    async def get_quiz_list(self, db: AsyncSession, page: int, page_size: int, user: tbl_user) -> Tuple[dict, ErrorType]:
+    async def get_quiz_list(self, db: AsyncSession, page: int, page_size: int, user: Principal, cursor: Optional[str] = None) -> Tuple[dict, ErrorType]:
+        pass
+
+    @abstractmethod
+    async def get_quiz_version(self, db: AsyncSession, quiz_id: int) -> Tuple[int, ErrorType]:
         pass
 
     @abstractmethod
-    async def get_quiz_detail(self, db: AsyncSession, quiz_id: int, page: int, user: tbl_user) -> Tuple[dict, ErrorType]:
+    async def get_quiz_detail(self, db: AsyncSession, quiz_id: int, page: int, user: Principal, cursor: Optional[str] = None) -> Tuple[QuizDetail, ErrorType]:
         pass
 
     @abstractmethod
-    async def start_quiz_session(self, db: AsyncSession, quiz_id: int, user_id: int) -> Tuple[dict, ErrorType]:
+    async def start_quiz_session(self, db: AsyncSession, quiz_id: int, user_id: int, seed: Optional[int] = None) -> Tuple[QuizSessionDetail, ErrorType]:
         pass
 
     @abstractmethod
-    async def get_quiz_session(self, db: AsyncSession, session_id: str, user_id: int) -> Tuple[dict, ErrorType]:
+    async def get_quiz_session(self, db: AsyncSession, session_id: str, user_id: int) -> Tuple[QuizSessionDetail, ErrorType]:
         pass
 
     @abstractmethod
@@ -52,56 +93,103 @@ class IQuizCRUD(ABC):
         pass
 
     @abstractmethod
-    async def submit_quiz(self, db: AsyncSession, session_id: str, answers: Dict[int, int], user_id: int) -> Tuple[dict, ErrorType]:
+    async def submit_quiz(self, db: AsyncSession, session_id: str, answers: Dict[int, int], user_id: int) -> Tuple[QuizSubmitResult, ErrorType]:
+        pass
+
+    @abstractmethod
+    def stream_quiz_results(self, db: AsyncSession, quiz_id: int, batch_size: int) -> AsyncIterator[list]:
+        pass
+
+    @abstractmethod
+    async def import_questions(self, db: AsyncSession, quiz_id: int, question_chunks: AsyncIterator[list[Question]]) -> Tuple[dict, ErrorType]:
         pass
 
 
 
 class QuizCRUD(IQuizCRUD):
-    async def create_quiz(self, db: AsyncSession, req: Req_QuizCreate, user_id: int) -> Tuple[tbl_quiz, ErrorType]:
+    async def create_quiz(self, db: AsyncSession, req: Req_QuizCreate, user_id: int) -> Tuple[dict, ErrorType]:
+        """
+        퀴즈를 생성합니다.
+
+        문제/선택지를 한 건씩 flush 하지 않고 다중 행 INSERT ... RETURNING 으로 일괄 삽입하며,
+        응답 데이터는 반환된 ID로 구성합니다. (재조회 없음)
+
+        Args:
+            db: 데이터베이스 세션
+            req: 퀴즈 생성 요청
+            user_id: 생성자 ID
+
+        Returns:
+            생성된 퀴즈 데이터, 오류 타입
+        """
         try:
-            quiz = tbl_quiz(
-                title=req.title,
-                description=req.description,
-                user_id=user_id,
-                selected_questions=req.selected_questions,
-                is_randomized_questions=req.is_randomized_questions,
-                is_randomized_choices=req.is_randomized_choices
+            # 퀴즈 생성
+            quiz_result = await db.execute(
+                insert(tbl_quiz).values(
+                    title=req.title,
+                    description=req.description,
+                    user_id=user_id,
+                    selected_questions=req.selected_questions,
+                    is_randomized_questions=req.is_randomized_questions,
+                    is_randomized_choices=req.is_randomized_choices
+                ).returning(tbl_quiz.id)
             )
-            db.add(quiz)
-            await db.flush()
-
-            if req.questions:
-                for question_data in req.questions:
-                    question = tbl_question(
-                        quiz_id=quiz.id,
-                        question_text=question_data.question_text,
-                    )
-                    db.add(question)
-                    await db.flush()
-
-                    for choice_data in question_data.choices:
-                        choice = tbl_choice(
-                            question_id=question.id,
-                            content=choice_data.text,
-                            is_correct=choice_data.is_correct
-                        )
-                        db.add(choice)
-                        await db.flush()
-            
-            await db.commit()
-            
-            result = await db.execute(
-                select(tbl_quiz)
-                .options(
-                    selectinload(tbl_quiz.questions)
-                    .selectinload(tbl_question.choices)
+            quiz_id = quiz_result.scalar_one()
+
+            questions = req.questions or []
+
+            # 문제 일괄 생성 (RETURNING 순서는 보장되지 않으므로 sort_by_parameter_order 로 입력 순서에 맞춤)
+            question_ids = []
+            for chunk in _chunked(questions, BULK_INSERT_CHUNK_SIZE):
+                question_result = await db.execute(
+                    insert(tbl_question).returning(tbl_question.id, sort_by_parameter_order=True),
+                    [
+                        {"quiz_id": quiz_id, "question_text": question_data.question_text}
+                        for question_data in chunk
+                    ]
                 )
-                .where(tbl_quiz.id == quiz.id)
-            )
-            loaded_quiz = result.scalars().first()
-            
-            return loaded_quiz, ErrorType.SUCCESS
+                question_ids.extend(question_result.scalars().all())
+
+            # 선택지 일괄 생성
+            choice_rows = [
+                {"question_id": question_id, "content": choice_data.text, "is_correct": choice_data.is_correct}
+                for question_id, question_data in zip(question_ids, questions)
+                for choice_data in question_data.choices
+            ]
+            choice_ids = []
+            for chunk in _chunked(choice_rows, BULK_INSERT_CHUNK_SIZE):
+                choice_result = await db.execute(
+                    insert(tbl_choice).returning(tbl_choice.id, sort_by_parameter_order=True),
+                    chunk
+                )
+                choice_ids.extend(choice_result.scalars().all())
+
+            await db.commit()
+
+            # 반환된 ID로 응답 데이터 구성
+            choice_id_iter = iter(choice_ids)
+            questions_data = []
+            for question_id, question_data in zip(question_ids, questions):
+                questions_data.append({
+                    "id": question_id,
+                    "question_text": question_data.question_text,
+                    "choices": [
+                        {"id": next(choice_id_iter), "text": choice_data.text, "is_correct": choice_data.is_correct}
+                        for choice_data in question_data.choices
+                    ]
+                })
+
+            response_data = {
+                "quiz_id": quiz_id,
+                "title": req.title,
+                "description": req.description,
+                "selected_questions": req.selected_questions,
+                "is_randomized_questions": req.is_randomized_questions,
+                "is_randomized_choices": req.is_randomized_choices,
+                "questions": questions_data
+            }
+
+            return response_data, ErrorType.SUCCESS
         except Exception as e:
             print("db create quiz error :", e)
             await db.rollback()
@@ -176,11 +264,23 @@ class QuizCRUD(IQuizCRUD):
                     if q_id not in update_question_ids:
                         await db.delete(question)  # cascade 옵션으로 연결된 선택지도 삭제
             
-            # 4. 변경사항 저장
+            # 4. 버전 증가 (정답표 캐시 무효화 기준)
+            await db.execute(
+                update(tbl_quiz)
+                .where(tbl_quiz.id == origin_quiz.id)
+                .values(title=origin_quiz.title, description=origin_quiz.description, version=tbl_quiz.version + 1)
+                .execution_options(synchronize_session=False)
+            )
+
+            # 5. 변경사항 저장
             await db.commit()
+            ANSWER_KEY_CACHE.invalidate(origin_quiz.id)
+            QUESTION_ID_CACHE.invalidate(origin_quiz.id)
             return ErrorType.SUCCESS
         except Exception as e:
             print("db update quiz error :", e)
+            await db.rollback()
+            return ErrorType.DB_RUN_FAILED
 
     async def _update_choices(self, db: AsyncSession, question_id: int, choices_data: list[Choice]) -> None:
             """
@@ -237,6 +337,8 @@ class QuizCRUD(IQuizCRUD):
             # 퀴즈 삭제
             await db.delete(quiz)
             await db.commit()
+            ANSWER_KEY_CACHE.invalidate(quiz_id)
+            QUESTION_ID_CACHE.invalidate(quiz_id)
             
             return ErrorType.SUCCESS
             
@@ -245,116 +347,190 @@ class QuizCRUD(IQuizCRUD):
             await db.rollback()
             return ErrorType.DB_RUN_FAILED
 
-    async def get_quiz_list(self, db: AsyncSession, page: int, page_size: int, user: tbl_user) -> Tuple[dict, ErrorType]:
+    async def get_quiz_list(self, db: AsyncSession, page: int, page_size: int, user: Principal, cursor: Optional[str] = None) -> Tuple[dict, ErrorType]:
         """
         퀴즈 목록을 조회합니다.
+
+        cursor 가 주어지면 OFFSET 대신 (created_at, id) 키셋 조건으로 다음 페이지를 조회합니다.
         
         Args:
             db: 데이터베이스 세션
             page: 페이지 번호
             page_size: 페이지당 항목 수
             user: 사용자 정보
+            cursor: 이전 응답의 next_cursor (선택)
             
         Returns:
             퀴즈 목록 데이터, 오류 타입
         """
         try:
-            # 기본 쿼리 구성 (퀴즈 생성자 정보 포함)
-            query = select(tbl_quiz, tbl_user.username.label("created_by")) \
-                .join(tbl_user, tbl_quiz.user_id == tbl_user.id)
-            
-            # 최신순 정렬
-            query = query.order_by(desc(tbl_quiz.created_at))
-            
-            # 총 개수 조회
-            count_query = select(func.count()).select_from(query.subquery())
-            total_quizzes = await db.scalar(count_query) or 0
-            
-            # 페이징 적용
-            query = query.offset((page - 1) * page_size).limit(page_size)
-            
-            # 퀴즈 목록 조회
+            # 1. 페이지 대상 퀴즈 ID + 전체 개수 (window 함수로 한 번에 조회)
+            if cursor:
+                # 키셋 모드: window 는 남은 행만 세므로 전체 개수는 스칼라 서브쿼리로 조회
+                values = decode_cursor(cursor) or {}
+                cursor_created_at = parse_cursor_datetime(values.get("created_at"))
+                cursor_id = values.get("id")
+                if cursor_created_at is None or not isinstance(cursor_id, int):
+                    return {}, ErrorType.INVALID_CURSOR
+
+                page_query = select(
+                    tbl_quiz.id.label("quiz_id"),
+                    select(func.count()).select_from(tbl_quiz).scalar_subquery().label("total_quizzes")
+                ).where(
+                    tuple_(tbl_quiz.created_at, tbl_quiz.id) < tuple_(cursor_created_at, cursor_id)
+                ).order_by(
+                    desc(tbl_quiz.created_at), desc(tbl_quiz.id)
+                ).limit(page_size).subquery()
+            else:
+                page_query = select(
+                    tbl_quiz.id.label("quiz_id"),
+                    func.count().over().label("total_quizzes")
+                ).order_by(
+                    desc(tbl_quiz.created_at), desc(tbl_quiz.id)
+                ).offset((page - 1) * page_size).limit(page_size).subquery()
+
+            # 2. 페이지 행에 대해서만 문제 수 / 응시 상태를 상관 서브쿼리로 계산
+            question_count = select(func.count()) \
+                .where(tbl_question.quiz_id == tbl_quiz.id) \
+                .correlate(tbl_quiz) \
+                .scalar_subquery()
+
+            columns = [
+                tbl_quiz,
+                tbl_user.username.label("created_by"),
+                page_query.c.total_quizzes,
+                question_count.label("total_questions")
+            ]
+
+            if not user.is_admin:
+                # 응시 기록 없음: NULL, 진행 중: False, 완료: True
+                attempt_completed = select(func.bool_or(func.coalesce(tbl_quiz_attempt.completed, False))) \
+                    .where(
+                        tbl_quiz_attempt.quiz_id == tbl_quiz.id,
+                        tbl_quiz_attempt.user_id == user.id
+                    ) \
+                    .correlate(tbl_quiz) \
+                    .scalar_subquery()
+                columns.append(attempt_completed.label("attempt_completed"))
+
+            query = select(*columns) \
+                .join(page_query, page_query.c.quiz_id == tbl_quiz.id) \
+                .join(tbl_user, tbl_quiz.user_id == tbl_user.id) \
+                .order_by(desc(tbl_quiz.created_at), desc(tbl_quiz.id))
+
             result = await db.execute(query)
-            quizzes_with_creator = result.all()
-            
+            quiz_rows = result.all()
+
+            if quiz_rows:
+                total_quizzes = quiz_rows[0].total_quizzes
+            else:
+                # 범위를 벗어난 페이지는 window 결과가 없으므로 개수만 별도 조회
+                total_quizzes = await db.scalar(select(func.count()).select_from(tbl_quiz)) or 0
+
             # 응답 데이터 구성
             quizzes_data = []
-            for quiz_row in quizzes_with_creator:
+            for quiz_row in quiz_rows:
                 quiz = quiz_row[0]  # tbl_quiz 객체
-                created_by = quiz_row[1]  # username
-                
-                # 문제 수 조회
-                question_count_query = select(func.count()).where(tbl_question.quiz_id == quiz.id)
-                total_questions = await db.scalar(question_count_query) or 0
-                
+
                 # 기본 퀴즈 정보
                 quiz_data = {
                     "quiz_id": quiz.id,
                     "title": quiz.title,
                     "description": quiz.description,
-                    "total_questions": total_questions,
+                    "total_questions": quiz_row.total_questions or 0,
                     "selected_questions": quiz.selected_questions,
                     "is_randomized_questions": quiz.is_randomized_questions,
                     "is_randomized_choices": quiz.is_randomized_choices,
                     "created_at": quiz.created_at,
                     "updated_at": quiz.updated_at
                 }
-                
+
                 # 관리자에게만 표시할 정보
                 if user.is_admin:
-                    quiz_data["created_by"] = created_by
-                
+                    quiz_data["created_by"] = quiz_row.created_by
+
                 # 사용자에게만 표시할 정보
                 if not user.is_admin:
-                    # 응시 기록 조회
-                    attempt_query = select(tbl_quiz_attempt).where(
-                        tbl_quiz_attempt.quiz_id == quiz.id,
-                        tbl_quiz_attempt.user_id == user.id
-                    )
-                    attempt_result = await db.execute(attempt_query)
-                    attempt = attempt_result.scalars().first()
-                    
-                    if attempt:
-                        if attempt.completed:
-                            quiz_data["status"] = "completed"
-                        else:
-                            quiz_data["status"] = "in_progress"
-                    else:
+                    if quiz_row.attempt_completed is None:
                         quiz_data["status"] = "not_attempted"
-                
+                    elif quiz_row.attempt_completed:
+                        quiz_data["status"] = "completed"
+                    else:
+                        quiz_data["status"] = "in_progress"
+
                 quizzes_data.append(quiz_data)
-            
+
             # 페이징 정보 포함한 응답 데이터
             response_data = {
                 "total_quizzes": total_quizzes,
                 "page": page,
                 "page_size": page_size,
                 "total_pages": (total_quizzes + page_size - 1) // page_size,
-                "quizzes": quizzes_data
+                "quizzes": quizzes_data,
+                "next_cursor": None
             }
-            
+
+            # 다음 페이지 커서 (마지막 행 기준)
+            if len(quiz_rows) == page_size:
+                last_quiz = quiz_rows[-1][0]
+                response_data["next_cursor"] = encode_cursor({"created_at": last_quiz.created_at, "id": last_quiz.id})
+
             return response_data, ErrorType.SUCCESS
-            
+
         except Exception as e:
             print("db get quiz list error:", e)
-            return {}, ErrorType.DATABASE_ERROR
+            return {}, ErrorType.DB_RUN_FAILED
             
-    async def get_quiz_detail(self, db: AsyncSession, quiz_id: int, page: int, user: tbl_user) -> Tuple[dict, ErrorType]:
+    async def get_quiz_version(self, db: AsyncSession, quiz_id: int) -> Tuple[int, ErrorType]:
+        """
+        퀴즈 버전을 조회합니다. (수정 / 문제 가져오기마다 증가)
+
+        Args:
+            db: 데이터베이스 세션
+            quiz_id: 퀴즈 ID
+
+        Returns:
+            퀴즈 버전, 오류 타입
+        """
+        try:
+            version = (await db.execute(QUIZ_VERSION_STMT, {"quiz_id": quiz_id})).scalar()
+            if version is None:
+                return None, ErrorType.QUIZ_NOT_FOUND
+            return version, ErrorType.SUCCESS
+        except Exception as e:
+            print("db get quiz version error:", e)
+            return None, ErrorType.DB_RUN_FAILED
+
+    async def get_quiz_detail(self, db: AsyncSession, quiz_id: int, page: int, user: Principal, cursor: Optional[str] = None) -> Tuple[QuizDetail, ErrorType]:
         """
         퀴즈 상세 정보를 조회합니다.
+
+        cursor 가 주어지면 OFFSET 대신 문제 ID 키셋 조건으로 다음 문제 페이지를 조회합니다.
         
         Args:
             db: 데이터베이스 세션
             quiz_id: 퀴즈 ID
             page: 페이지 번호
             user: 사용자 정보
+            cursor: 이전 응답의 next_cursor (선택)
             
         Returns:
             퀴즈 상세 정보, 오류 타입
         """
         try:
-            # 퀴즈 기본 정보 조회
-            quiz_query = select(tbl_quiz, tbl_user.username.label("created_by")) \
+            last_question_id = None
+            if cursor:
+                values = decode_cursor(cursor) or {}
+                last_question_id = values.get("id")
+                if values.get("quiz_id") != quiz_id or not isinstance(last_question_id, int):
+                    return None, ErrorType.INVALID_CURSOR
+
+            # 퀴즈 기본 정보 + 총 문제 수 조회
+            question_count = select(func.count()) \
+                .where(tbl_question.quiz_id == tbl_quiz.id) \
+                .correlate(tbl_quiz) \
+                .scalar_subquery()
+            quiz_query = select(tbl_quiz, tbl_user.username.label("created_by"), question_count.label("total_questions")) \
                 .join(tbl_user, tbl_quiz.user_id == tbl_user.id) \
                 .where(tbl_quiz.id == quiz_id)
             
@@ -366,10 +542,7 @@ class QuizCRUD(IQuizCRUD):
             
             quiz = quiz_row[0]  # tbl_quiz 객체
             created_by = quiz_row[1]  # username
-            
-            # 총 문제 수 조회
-            question_count_query = select(func.count()).where(tbl_question.quiz_id == quiz_id)
-            total_questions = await db.scalar(question_count_query) or 0
+            total_questions = quiz_row[2] or 0
             
             # 페이지당 문제 수 계산 (관리자 설정 또는 기본값)
             questions_per_page = min(quiz.selected_questions, 10)  # 기본값: 10개, 최대: selected_questions
@@ -388,173 +561,246 @@ class QuizCRUD(IQuizCRUD):
                 question_query = question_query.order_by(func.random())
             
             # 페이징 적용
-            question_query = question_query.offset((page - 1) * questions_per_page).limit(questions_per_page)
+            if last_question_id is not None:
+                question_query = question_query.where(tbl_question.id > last_question_id)
+            else:
+                question_query = question_query.offset((page - 1) * questions_per_page)
+            question_query = question_query.limit(questions_per_page)
             
             # 문제 목록 조회
             question_result = await db.execute(question_query)
             questions = question_result.scalars().all()
             
-            # 문제 및 선택지 데이터 구성
-            questions_data = []
-            for question in questions:
-                # 선택지 조회
-                choice_query = select(tbl_choice).where(tbl_choice.question_id == question.id)
+            # 페이지 내 모든 문제의 선택지를 한 번에 조회 (IN)
+            choices_by_question = {question.id: [] for question in questions}
+            if choices_by_question:
+                choice_query = select(tbl_choice.id, tbl_choice.question_id, tbl_choice.content, tbl_choice.is_correct) \
+                    .where(tbl_choice.question_id.in_(list(choices_by_question))) \
+                    .order_by(tbl_choice.question_id, tbl_choice.id)
                 choice_result = await db.execute(choice_query)
-                choices = choice_result.scalars().all()
-                
-                # 선택지 데이터 구성
-                choices_data = []
-                for choice in choices:
-                    choice_data = {
-                        "id": choice.id,
-                        "text": choice.content,
-                        "is_correct": choice.is_correct
-                    }
-                    choices_data.append(choice_data)
-                
-                # 문제 데이터 구성
-                question_data = {
-                    "id": question.id,
-                    "question_text": question.question_text,
-                    "choices": choices_data
-                }
-                questions_data.append(question_data)
+                for choice_id, question_id, content, is_correct in choice_result.all():
+                    choices_by_question[question_id].append(DetailChoice(choice_id, content, is_correct))
+            
+            # 문제 및 선택지 데이터 구성
+            questions_data = [
+                DetailQuestion(question.id, question.question_text, choices_by_question[question.id])
+                for question in questions
+            ]
+
+            # 다음 페이지 커서 (마지막 문제 ID 기준)
+            next_cursor = None
+            if len(questions) == questions_per_page:
+                next_cursor = encode_cursor({"quiz_id": quiz_id, "id": questions[-1].id})
             
             # 응답 데이터 구성
-            response_data = {
-                "quiz_id": quiz.id,
-                "title": quiz.title,
-                "description": quiz.description,
-                "is_randomized_questions": quiz.is_randomized_questions,
-                "is_randomized_choices": quiz.is_randomized_choices,
-                "selected_questions": quiz.selected_questions,
-                "total_questions": total_questions,
-                "created_at": quiz.created_at,
-                "updated_at": quiz.updated_at,
-                "created_by": created_by,
+            response_data = QuizDetail(
+                quiz_id=quiz.id,
+                title=quiz.title,
+                description=quiz.description,
+                is_randomized_questions=quiz.is_randomized_questions,
+                is_randomized_choices=quiz.is_randomized_choices,
+                selected_questions=quiz.selected_questions,
+                total_questions=total_questions,
+                created_at=quiz.created_at,
+                updated_at=quiz.updated_at,
+                created_by=created_by,
+                version=quiz.version,
                 
                 # 페이징 정보
-                "current_page": page,
-                "total_pages": total_pages,
-                "questions_per_page": questions_per_page,
+                current_page=page,
+                total_pages=total_pages,
+                questions_per_page=questions_per_page,
+                next_cursor=next_cursor,
                 
                 # 문제 목록
-                "questions": questions_data
-            }
+                questions=questions_data
+            )
             
             return response_data, ErrorType.SUCCESS
             
         except Exception as e:
             print("db get quiz detail error:", e)
-            return None, ErrorType.DATABASE_ERROR
+            return None, ErrorType.DB_RUN_FAILED
             
-    async def start_quiz_session(self, db: AsyncSession, quiz_id: int, user_id: int) -> Tuple[dict, ErrorType]:
+    async def start_quiz_session(self, db: AsyncSession, quiz_id: int, user_id: int, seed: Optional[int] = None) -> Tuple[QuizSessionDetail, ErrorType]:
         """
         퀴즈 응시 세션을 시작합니다.
+
+        선택된 문제의 선택지를 한 번에 조회하고, 문제/선택지 세션을 다중 행 INSERT 로 생성한 뒤
+        응답은 재조회 없이 메모리의 데이터로 구성합니다.
         
         Args:
             db: 데이터베이스 세션
             quiz_id: 퀴즈 ID
             user_id: 사용자 ID
+            seed: 문제/선택지 랜덤 시드 (관리자 지정용, 없으면 랜덤 출제 세션마다 새로 생성해 세션에 저장)
             
         Returns:
             세션 정보, 오류 타입
         """
         try:
-            # 퀴즈 정보 조회
-            quiz_query = select(tbl_quiz).where(tbl_quiz.id == quiz_id)
+            # 퀴즈 정보 + 진행 중인 세션 ID 조회
+            existing_session_id = select(tbl_quiz_session.id).where(
+                tbl_quiz_session.quiz_id == tbl_quiz.id,
+                tbl_quiz_session.user_id == user_id,
+                tbl_quiz_session.is_completed == False
+            ).correlate(tbl_quiz).limit(1).scalar_subquery()
+            question_count = select(func.count()) \
+                .where(tbl_question.quiz_id == tbl_quiz.id) \
+                .correlate(tbl_quiz) \
+                .scalar_subquery()
+            quiz_query = select(tbl_quiz, existing_session_id.label("existing_session_id"), question_count.label("total_questions")) \
+                .where(tbl_quiz.id == quiz_id)
             quiz_result = await db.execute(quiz_query)
-            quiz = quiz_result.scalars().first()
+            quiz_row = quiz_result.first()
             
-            if not quiz:
+            if not quiz_row:
                 return None, ErrorType.QUIZ_NOT_FOUND
+
+            quiz = quiz_row[0]  # tbl_quiz 객체
             
-            # 이미 진행 중인 세션이 있는지 확인
-            existing_session_query = select(tbl_quiz_session).where(
-                tbl_quiz_session.quiz_id == quiz_id,
-                tbl_quiz_session.user_id == user_id,
-                tbl_quiz_session.is_completed == False
-            )
-            existing_session_result = await db.execute(existing_session_query)
-            existing_session = existing_session_result.scalars().first()
-            
-            if existing_session:
+            if quiz_row[1]:
                 # 기존 세션 정보 반환
-                return await self.get_quiz_session(db, existing_session.id, user_id)
+                return await self.get_quiz_session(db, quiz_row[1], user_id)
             
-            # 문제 목록 조회
-            question_query = select(tbl_question).where(tbl_question.quiz_id == quiz_id)
-            question_result = await db.execute(question_query)
-            all_questions = question_result.scalars().all()
-            
-            if not all_questions:
+            total_questions = quiz_row[2] or 0
+            if not total_questions:
                 return None, ErrorType.QUESTIONS_NOT_FOUND
-            
-            # 랜덤 문제 선택 (설정된 경우)
-            import random
-            questions = all_questions.copy()
-            if quiz.is_randomized_questions:
-                random.shuffle(questions)
-            
-            # 출제할 문제 수 제한
-            if quiz.selected_questions < len(questions):
-                questions = questions[:quiz.selected_questions]
+
+            # 랜덤 출제 세션은 항상 시드를 정해 저장 (같은 시드와 퀴즈 버전이면 같은 출제 결과 재현)
+            if quiz.is_randomized_questions or quiz.is_randomized_choices:
+                if seed is None:
+                    seed = _SEED_RANDOM.randrange(SESSION_SEED_RANGE)
+            else:
+                seed = None
+            rng = random.Random(seed)
+
+            # 출제할 문제 샘플링 (문제 은행 전체를 불러오지 않음)
+            questions = await self._sample_questions(db, quiz, total_questions, rng)
+
+            # 선택된 문제의 선택지를 한 번에 조회
+            choices_by_question = {question_id: [] for question_id, _ in questions}
+            choice_query = select(tbl_choice.id, tbl_choice.question_id, tbl_choice.content) \
+                .where(tbl_choice.question_id.in_(list(choices_by_question))) \
+                .order_by(tbl_choice.question_id, tbl_choice.id)
+            choice_result = await db.execute(choice_query)
+            for choice_id, question_id, content in choice_result.all():
+                choices_by_question[question_id].append((choice_id, content))
+
+            # 선택지 순서 랜덤화 (설정된 경우)
+            if quiz.is_randomized_choices:
+                for choices in choices_by_question.values():
+                    rng.shuffle(choices)
             
             # 세션 생성
             session_id = str(uuid.uuid4())
-            new_session = tbl_quiz_session(
-                id=session_id,
-                quiz_id=quiz_id,
-                user_id=user_id,
-                started_at=datetime.now(),
-                is_completed=False
+            started_at = datetime.now()
+            await db.execute(
+                insert(tbl_quiz_session).values(
+                    id=session_id,
+                    quiz_id=quiz_id,
+                    user_id=user_id,
+                    started_at=started_at,
+                    is_completed=False,
+                    seed=seed
+                )
             )
-            db.add(new_session)
-            await db.flush()
-            
-            # 문제 세션 생성
-            question_sessions = []
-            for i, question in enumerate(questions):
-                question_session = tbl_question_session(
-                    session_id=session_id,
-                    question_id=question.id,
-                    question_order=i
+            
+            # 문제 세션 일괄 생성 (RETURNING 순서는 보장되지 않으므로 sort_by_parameter_order 로 입력 순서에 맞춤)
+            question_session_ids = []
+            for offset, chunk in enumerate(_chunked(questions, BULK_INSERT_CHUNK_SIZE)):
+                question_session_result = await db.execute(
+                    insert(tbl_question_session).returning(tbl_question_session.id, sort_by_parameter_order=True),
+                    [
+                        {
+                            "session_id": session_id,
+                            "question_id": question_id,
+                            "question_order": offset * BULK_INSERT_CHUNK_SIZE + i
+                        }
+                        for i, (question_id, _) in enumerate(chunk)
+                    ]
                 )
-                db.add(question_session)
-                await db.flush()
-                question_sessions.append(question_session)
-                
-                # 선택지 조회
-                choice_query = select(tbl_choice).where(tbl_choice.question_id == question.id)
-                choice_result = await db.execute(choice_query)
-                choices = choice_result.scalars().all()
-                
-                # 선택지 순서 랜덤화 (설정된 경우)
-                if quiz.is_randomized_choices:
-                    random.shuffle(choices)
-                
-                # 선택지 세션 생성
-                for j, choice in enumerate(choices):
-                    choice_session = tbl_choice_session(
-                        question_session_id=question_session.id,
-                        choice_id=choice.id,
-                        choice_order=j
-                    )
-                    db.add(choice_session)
+                question_session_ids.extend(question_session_result.scalars().all())
+            
+            # 선택지 세션 일괄 생성
+            choice_session_rows = [
+                {"question_session_id": question_session_id, "choice_id": choice_id, "choice_order": j}
+                for question_session_id, (question_id, _) in zip(question_session_ids, questions)
+                for j, (choice_id, _) in enumerate(choices_by_question[question_id])
+            ]
+            for chunk in _chunked(choice_session_rows, BULK_INSERT_CHUNK_SIZE):
+                await db.execute(insert(tbl_choice_session).values(chunk))
             
             await db.commit()
             
-            # 생성된 세션 정보 반환
-            return await self.get_quiz_session(db, session_id, user_id)
+            # 생성된 세션 정보 반환 (메모리 데이터로 구성, 진행 중인 세션 조회와 같은 형태)
+            questions_data = [
+                SessionQuestion(
+                    question_id,
+                    question_text,
+                    [SessionChoice(choice_id, content) for choice_id, content in choices_by_question[question_id]],
+                    None
+                )
+                for question_id, question_text in questions
+            ]
+
+            response_data = QuizSessionDetail(
+                quiz_id=quiz.id,
+                session_id=session_id,
+                title=quiz.title,
+                description=quiz.description,
+                questions=questions_data,
+                started_at=started_at,
+                is_completed=False,
+                completed_at=None,
+                score=None
+            )
+
+            return response_data, ErrorType.SUCCESS
             
         except Exception as e:
             print("db start quiz session error:", e)
             await db.rollback()
             return None, ErrorType.DB_RUN_FAILED
     
-    async def get_quiz_session(self, db: AsyncSession, session_id: str, user_id: int) -> Tuple[dict, ErrorType]:
+    async def _sample_questions(self, db: AsyncSession, quiz: tbl_quiz, total_questions: int, rng: random.Random) -> list:
+        """
+        출제할 문제 (ID, 내용) 목록을 샘플링합니다.
+
+        - 랜덤 출제가 아니면 ID 순으로 앞에서부터 LIMIT
+        - 랜덤 출제는 퀴즈 버전별로 캐시된 ID 배열에서 rng.sample 후 선택된 문제만 조회
+          (DB 의 random() 을 쓰지 않으므로 세션 시드로 출제 결과를 재현할 수 있음)
+
+        Args:
+            db: 데이터베이스 세션
+            quiz: 퀴즈 정보
+            total_questions: 문제 은행 크기
+            rng: 세션 시드로 만든 난수 생성기
+
+        Returns:
+            (문제 ID, 문제 내용) 목록 (출제 순서)
+        """
+        sample_size = min(quiz.selected_questions, total_questions)
+        question_query = select(tbl_question.id, tbl_question.question_text) \
+            .where(tbl_question.quiz_id == quiz.id)
+
+        if not quiz.is_randomized_questions:
+            question_result = await db.execute(question_query.order_by(tbl_question.id).limit(sample_size))
+            return question_result.all()
+
+        # 캐시된 ID 배열(ID 순)에서 샘플링, 결과는 이미 무작위 순서이므로 그대로 출제 순서로 사용
+        question_ids = await QUESTION_ID_CACHE.get(db, quiz.id, quiz.version)
+        sampled_ids = rng.sample(question_ids, min(sample_size, len(question_ids)))
+
+        question_result = await db.execute(question_query.where(tbl_question.id.in_(sampled_ids)))
+        text_by_id = {question_id: question_text for question_id, question_text in question_result.all()}
+        return [(question_id, text_by_id[question_id]) for question_id in sampled_ids if question_id in text_by_id]
+
+    async def get_quiz_session(self, db: AsyncSession, session_id: str, user_id: int) -> Tuple[QuizSessionDetail, ErrorType]:
         """
         퀴즈 응시 세션 정보를 조회합니다.
+
+        세션/퀴즈/문제 세션/선택지 세션을 하나의 조인 쿼리로 조회하고 평탄한 행을 응답 구조로 조립합니다.
         
         Args:
             db: 데이터베이스 세션
@@ -565,96 +811,57 @@ class QuizCRUD(IQuizCRUD):
             세션 정보, 오류 타입
         """
         try:
-            # 세션 정보 조회
-            session_query = select(tbl_quiz_session).where(
-                tbl_quiz_session.id == session_id,
-                tbl_quiz_session.user_id == user_id
-            )
-            session_result = await db.execute(session_query)
-            session = session_result.scalars().first()
-            
-            if not session:
-                return None, ErrorType.SESSION_NOT_FOUND
-            
-            # 퀴즈 정보 조회
-            quiz_query = select(tbl_quiz).where(tbl_quiz.id == session.quiz_id)
-            quiz_result = await db.execute(quiz_query)
-            quiz = quiz_result.scalars().first()
-            
-            # 문제 세션 정보 조회
-            question_session_query = select(
-                tbl_question_session,
-                tbl_question.question_text
-            ).join(
-                tbl_question, tbl_question_session.question_id == tbl_question.id
-            ).where(
-                tbl_question_session.session_id == session_id
-            ).order_by(
-                tbl_question_session.question_order
-            )
+            session_result = await db.execute(SESSION_DETAIL_STMT, {"session_id": session_id, "user_id": user_id})
+            rows = session_result.all()
             
-            question_session_result = await db.execute(question_session_query)
-            question_sessions = question_session_result.all()
-            
-            # 응답 데이터 구성
+            if not rows:
+                return None, ErrorType.QUIZ_SESSION_NOT_FOUND
+
+            # 아직 반영되지 않은 write-behind 답안
+            pending_answers = ANSWER_BUFFER.pending_answers(session_id)
+
+            # 평탄한 행을 문제/선택지 구조로 조립 (행은 문제 순서, 선택지 순서로 정렬됨)
             questions_data = []
-            for question_session, question_text in question_sessions:
-                # 선택지 세션 정보 조회
-                choice_session_query = select(
-                    tbl_choice_session,
-                    tbl_choice.content.label("text"),
-                    tbl_choice.id.label("choice_id")
-                ).join(
-                    tbl_choice, tbl_choice_session.choice_id == tbl_choice.id
-                ).where(
-                    tbl_choice_session.question_session_id == question_session.id
-                ).order_by(
-                    tbl_choice_session.choice_order
-                )
-                
-                choice_session_result = await db.execute(choice_session_query)
-                choice_sessions = choice_session_result.all()
-                
-                # 선택지 데이터 구성
-                choices_data = []
-                for _, choice_text, choice_id in choice_sessions:
-                    choice_data = {
-                        "choice_id": choice_id,
-                        "text": choice_text
-                    }
-                    choices_data.append(choice_data)
-                
-                # 문제 데이터 구성
-                question_data = {
-                    "question_id": question_session.question_id,
-                    "question_text": question_text,
-                    "choices": choices_data,
-                    "selected_choice_id": question_session.selected_choice_id
-                }
-                questions_data.append(question_data)
+            question_data = None
+            for row in rows:
+                if row.question_id is None:
+                    continue
+                if question_data is None or question_data.question_id != row.question_id:
+                    question_data = SessionQuestion(
+                        row.question_id,
+                        row.question_text,
+                        [],
+                        pending_answers.get(row.question_id, row.selected_choice_id)
+                    )
+                    questions_data.append(question_data)
+                if row.choice_id is not None:
+                    question_data.choices.append(SessionChoice(row.choice_id, row.choice_text))
             
             # 응답 데이터
-            response_data = {
-                "quiz_id": quiz.id,
-                "session_id": session.id,
-                "title": quiz.title,
-                "description": quiz.description,
-                "questions": questions_data,
-                "started_at": session.started_at,
-                "is_completed": session.is_completed,
-                "completed_at": session.completed_at,
-                "score": session.score
-            }
+            header = rows[0]
+            response_data = QuizSessionDetail(
+                quiz_id=header.quiz_id,
+                session_id=session_id,
+                title=header.title,
+                description=header.description,
+                questions=questions_data,
+                started_at=header.started_at,
+                is_completed=header.is_completed,
+                completed_at=header.completed_at,
+                score=header.score
+            )
             
             return response_data, ErrorType.SUCCESS
             
         except Exception as e:
             print("db get quiz session error:", e)
-            return None, ErrorType.DATABASE_ERROR
+            return None, ErrorType.DB_RUN_FAILED
     
     async def save_answer(self, db: AsyncSession, req: Req_QuizSaveAnswer, user_id: int) -> Tuple[dict, ErrorType]:
         """
         퀴즈 답안을 저장합니다.
+
+        write-behind 가 켜져 있으면(ANSWER_BUFFER.enabled, 단일 워커) 검증 후 ANSWER_BUFFER 에 적재하고 바로 반환합니다.
         
         Args:
             db: 데이터베이스 세션
@@ -665,44 +872,29 @@ class QuizCRUD(IQuizCRUD):
             저장 결과, 오류 타입
         """
         try:
-            # 세션 정보 조회
-            session_query = select(tbl_quiz_session).where(
-                tbl_quiz_session.id == req.session_id,
-                tbl_quiz_session.user_id == user_id,
-                tbl_quiz_session.is_completed == False  # 완료된 세션은 수정 불가
-            )
-            session_result = await db.execute(session_query)
-            session = session_result.scalars().first()
-            
-            if not session:
-                return None, ErrorType.SESSION_NOT_FOUND
-            
-            # 문제 세션 정보 조회
-            question_session_query = select(tbl_question_session).where(
-                tbl_question_session.session_id == req.session_id,
-                tbl_question_session.question_id == req.question_id
-            )
-            question_session_result = await db.execute(question_session_query)
-            question_session = question_session_result.scalars().first()
+            # 세션 + 문제 세션 + 퀴즈 버전을 한 번에 조회
+            question_session_result = await db.execute(ANSWER_TARGET_STMT, {
+                "session_id": req.session_id,
+                "question_id": req.question_id,
+                "user_id": user_id
+            })
+            question_session = question_session_result.first()
             
             if not question_session:
                 return None, ErrorType.QUIZ_SESSION_NOT_FOUND
             
-            # 선택지가 해당 문제의 것인지 확인
-            choice_query = select(tbl_choice).where(
-                tbl_choice.id == req.choice_id,
-                tbl_choice.question_id == req.question_id
-            )
-            choice_result = await db.execute(choice_query)
-            choice = choice_result.scalars().first()
-            
-            if not choice:
+            # 선택지가 해당 문제의 것인지 확인 (정답표 캐시)
+            answer_key = await ANSWER_KEY_CACHE.get(db, question_session.quiz_id, question_session.version)
+            if not answer_key.is_valid_choice(req.question_id, req.choice_id):
                 return None, ErrorType.QUIZ_SESSION_NOT_FOUND
             
             # 답안 저장
-            question_session.selected_choice_id = req.choice_id
-            
-            await db.commit()
+            if ANSWER_BUFFER.enabled:
+                # write-behind: 버퍼에 적재 후 주기적으로 일괄 반영
+                ANSWER_BUFFER.put(req.session_id, req.question_id, question_session.id, req.choice_id)
+            else:
+                await db.execute(SAVE_ANSWER_STMT, {"question_session_id": question_session.id, "choice_id": req.choice_id})
+                await db.commit()
             
             # 응답 데이터
             response_data = {
@@ -718,9 +910,12 @@ class QuizCRUD(IQuizCRUD):
             await db.rollback()
             return None, ErrorType.DB_RUN_FAILED
     
-    async def submit_quiz(self, db: AsyncSession, session_id: str, answers: Dict[int, int], user_id: int) -> Tuple[dict, ErrorType]:
+    async def submit_quiz(self, db: AsyncSession, session_id: str, answers: Dict[int, int], user_id: int) -> Tuple[QuizSubmitResult, ErrorType]:
         """
         퀴즈 답안을 제출하고 채점합니다.
+
+        정답표는 퀴즈 버전별 캐시(ANSWER_KEY_CACHE)에서 가져와 메모리에서 채점하고,
+        채점 결과는 한 번의 일괄 UPDATE 로 저장합니다.
         
         Args:
             db: 데이터베이스 세션
@@ -732,117 +927,182 @@ class QuizCRUD(IQuizCRUD):
             채점 결과, 오류 타입
         """
         try:
-            # 세션 정보 조회
-            session_query = select(tbl_quiz_session).where(
-                tbl_quiz_session.id == session_id,
-                tbl_quiz_session.user_id == user_id,
-                tbl_quiz_session.is_completed == False  # 이미 완료된 세션은 제출 불가
-            )
-            session_result = await db.execute(session_query)
-            session = session_result.scalars().first()
+            # 세션 + 퀴즈 정보 조회
+            session_result = await db.execute(SUBMIT_SESSION_STMT, {"session_id": session_id, "user_id": user_id})
+            session = session_result.first()
 
             if not session:
-                return None, ErrorType.SESSION_NOT_FOUND
-
-            # 퀴즈 정보 조회
-            quiz_query = select(tbl_quiz).where(tbl_quiz.id == session.quiz_id)
-            quiz_result = await db.execute(quiz_query)
-            quiz = quiz_result.scalars().first()
-
-            # 문제 세션 정보 조회
-            question_session_query = select(
-                tbl_question_session,
-                tbl_question.question_text,
-                tbl_question.id.label("question_id")
-            ).join(
-                tbl_question, tbl_question_session.question_id == tbl_question.id
-            ).where(
-                tbl_question_session.session_id == session_id
-            ).order_by(
-                tbl_question_session.question_order
-            )
+                return None, ErrorType.QUIZ_SESSION_NOT_FOUND
 
-            question_session_result = await db.execute(question_session_query)
+            # 세션 문제 목록 조회
+            question_session_result = await db.execute(SESSION_QUESTIONS_STMT, {"session_id": session_id})
             question_sessions = question_session_result.all()
 
-            # 답안 저장 및 채점
+            # 정답표 (캐시, tbl_choice 조회 없음)
+            answer_key = await ANSWER_KEY_CACHE.get(db, session.quiz_id, session.version)
+
+            # 메모리에서 채점
             total_questions = len(question_sessions)
             correct_answers = 0
             questions_data = []
+            update_ids, update_choice_ids, update_is_corrects = [], [], []
 
-            for question_session, question_text, question_id in question_sessions:
-                # 요청에서 답안 가져오기
-                selected_choice_id = answers.get(question_id)
+            for question_session_id, question_id, selected_choice_id, question_text in question_sessions:
+                # 요청 답안은 해당 문제의 선택지인 경우에만 반영
+                submitted_choice_id = answers.get(question_id)
+                if submitted_choice_id and answer_key.is_valid_choice(question_id, submitted_choice_id):
+                    selected_choice_id = submitted_choice_id
 
-                # 답안이 있으면 저장
-                if selected_choice_id:
-                    question_session.selected_choice_id = selected_choice_id
-
-                # 정답 확인
-                correct_choice_query = select(tbl_choice).where(
-                    tbl_choice.question_id == question_id,
-                    tbl_choice.is_correct == True
-                )
-                correct_choice_result = await db.execute(correct_choice_query)
-                correct_choice = correct_choice_result.scalars().first()
-
-                # 선택한 답안 정보
-                selected_choice_text = None
-                if question_session.selected_choice_id:
-                    selected_choice_query = select(tbl_choice).where(
-                        tbl_choice.id == question_session.selected_choice_id
-                    )
-                    selected_choice_result = await db.execute(selected_choice_query)
-                    selected_choice = selected_choice_result.scalars().first()
-                    if selected_choice:
-                        selected_choice_text = selected_choice.content
-
-                # 정답 여부 확인
+                correct_choice_id = answer_key.correct_choice_ids.get(question_id)
                 is_correct = False
-                if question_session.selected_choice_id and correct_choice:
-                    is_correct = question_session.selected_choice_id == correct_choice.id
-                    question_session.is_correct = is_correct
+                if selected_choice_id and correct_choice_id:
+                    is_correct = selected_choice_id == correct_choice_id
                     if is_correct:
                         correct_answers += 1
 
+                if selected_choice_id:
+                    update_ids.append(question_session_id)
+                    update_choice_ids.append(selected_choice_id)
+                    update_is_corrects.append(is_correct if correct_choice_id else None)
+
                 # 문제 결과 데이터
-                question_data = {
-                    "question_id": question_id,
-                    "question_text": question_text,
-                    "selected_choice_id": question_session.selected_choice_id,
-                    "selected_choice_text": selected_choice_text,
-                    "correct_choice_id": correct_choice.id if correct_choice else None,
-                    "correct_choice_text": correct_choice.content if correct_choice else None,
-                    "is_correct": is_correct
-                }
-                questions_data.append(question_data)
+                questions_data.append(SubmitQuestion(
+                    question_id,
+                    question_text,
+                    selected_choice_id,
+                    answer_key.choice_texts.get(selected_choice_id),
+                    correct_choice_id,
+                    answer_key.choice_texts.get(correct_choice_id),
+                    is_correct
+                ))
+
+            # 채점 결과 일괄 저장
+            if update_ids:
+                await db.execute(GRADE_QUESTION_SESSIONS_SQL, {
+                    "ids": update_ids,
+                    "selected_choice_ids": update_choice_ids,
+                    "is_corrects": update_is_corrects
+                })
 
             # 점수 계산 (100점 만점)
             score = (correct_answers / total_questions * 100) if total_questions > 0 else 0
+            completed_at = datetime.now()
 
-            # 세션 완료 처리
-            session.is_completed = True
-            session.completed_at = datetime.now()
-            session.score = score
+            # 세션 완료 처리 (동시 제출 시 한 번만 성공)
+            complete_result = await db.execute(COMPLETE_SESSION_STMT, {
+                "session_id": session_id,
+                "completed_at": completed_at,
+                "score": score
+            })
+            if complete_result.rowcount == 0:
+                await db.rollback()
+                return None, ErrorType.QUIZ_SESSION_NOT_FOUND
 
             await db.commit()
 
             # 응답 데이터
-            response_data = {
-                "quiz_id": quiz.id,
-                "session_id": session.id,
-                "title": quiz.title,
-                "total_questions": total_questions,
-                "correct_answers": correct_answers,
-                "score": score,
-                "started_at": session.started_at,
-                "completed_at": session.completed_at,
-                "questions": questions_data
-            }
+            response_data = QuizSubmitResult(
+                quiz_id=session.quiz_id,
+                session_id=session_id,
+                title=session.title,
+                total_questions=total_questions,
+                correct_answers=correct_answers,
+                score=score,
+                started_at=session.started_at,
+                completed_at=completed_at,
+                questions=questions_data
+            )
 
             return response_data, ErrorType.SUCCESS
 
         except Exception as e:
             print("db submit quiz error:", e)
             await db.rollback()
-            return None, ErrorType.DATABASE_ERROR
\ No newline at end of file
+            return None, ErrorType.DB_RUN_FAILED
+
+    async def stream_quiz_results(self, db: AsyncSession, quiz_id: int, batch_size: int) -> AsyncIterator[list]:
+        """
+        퀴즈의 모든 응시 세션 x 출제 문제 결과를 서버 측 커서로 batch_size 행씩 가져옵니다.
+        결과 크기와 무관하게 한 번에 batch_size 행만 메모리에 올립니다.
+
+        Args:
+            db: 스트리밍이 끝날 때까지 유지되는 세션 (DB_SESSION_MNG.stream_session)
+            quiz_id: 퀴즈 ID
+            batch_size: 한 번에 가져올 행 수
+
+        Returns:
+            행 목록 (QUIZ_RESULTS_EXPORT_STMT 컬럼 순서)
+        """
+        try:
+            result = await db.stream(QUIZ_RESULTS_EXPORT_STMT, {"quiz_id": quiz_id})
+            async for rows in result.partitions(batch_size):
+                yield rows
+        except Exception as e:
+            # 응답 헤더가 이미 전송되었으므로 에러 코드 대신 연결을 끊어 잘린 결과임을 알림
+            print("db stream quiz results error:", e)
+            raise
+
+    async def import_questions(self, db: AsyncSession, quiz_id: int, question_chunks: AsyncIterator[list[Question]]) -> Tuple[dict, ErrorType]:
+        """
+        검증된 문제 묶음을 받아 COPY (asyncpg copy_records_to_table) 로 적재합니다.
+
+        문제 ID 는 묶음마다 시퀀스에서 한 번에 받아 선택지 행에 바로 넣으므로 RETURNING 왕복이 없고,
+        전체를 한 트랜잭션으로 처리해 중간에 잘못된 행이 나오면 아무것도 반영하지 않습니다.
+
+        Args:
+            db: 데이터베이스 세션
+            quiz_id: 문제를 추가할 퀴즈 ID
+            question_chunks: 검증된 문제 묶음 (iter_question_chunks)
+
+        Returns:
+            적재 결과 (문제/선택지 수, 잘못된 행이면 행 번호와 사유), 오류 타입
+        """
+        try:
+            question_count, choice_count = 0, 0
+            async for questions in question_chunks:
+                # SQLAlchemy 쿼리를 먼저 실행해야 드라이버 커넥션의 트랜잭션이 시작되어 COPY 가 같은 트랜잭션에 포함됨
+                id_result = await db.execute(ALLOCATE_QUESTION_IDS_SQL, {"count": len(questions)})
+                question_ids = id_result.scalars().all()
+
+                choice_records = [
+                    (question_id, choice_data.text, choice_data.is_correct)
+                    for question_id, question_data in zip(question_ids, questions)
+                    for choice_data in question_data.choices
+                ]
+
+                connection = await db.connection()
+                raw_connection = await connection.get_raw_connection()
+                driver_connection = raw_connection.driver_connection
+                await driver_connection.copy_records_to_table(
+                    tbl_question.__tablename__,
+                    records=[(question_id, quiz_id, question_data.question_text) for question_id, question_data in zip(question_ids, questions)],
+                    columns=["id", "quiz_id", "question_text"]
+                )
+                await driver_connection.copy_records_to_table(
+                    tbl_choice.__tablename__,
+                    records=choice_records,
+                    columns=["question_id", "content", "is_correct"]
+                )
+
+                question_count += len(questions)
+                choice_count += len(choice_records)
+
+            # 버전 증가 (정답표 / 상세 조회 캐시 무효화 기준)
+            await db.execute(
+                update(tbl_quiz)
+                .where(tbl_quiz.id == quiz_id)
+                .values(version=tbl_quiz.version + 1)
+                .execution_options(synchronize_session=False)
+            )
+
+            await db.commit()
+            ANSWER_KEY_CACHE.invalidate(quiz_id)
+            QUESTION_ID_CACHE.invalidate(quiz_id)
+            return {"imported_questions": question_count, "imported_choices": choice_count}, ErrorType.SUCCESS
+        except QuestionImportError as e:
+            await db.rollback()
+            return {"error_line": e.line, "error_detail": e.detail}, ErrorType.INVALID_IMPORT_ROW
+        except Exception as e:
+            print("db import questions error:", e)
+            await db.rollback()
+            return None, ErrorType.DB_RUN_FAILED
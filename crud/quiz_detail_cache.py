@@ -0,0 +1,42 @@
+from typing import Any, Awaitable, Callable, Optional, Tuple
+from commons.cache.backend import ICacheBackend
+from commons.utils.enums import ErrorType
+from config.config import quiz_config
+
+
+class QuizDetailCache:
+    """
+    퀴즈 상세 조회 응답 캐시 (quiz_id, version, page, cursor, is_admin) -> 응답 데이터
+
+    관리자/응시자 응답(정답 노출 여부)을 따로 저장하며, 선택지 섞기는 캐시 밖(서비스)에서 합니다.
+    키에 호출자가 DB 에서 확인한 tbl_quiz.version 을 넣으므로 (AnswerKeyCache 와 같은 방식)
+    어느 워커에서 수정해도 다음 요청부터 새 키를 쓰고, 워커별 local 백엔드에서도 이전 버전 응답을 주지 않습니다.
+    이전 버전 항목은 TTL 로 정리됩니다.
+    """
+
+    def __init__(self, backend: ICacheBackend):
+        self.backend = backend
+
+    @property
+    def enabled(self) -> bool:
+        return quiz_config.detail_cache_ttl_sec > 0
+
+    async def get_or_load(self, quiz_id: int, version: int, page: int, cursor: Optional[str], is_admin: bool,
+                          loader: Callable[[], Awaitable[Tuple[Any, ErrorType]]]) -> Tuple[Any, ErrorType]:
+        if not self.enabled:
+            return await loader()
+
+        key = f"quiz_detail:{quiz_id}:v{version}:{page}:{'a' if is_admin else 'u'}:{cursor or ''}"
+        return await self.backend.get_or_load(key, loader, quiz_config.detail_cache_ttl_sec)
+
+
+def quiz_detail_etag(quiz_id: int, version: int, is_admin: bool) -> str:
+    # 같은 URL 이라도 관리자/응시자 응답이 다르므로 구분, 선택지 순서만 다른 응답은 같은 것으로 보므로 약한 ETag
+    return f'W/"quiz-{quiz_id}-v{version}-{"a" if is_admin else "u"}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
@@ -0,0 +1,165 @@
+from sqlalchemy import bindparam, func, select, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import aliased
+from models.quiz import tbl_choice, tbl_choice_session, tbl_question, tbl_question_session, tbl_quiz, tbl_quiz_session, tbl_user
+
+
+# 자주 실행되는 쿼리 (응시 중 폴링, 답안 저장, 제출, 정답표 적재)
+# 모듈 로드 시 한 번만 만들고 값은 bindparam 으로 넘깁니다.
+# 매 요청 select(...) 를 새로 조립하는 비용이 없고, 같은 SQL 문자열이 되므로
+# SQLAlchemy 컴파일 캐시(DataBaseConfig.query_cache_size)와
+# asyncpg prepared statement 캐시(DataBaseConfig.prepared_statement_cache_size)가 항상 적중합니다.
+
+
+# 퀴즈 버전 (quiz_id): 상세 조회 캐시 / ETag 확인용 PK 조회
+QUIZ_VERSION_STMT = select(tbl_quiz.version).where(tbl_quiz.id == bindparam("quiz_id"))
+
+# 응시 세션 조회: 세션/퀴즈/문제 세션/선택지 세션을 한 번에 (session_id, user_id)
+SESSION_DETAIL_STMT = select(
+    tbl_quiz_session.quiz_id,
+    tbl_quiz_session.started_at,
+    tbl_quiz_session.is_completed,
+    tbl_quiz_session.completed_at,
+    tbl_quiz_session.score,
+    tbl_quiz.title,
+    tbl_quiz.description,
+    tbl_question_session.question_id,
+    tbl_question_session.selected_choice_id,
+    tbl_question.question_text,
+    tbl_choice.id.label("choice_id"),
+    tbl_choice.content.label("choice_text")
+).join(
+    tbl_quiz, tbl_quiz_session.quiz_id == tbl_quiz.id
+).outerjoin(
+    tbl_question_session, tbl_question_session.session_id == tbl_quiz_session.id
+).outerjoin(
+    tbl_question, tbl_question_session.question_id == tbl_question.id
+).outerjoin(
+    tbl_choice_session, tbl_choice_session.question_session_id == tbl_question_session.id
+).outerjoin(
+    tbl_choice, tbl_choice_session.choice_id == tbl_choice.id
+).where(
+    tbl_quiz_session.id == bindparam("session_id"),
+    tbl_quiz_session.user_id == bindparam("user_id")
+).order_by(
+    tbl_question_session.question_order,
+    tbl_choice_session.choice_order
+)
+
+# 답안 저장 대상 문제 세션 + 퀴즈 버전 (session_id, question_id, user_id), 완료된 세션 제외
+ANSWER_TARGET_STMT = select(
+    tbl_question_session.id,
+    tbl_quiz_session.quiz_id,
+    tbl_quiz.version
+).join(
+    tbl_quiz_session, tbl_question_session.session_id == tbl_quiz_session.id
+).join(
+    tbl_quiz, tbl_quiz_session.quiz_id == tbl_quiz.id
+).where(
+    tbl_question_session.session_id == bindparam("session_id"),
+    tbl_question_session.question_id == bindparam("question_id"),
+    tbl_quiz_session.user_id == bindparam("user_id"),
+    tbl_quiz_session.is_completed == False
+)
+
+# 답안 저장 (question_session_id, choice_id)
+SAVE_ANSWER_STMT = update(tbl_question_session).where(
+    tbl_question_session.id == bindparam("question_session_id")
+).values(
+    selected_choice_id=bindparam("choice_id")
+).execution_options(synchronize_session=False)
+
+# 제출할 세션 + 퀴즈 정보 (session_id, user_id), 완료된 세션 제외
+SUBMIT_SESSION_STMT = select(
+    tbl_quiz_session.quiz_id,
+    tbl_quiz_session.started_at,
+    tbl_quiz.title,
+    tbl_quiz.version
+).join(
+    tbl_quiz, tbl_quiz_session.quiz_id == tbl_quiz.id
+).where(
+    tbl_quiz_session.id == bindparam("session_id"),
+    tbl_quiz_session.user_id == bindparam("user_id"),
+    tbl_quiz_session.is_completed == False
+)
+
+# 세션 문제 목록, 출제 순서 (session_id)
+SESSION_QUESTIONS_STMT = select(
+    tbl_question_session.id,
+    tbl_question_session.question_id,
+    tbl_question_session.selected_choice_id,
+    tbl_question.question_text
+).join(
+    tbl_question, tbl_question_session.question_id == tbl_question.id
+).where(
+    tbl_question_session.session_id == bindparam("session_id")
+).order_by(
+    tbl_question_session.question_order
+)
+
+# 세션 완료 처리, 동시 제출 시 한 번만 성공 (session_id, completed_at, score)
+COMPLETE_SESSION_STMT = update(tbl_quiz_session).where(
+    tbl_quiz_session.id == bindparam("session_id"),
+    tbl_quiz_session.is_completed == False
+).values(
+    is_completed=True,
+    completed_at=bindparam("completed_at"),
+    score=bindparam("score")
+).execution_options(synchronize_session=False)
+
+# 퀴즈 정답표 (quiz_id)
+ANSWER_KEY_STMT = select(
+    tbl_choice.id,
+    tbl_choice.question_id,
+    tbl_choice.is_correct,
+    tbl_choice.content
+).join(
+    tbl_question, tbl_choice.question_id == tbl_question.id
+).where(
+    tbl_question.quiz_id == bindparam("quiz_id")
+)
+
+# 퀴즈 문제 ID 배열 한 행 (quiz_id, ID 순으로 정렬해야 시드별 샘플링 결과가 재현됨)
+QUESTION_IDS_STMT = select(
+    func.array_agg(aggregate_order_by(tbl_question.id, tbl_question.id))
+).where(
+    tbl_question.quiz_id == bindparam("quiz_id")
+)
+
+# 퀴즈 결과 내보내기: 세션 x 출제 문제 한 행씩, 세션/출제 순서로 정렬 (quiz_id)
+# 정답 선택지는 문제당 하나 (Question.validate_choices)
+_selected_choice = aliased(tbl_choice)
+_correct_choice = aliased(tbl_choice)
+QUIZ_RESULTS_EXPORT_STMT = select(
+    tbl_quiz_session.id.label("session_id"),
+    tbl_quiz_session.user_id,
+    tbl_user.username,
+    tbl_quiz_session.started_at,
+    tbl_quiz_session.completed_at,
+    tbl_quiz_session.is_completed,
+    tbl_quiz_session.score,
+    tbl_question_session.question_order,
+    tbl_question_session.question_id,
+    tbl_question.question_text,
+    tbl_question_session.selected_choice_id,
+    _selected_choice.content.label("selected_choice_text"),
+    _correct_choice.id.label("correct_choice_id"),
+    _correct_choice.content.label("correct_choice_text"),
+    tbl_question_session.is_correct
+).join(
+    tbl_user, tbl_quiz_session.user_id == tbl_user.id
+).join(
+    tbl_question_session, tbl_question_session.session_id == tbl_quiz_session.id
+).join(
+    tbl_question, tbl_question_session.question_id == tbl_question.id
+).outerjoin(
+    _selected_choice, tbl_question_session.selected_choice_id == _selected_choice.id
+).outerjoin(
+    _correct_choice, (_correct_choice.question_id == tbl_question.id) & (_correct_choice.is_correct == True)
+).where(
+    tbl_quiz_session.quiz_id == bindparam("quiz_id")
+).order_by(
+    tbl_quiz_session.started_at,
+    tbl_quiz_session.id,
+    tbl_question_session.question_order
+)
@@ -0,0 +1,84 @@
+from typing import Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from commons.cache.backend import CACHE_REQUESTS, ICacheBackend
+from commons.utils.enums import ErrorType
+from config.config import auth_config
+from crud.auth_crud import IAuthCRUD
+from db.database import worker_count
+
+
+class UserRecord:
+    """로그인 / 가입 확인에 필요한 사용자 정보 (캐시 저장용)"""
+    __slots__ = ("id", "username", "password", "is_admin")
+
+    def __init__(self, id: int, username: str, password: str, is_admin: bool):
+        self.id = id
+        self.username = username
+        self.password = password
+        self.is_admin = is_admin
+
+
+# 없는 사용자 (캐시 백엔드는 None 을 미스로 보므로 별도 값으로 저장)
+_NOT_EXISTS = False
+
+
+class UserCache:
+    """
+    username -> UserRecord 캐시 (CacheConfig 백엔드)
+
+    없는 username 도 짧은 TTL 로 저장(negative caching)해 존재하지 않는 계정으로의 반복 로그인 시도가 DB 로 가지 않게 합니다.
+    워커별 백엔드(local)에 워커가 여럿이면 가입한 워커의 캐시만 갱신되어 다른 워커에서는 방금 가입한 사용자가
+    user_negative_ttl_sec 동안 없는 사용자로 보이므로, 이때는 없는 사용자를 저장하지 않습니다.
+    비밀번호 해시가 포함되므로 공유 백엔드는 내부망 Redis 만 사용해야 합니다.
+    """
+
+    def __init__(self, backend: ICacheBackend, auth_crud: IAuthCRUD):
+        self.backend = backend
+        self.auth_crud = auth_crud
+
+    @property
+    def negative_enabled(self) -> bool:
+        return auth_config.user_negative_ttl_sec > 0 and (self.backend.shared or worker_count() == 1)
+
+    async def get(self, db: AsyncSession, username: str) -> Tuple[Optional[UserRecord], ErrorType]:
+        if auth_config.user_cache_ttl_sec <= 0:
+            return await self._load(db, username)
+
+        cached = await self.backend.get(self._key(username))
+        if cached is not None:
+            CACHE_REQUESTS.inc(backend=self.backend.name, result="hit")
+            return (None if cached is _NOT_EXISTS else cached), ErrorType.SUCCESS
+        CACHE_REQUESTS.inc(backend=self.backend.name, result="miss")
+
+        user, err_type = await self._load(db, username)
+        if err_type == ErrorType.SUCCESS:
+            await self.set(username, user)
+        return user, err_type
+
+    async def get_cached(self, username: str) -> Optional[UserRecord]:
+        """DB 조회 없이 캐시에 있는 사용자만 반환합니다. (미스 / 없는 사용자면 None)"""
+        if auth_config.user_cache_ttl_sec <= 0:
+            return None
+        cached = await self.backend.get(self._key(username))
+        return None if cached is None or cached is _NOT_EXISTS else cached
+
+    async def set(self, username: str, user: Optional[UserRecord]) -> None:
+        if auth_config.user_cache_ttl_sec <= 0:
+            return
+        if user is None:
+            if self.negative_enabled:
+                await self.backend.set(self._key(username), _NOT_EXISTS, auth_config.user_negative_ttl_sec)
+        else:
+            await self.backend.set(self._key(username), user, auth_config.user_cache_ttl_sec)
+
+    async def invalidate(self, username: str) -> None:
+        await self.backend.delete(self._key(username))
+
+    async def _load(self, db: AsyncSession, username: str) -> Tuple[Optional[UserRecord], ErrorType]:
+        user, err_type = await self.auth_crud.get_user(db, username)
+        if err_type != ErrorType.SUCCESS or user is None:
+            return None, err_type
+        return UserRecord(user.id, user.username, user.password, user.is_admin), ErrorType.SUCCESS
+
+    def _key(self, username: str) -> str:
+        return f"auth_user:{username}"
@@ -1,4 +1,9 @@
+import itertools
+import os
+import time
 from asyncio import current_task
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_scoped_session
@@ -6,19 +11,79 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.util._collections import immutabledict
 from commons.utils.enums import ErrorType
 from commons.utils.singleton import Singleton
-from config.config import db_config
+from db.instrumentation import DB_ERRORS, InstrumentedQueuePool, register_pool_gauges, register_query_events
+from config.config import db_config, web_server_config
+
+def worker_count() -> int:
+    # uvicorn --workers 는 WEB_CONCURRENCY 로도 지정되므로 환경변수를 우선합니다.
+    return max(1, int(os.environ.get("WEB_CONCURRENCY", 0)) or web_server_config.workers)
+
+
+def pool_sizing() -> tuple[int, int]:
+    """
+    워커별 (pool_size, max_overflow) 를 계산합니다.
+    max_connections 가 지정되면 워커 수로 나눈 몫을 넘지 않도록 줄입니다.
+    """
+    pool_size, max_overflow = db_config.pool_size, db_config.max_overflow
+    if db_config.max_connections > 0:
+        per_worker = max(1, db_config.max_connections // worker_count())
+        pool_size = min(pool_size, per_worker)
+        max_overflow = max(0, min(max_overflow, per_worker - pool_size))
+    return pool_size, max_overflow
+
+
+def engine_options() -> dict:
+    pool_size, max_overflow = pool_sizing()
+
+    server_settings = {"application_name": web_server_config.server_name or "quiz_system"}
+    if db_config.statement_timeout_ms > 0:
+        server_settings["statement_timeout"] = str(db_config.statement_timeout_ms)
+
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": db_config.pool_timeout,
+        "pool_pre_ping": db_config.pool_pre_ping,
+        "pool_recycle": db_config.pool_recycle,
+        "query_cache_size": db_config.query_cache_size,
+        "connect_args": {
+            "prepared_statement_cache_size": db_config.prepared_statement_cache_size,
+            "statement_cache_size": db_config.statement_cache_size,
+            "server_settings": server_settings,
+        },
+    }
+
+
+def db_url(host: str, port: str) -> str:
+    return f"postgresql+asyncpg://{db_config.db_username}:{db_config.db_password}@{host}:{port}/{db_config.db_name}"
+
 
 class DBSessionManager(Singleton):
     def __init__(self):
         if not DBSessionManager.is_init():
             DBSessionManager.set_init()
-            self.__DB_URL = f"postgresql+asyncpg://{db_config.db_username}:{db_config.db_password}@{db_config.db_host}:{db_config.db_port}/{db_config.db_name}"
-            self.__ENGINE = create_async_engine(
-                self.__DB_URL, 
-                pool_size=50, max_overflow=100, pool_pre_ping=True, pool_recycle=600
-            )
+            self.__DB_URL = db_url(db_config.db_host, db_config.db_port)
+            self.__ENGINE = create_async_engine(self.__DB_URL, **engine_options())
+
+            register_pool_gauges("primary", self.__ENGINE)
+            register_query_events(self.__ENGINE)
+
+            self.__SESSION_MAKER = sessionmaker(self.__ENGINE, expire_on_commit=False, autocommit=False, autoflush=False)
+            self.__SCOPED_SESSION = async_scoped_session(self.__SESSION_MAKER, scopefunc=current_task)
 
-            self.__SCOPED_SESSION = async_scoped_session(sessionmaker(self.__ENGINE, class_=AsyncSession, expire_on_commit=False, autocommit=False, autoflush=False), scopefunc=current_task)
+            # 읽기 전용 복제본 ("host:port" 목록), 라운드 로빈 + 장애 시 일정 시간 제외
+            self.__REPLICA_ENGINES = []
+            self.__REPLICA_SESSIONS = []
+            for index, replica_host in enumerate(db_config.replica_hosts):
+                host, _, port = replica_host.partition(":")
+                engine = create_async_engine(db_url(host, port or db_config.db_port), **engine_options())
+                register_pool_gauges(f"replica_{index}", engine)
+                register_query_events(engine)
+                self.__REPLICA_ENGINES.append(engine)
+                self.__REPLICA_SESSIONS.append(sessionmaker(engine, expire_on_commit=False, autocommit=False, autoflush=False))
+            self.__REPLICA_DOWN_UNTIL = [0.0] * len(self.__REPLICA_ENGINES)
+            self.__REPLICA_INDEX = itertools.count()
         else:
             print("already init DBSessionManager")
 
@@ -28,16 +93,92 @@ class DBSessionManager(Singleton):
     async def end_session(self):
         await self.__SCOPED_SESSION.remove()
     
-    async def execute_lambda(self, func):
+    async def execute_lambda(self, func, read_only: bool = False):
         """
         One query called
+        read_only=True 면 읽기 전용 복제본으로 보냅니다. (복제본이 없거나 모두 장애면 primary)
+        쓰기, 쓰기 직후 읽기(read-after-write)는 read_only 를 지정하지 않습니다.
         """
+        if read_only:
+            replica_session = await self.start_replica_session()
+            if replica_session is not None:
+                try:
+                    return await func(replica_session)
+                finally:
+                    await replica_session.close()
+
         s = await self.start_session()
         try:
             return await func(s)
         finally:
             await self.end_session()
 
+    async def request_session(self) -> AsyncIterator[AsyncSession]:
+        """
+        요청 단위 세션 (FastAPI yield 의존성, get_async_db 참고)
+        커넥션은 첫 쿼리 실행 시점에 풀에서 한 번만 가져오고 요청이 끝나면 반납합니다.
+        커밋은 CRUD 가 하며, 예외가 나거나 커밋되지 않은 트랜잭션이 남아 있으면 롤백합니다.
+        """
+        s = self.__SESSION_MAKER()
+        try:
+            yield s
+        except Exception:
+            await s.rollback()
+            raise
+        finally:
+            # close 는 남은 트랜잭션을 롤백하고 커넥션을 반납합니다.
+            await s.close()
+
+    @asynccontextmanager
+    async def stream_session(self) -> AsyncIterator[AsyncSession]:
+        """
+        스트리밍 응답(내보내기)용 세션
+        요청 세션과 별개로 응답 전송이 끝날 때까지 서버 측 커서를 유지하며, 복제본이 있으면 복제본을 사용합니다.
+        """
+        s = await self.start_replica_session()
+        if s is None:
+            s = self.__SESSION_MAKER()
+        try:
+            yield s
+        finally:
+            await s.close()
+
+    async def execute_read(self, db: AsyncSession, func):
+        """
+        읽기 전용 쿼리를 복제본에서 실행합니다. 복제본이 없거나 모두 장애면 요청 세션(db)을 그대로 사용합니다.
+        """
+        replica_session = await self.start_replica_session()
+        if replica_session is None:
+            return await func(db)
+
+        try:
+            return await func(replica_session)
+        finally:
+            await replica_session.close()
+
+    async def start_replica_session(self) -> Optional[AsyncSession]:
+        """
+        라운드 로빈으로 정상 복제본의 세션을 엽니다.
+        커넥션 획득(pool_pre_ping 포함)에 실패한 복제본은 replica_retry_sec 동안 제외하고 다음 복제본을 시도합니다.
+        """
+        replica_count = len(self.__REPLICA_SESSIONS)
+        for _ in range(replica_count):
+            index = next(self.__REPLICA_INDEX) % replica_count
+            if self.__REPLICA_DOWN_UNTIL[index] > time.monotonic():
+                continue
+
+            s = self.__REPLICA_SESSIONS[index]()
+            try:
+                await s.connection()
+                return s
+            except Exception as ex:
+                print(f"[REPLICA_DOWN] {db_config.replica_hosts[index]=}, {ex=}")
+                DB_ERRORS.inc(operation="replica_checkout")
+                self.__REPLICA_DOWN_UNTIL[index] = time.monotonic() + db_config.replica_retry_sec
+                await s.close()
+
+        return None
+
     async def add(self, db: AsyncSession, query, err_msg="DB Operation Failed", raise_error=True, callback: callable = None) -> ErrorType:
         try:
             if hasattr(query, "column_descriptions"):
@@ -53,6 +194,7 @@ class DBSessionManager(Singleton):
 
         except Exception as ex:
             await db.rollback()
+            DB_ERRORS.inc(operation="add")
             err_type = ErrorType.DB_RUN_FAILED
             print(f"[{err_type.name}] {err_msg=}, {ex=}")
             if raise_error:
@@ -69,6 +211,7 @@ class DBSessionManager(Singleton):
 
             return ErrorType.SUCCESS, res.scalars().fetchall() if 1 == len(query.column_descriptions) else res.all()
         except Exception as ex:
+            DB_ERRORS.inc(operation="execute")
             err_type = ErrorType.DB_RUN_FAILED
             print(f"[{err_type.name}] {err_msg=}, {ex=}")
 
@@ -81,3 +224,8 @@ DB_SESSION_MNG = DBSessionManager()
 
     
 
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """요청 단위 AsyncSession 의존성"""
+    async for s in DB_SESSION_MNG.request_session():
+        yield s
@@ -0,0 +1,103 @@
+import time
+from contextvars import ContextVar
+from typing import Optional
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from commons.utils.metrics import METRICS
+from config.config import db_config
+
+
+# DB 지표
+DB_QUERIES = METRICS.counter("db_queries_total", "Number of statements sent to the database")
+DB_ERRORS = METRICS.counter("db_errors_total", "Number of failed DBSessionManager operations")
+DB_SLOW_QUERIES = METRICS.counter("db_slow_queries_total", "Number of statements slower than slow_query_ms")
+DB_QUERY_SECONDS = METRICS.histogram(
+    "db_query_duration_seconds", "Statement execution time",
+    (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+)
+DB_POOL_CHECKOUT_SECONDS = METRICS.histogram(
+    "db_pool_checkout_wait_seconds", "Time spent waiting for a pooled connection",
+    (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30)
+)
+DB_POOL_CHECKED_OUT = METRICS.gauge("db_pool_checked_out", "Connections currently in use")
+DB_POOL_CHECKED_IN = METRICS.gauge("db_pool_checked_in", "Idle connections in the pool")
+DB_POOL_OVERFLOW = METRICS.gauge("db_pool_overflow", "Overflow connections currently open")
+DB_POOL_SIZE = METRICS.gauge("db_pool_size", "Configured pool size")
+REQUEST_DB_QUERIES = METRICS.histogram(
+    "http_request_db_queries", "Statements executed per HTTP request",
+    (0, 1, 2, 3, 5, 10, 20, 50, 100)
+)
+
+
+class RequestDBStats:
+    """요청 하나 동안의 쿼리 수 / 누적 DB 시간"""
+    __slots__ = ("query_count", "db_time")
+
+    def __init__(self):
+        self.query_count = 0
+        self.db_time = 0.0
+
+
+# 미들웨어가 요청마다 새 RequestDBStats 를 설정합니다. (요청 밖에서는 None)
+REQUEST_DB_STATS: ContextVar[Optional[RequestDBStats]] = ContextVar("request_db_stats", default=None)
+
+
+def record_query(statement, elapsed: float) -> None:
+    DB_QUERIES.inc()
+    DB_QUERY_SECONDS.observe(elapsed)
+
+    stats = REQUEST_DB_STATS.get()
+    if stats is not None:
+        stats.query_count += 1
+        stats.db_time += elapsed
+
+    if db_config.slow_query_ms > 0 and elapsed * 1000 >= db_config.slow_query_ms:
+        DB_SLOW_QUERIES.inc()
+        print(f"[SLOW_QUERY] {elapsed * 1000:.1f}ms {' '.join(str(statement).split())[:1000]}")
+
+
+def register_query_events(engine) -> None:
+    """
+    커서 실행 이벤트로 모든 쿼리의 실행 시간을 기록합니다.
+
+    execute / scalar / stream / ORM flush 등 실행 경로와 무관하게 DB 로 나가는 문장마다 한 번씩 기록되며,
+    비동기 엔진의 동기 코드는 요청 코루틴의 컨텍스트를 가진 greenlet 에서 실행되므로 REQUEST_DB_STATS 를 볼 수 있습니다.
+    """
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        record_query(statement, time.perf_counter() - conn.info["query_started"].pop())
+
+    @event.listens_for(sync_engine, "handle_error")
+    def handle_error(exception_context):
+        # 실패한 쿼리도 시간을 기록하고 시작 시각을 정리
+        started = exception_context.connection.info.get("query_started") if exception_context.connection is not None else None
+        if started:
+            record_query(exception_context.statement, time.perf_counter() - started.pop())
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """커넥션 체크아웃 대기 시간을 기록하는 풀"""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_SECONDS.observe(time.perf_counter() - started)
+
+
+def register_pool_gauges(name: str, engine) -> None:
+    # dispose() 시 풀이 교체되므로 매번 engine 에서 현재 풀을 읽습니다.
+    def pool():
+        return engine.sync_engine.pool
+
+    DB_POOL_CHECKED_OUT.set_function(lambda: pool().checkedout(), engine=name)
+    DB_POOL_CHECKED_IN.set_function(lambda: pool().checkedin(), engine=name)
+    DB_POOL_OVERFLOW.set_function(lambda: max(0, pool().overflow()), engine=name)
+    DB_POOL_SIZE.set_function(lambda: pool().size(), engine=name)
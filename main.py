@@ -8,6 +8,7 @@ if __name__ == "__main__":
                 "router.router:app",
                 host=web_server_config.host,
                 port=web_server_config.port,
+                workers=web_server_config.workers,
                 access_log=False
                 )
     
@@ -1,21 +1,29 @@
+import hashlib
+import time
 import jwt
 from fastapi import HTTPException, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from datetime import datetime, timedelta
 from typing import Optional
 
-from sqlalchemy import select
-from models.quiz import tbl_user
-from sqlalchemy.ext.asyncio import AsyncSession
+from commons.cache.backend import ICacheBackend
+from commons.cache.provider import get_session_backend
+from commons.utils.lru_cache import LRUCache
 from config.config import jwt_config
+from middleware.session_store import AuthSessionStore
+from models.principal import Principal
 
 # JWT 설정
 SECRET_KEY = jwt_config.access_key
+REFRESH_SECRET_KEY = jwt_config.refresh_key
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = jwt_config.access_expire_min
 
 security = HTTPBearer()
 
+# 검증된 액세스 토큰 캐시 (sha256(token) -> Principal, 토큰 만료 시각까지 유지)
+VERIFIED_TOKENS = LRUCache(max_size=jwt_config.token_cache_size)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
@@ -26,42 +34,66 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
-def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
+def create_refresh_token(data: dict, jti: str) -> str:
+    """리프레시 토큰 (data 에 sid 포함, jti 는 회전마다 새로 발급)"""
+    to_encode = data.copy()
+    to_encode.update({
+        "type": "refresh",
+        "jti": jti,
+        "exp": datetime.utcnow() + timedelta(days=jwt_config.refresh_expire_day)
+    })
+    return jwt.encode(to_encode, REFRESH_SECRET_KEY, algorithm=ALGORITHM)
+
+def decode_refresh_token(token: str) -> Optional[dict]:
+    try:
+        payload = jwt.decode(token, REFRESH_SECRET_KEY, algorithms=[ALGORITHM])
+    except jwt.InvalidTokenError:
+        return None
+    if payload.get("type") != "refresh" or payload.get("id") is None or payload.get("sid") is None:
+        return None
+    return payload
+
+def decode_access_token(token: str) -> Principal:
+    """
+    액세스 토큰을 검증합니다.
+
+    같은 토큰으로 반복 요청(응시 중 폴링)이 많으므로 검증된 토큰은 sha256 해시를 키로 LRU 에 캐시하고,
+    캐시 유지 시간은 토큰 만료(exp)까지로 제한합니다.
+    """
+    token_key = hashlib.sha256(token.encode()).digest()
+    principal = VERIFIED_TOKENS.get(token_key)
+    if principal is not None:
+        return principal
+
     try:
-        payload = jwt.decode(credentials.credentials, SECRET_KEY, algorithms=[ALGORITHM])
-        id: str = payload.get("id")
-        username: str = payload.get("username")
-        is_admin: bool = payload.get("is_admin")
-        if id is None:
-            raise HTTPException(status_code=401, detail="유효하지 않은 인증 정보")
-        token_data = {"id": id, "username": username, "is_admin": is_admin}
-        return token_data
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="토큰이 만료되었습니다")
     except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="유효하지 않은 토큰")
 
-# async def get_current_user(token_data: dict = Depends(verify_token), db: AsyncSession = Depends(get_async_db)):
-#     user = await db.execute(select(tbl_user).where(tbl_user.id == token_data["id"]))
-#     user = user.scalars().first()
-#     if user is None:
-#         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
-#     return user
-
-def get_current_admin_user(current_user: any = Depends(verify_token)) -> tbl_user:
-    user = tbl_user(
-        id=current_user['id'],
-        username=current_user['username'],
-        is_admin=current_user['is_admin']
-    )
+    id: int = payload.get("id")
+    if id is None:
+        raise HTTPException(status_code=401, detail="유효하지 않은 인증 정보")
+    principal = Principal(id=id, username=payload.get("username"), is_admin=bool(payload.get("is_admin")), sid=payload.get("sid"))
+
+    ttl_sec = payload.get("exp", 0) - time.time()
+    if ttl_sec > 0:
+        VERIFIED_TOKENS.set(token_key, principal, ttl_sec=ttl_sec)
+    return principal
+
+async def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security), session_backend: ICacheBackend = Depends(get_session_backend)) -> Principal:
+    principal = decode_access_token(credentials.credentials)
+
+    # 로그아웃 / 중복 로그인으로 폐기된 세션 (토큰 캐시와 무관하게 매 요청 확인, 세션 저장소 키 조회만 함)
+    if await AuthSessionStore(session_backend).is_revoked(principal.id, principal.sid):
+        raise HTTPException(status_code=401, detail="로그아웃되었거나 다른 곳에서 로그인한 세션입니다")
+    return principal
+
+def get_current_admin_user(user: Principal = Depends(verify_token)) -> Principal:
     if not user.is_admin:
         raise HTTPException(status_code=403, detail="관리자 권한이 필요합니다")
     return user 
 
-def get_current_user(current_user: any = Depends(verify_token)) -> tbl_user:
-    user = tbl_user(
-        id=current_user['id'],
-        username=current_user['username'],
-        is_admin=current_user['is_admin']
-    )
-    return user
\ No newline at end of file
+def get_current_user(user: Principal = Depends(verify_token)) -> Principal:
+    return user
@@ -0,0 +1,65 @@
+from typing import Optional
+from commons.cache.backend import ICacheBackend
+from config.config import jwt_config
+
+
+class AuthSessionStore:
+    """
+    로그인 세션(sid) 폐기 / 중복 로그인 / 리프레시 토큰 회전 상태
+
+    축출이 없는 세션 저장소(provider.get_session_backend)에 저장하며 요청마다 키 조회만 하므로 DB 를 거치지 않습니다.
+    응답 캐시와 분리되어 있어 캐시 항목이 많아져도 폐기 기록이 밀려나지 않습니다.
+    - 폐기 목록(denylist) 방식이라 기록이 없는 세션은 유효합니다.
+      local 백엔드에서는 로그아웃/중복 로그인 차단이 해당 워커에만 적용되고, redis 백엔드면 전체에 적용됩니다.
+    - 리프레시 토큰은 등록된 jti 와 같을 때만 원자적으로 교체하므로, 기록이 없는 세션의 리프레시는 거부됩니다.
+    - check_duplicate 가 켜져 있으면 사용자별 최신 sid 가 아닌 세션은 폐기된 것으로 봅니다.
+    """
+
+    def __init__(self, backend: ICacheBackend):
+        self.backend = backend
+
+    @property
+    def session_ttl_sec(self) -> int:
+        # 세션 관련 키는 리프레시 토큰 만료 이후에는 필요 없음
+        return max(jwt_config.refresh_expire_day * 86400, jwt_config.access_expire_min * 60)
+
+    async def start(self, user_id: int, sid: str, refresh_jti: str) -> None:
+        """로그인 시 새 세션을 등록합니다. (중복 로그인 금지면 이전 세션은 최신 sid 비교로 폐기됨)"""
+        await self.backend.set(self._refresh_key(sid), refresh_jti, self.session_ttl_sec)
+        if jwt_config.check_duplicate:
+            await self.backend.set(self._latest_key(user_id), sid, self.session_ttl_sec)
+
+    async def is_revoked(self, user_id: int, sid: Optional[str]) -> bool:
+        if sid is None:
+            return False
+        if await self.backend.get(self._revoked_key(sid)) is not None:
+            return True
+        if jwt_config.check_duplicate:
+            latest_sid = await self.backend.get(self._latest_key(user_id))
+            return latest_sid is not None and latest_sid != sid
+        return False
+
+    async def rotate_refresh(self, sid: str, refresh_jti: Optional[str], new_refresh_jti: str) -> bool:
+        """
+        리프레시 토큰을 교체합니다.
+
+        등록된 jti 와 비교 후 교체를 한 번에(compare-and-set) 하므로 같은 토큰으로 동시에 요청해도 하나만 성공합니다.
+        이미 교체된(재사용된) 토큰이거나 등록된 기록이 없으면 탈취로 보고 세션을 폐기한 뒤 False 를 반환합니다.
+        """
+        if refresh_jti is not None and await self.backend.compare_and_set(self._refresh_key(sid), refresh_jti, new_refresh_jti, self.session_ttl_sec):
+            return True
+        await self.revoke(sid)
+        return False
+
+    async def revoke(self, sid: str) -> None:
+        await self.backend.set(self._revoked_key(sid), 1, self.session_ttl_sec)
+        await self.backend.delete(self._refresh_key(sid))
+
+    def _revoked_key(self, sid: str) -> str:
+        return f"auth_revoked:{sid}"
+
+    def _refresh_key(self, sid: str) -> str:
+        return f"auth_refresh:{sid}"
+
+    def _latest_key(self, user_id: int) -> str:
+        return f"auth_latest_sid:{user_id}"
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class Principal:
+    """
+    인증된 사용자 (액세스 토큰 클레임)
+
+    요청마다 ORM 엔티티(tbl_user)를 만들지 않도록 id / username / is_admin 만 담는 불변 객체입니다.
+    토큰 검증 캐시에 그대로 저장되어 여러 요청에서 공유되므로 수정할 수 없어야 합니다.
+    """
+    __slots__ = ("id", "username", "is_admin", "sid")
+
+    id: int
+    username: str
+    is_admin: bool
+    # 로그인 세션 ID (로그아웃 / 중복 로그인 폐기 기준, 이전에 발급된 토큰은 None)
+    sid: Optional[str]
@@ -34,6 +34,7 @@ class tbl_quiz(CONTENTS_BASE):
     selected_questions = Column(Integer, default=10)  # 출제할 문제 수
     is_randomized_questions = Column(Boolean, default=False)  # 문제 랜덤 배치 여부
     is_randomized_choices = Column(Boolean, default=False)  # 선택지 랜덤 배치 여부
+    version = Column(Integer, nullable=False, default=1, server_default="1")  # 문제/정답 변경 시 증가 (캐시 무효화 기준)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
@@ -106,6 +107,7 @@ class tbl_quiz_session(CONTENTS_BASE):
     completed_at = Column(DateTime, nullable=True)
     is_completed = Column(Boolean, nullable=False, default=False)
     score = Column(Float, nullable=True)
+    seed = Column(Integer, nullable=True)  # 문제/선택지 랜덤 시드 (랜덤 출제 세션만, 출제 재현용)
     
     # 관계 설정
     quiz = relationship("tbl_quiz", back_populates="sessions")
@@ -0,0 +1,127 @@
+from datetime import datetime
+from typing import Optional
+
+
+class ReadModel:
+    """
+    CRUD 조회 결과 (읽기 전용 DTO)
+
+    dict 대신 __slots__ 객체로 만들어 서비스가 응답 모델에 그대로 넘기고,
+    응답 직렬화(commons.utils.serializer)가 슬롯 순서대로 바로 읽습니다.
+    캐시에 저장되어 여러 요청이 공유할 수 있으므로 만든 뒤에는 수정하지 않습니다.
+    """
+    __slots__ = ()
+
+
+# 퀴즈 상세 조회
+class DetailChoice(ReadModel):
+    __slots__ = ("id", "text", "is_correct")
+
+    def __init__(self, id: int, text: str, is_correct: Optional[bool]):
+        self.id = id
+        self.text = text
+        self.is_correct = is_correct
+
+
+class DetailQuestion(ReadModel):
+    __slots__ = ("id", "question_text", "choices")
+
+    def __init__(self, id: int, question_text: str, choices: list):
+        self.id = id
+        self.question_text = question_text
+        self.choices = choices
+
+
+class QuizDetail(ReadModel):
+    __slots__ = (
+        "quiz_id", "title", "description", "is_randomized_questions", "is_randomized_choices",
+        "selected_questions", "total_questions", "created_at", "updated_at", "created_by", "version",
+        "current_page", "total_pages", "questions_per_page", "next_cursor", "questions"
+    )
+
+    def __init__(self, quiz_id: int, title: str, description: str, is_randomized_questions: bool, is_randomized_choices: bool,
+                 selected_questions: int, total_questions: int, created_at: datetime, updated_at: Optional[datetime],
+                 created_by: str, version: int, current_page: int, total_pages: int, questions_per_page: int,
+                 next_cursor: Optional[str], questions: list):
+        self.quiz_id = quiz_id
+        self.title = title
+        self.description = description
+        self.is_randomized_questions = is_randomized_questions
+        self.is_randomized_choices = is_randomized_choices
+        self.selected_questions = selected_questions
+        self.total_questions = total_questions
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self.created_by = created_by
+        self.version = version
+        self.current_page = current_page
+        self.total_pages = total_pages
+        self.questions_per_page = questions_per_page
+        self.next_cursor = next_cursor
+        self.questions = questions
+
+
+# 퀴즈 응시 세션 조회
+class SessionChoice(ReadModel):
+    __slots__ = ("choice_id", "text")
+
+    def __init__(self, choice_id: int, text: str):
+        self.choice_id = choice_id
+        self.text = text
+
+
+class SessionQuestion(ReadModel):
+    __slots__ = ("question_id", "question_text", "choices", "selected_choice_id")
+
+    def __init__(self, question_id: int, question_text: str, choices: list, selected_choice_id: Optional[int]):
+        self.question_id = question_id
+        self.question_text = question_text
+        self.choices = choices
+        self.selected_choice_id = selected_choice_id
+
+
+class QuizSessionDetail(ReadModel):
+    __slots__ = ("quiz_id", "session_id", "title", "description", "questions", "started_at", "is_completed", "completed_at", "score")
+
+    def __init__(self, quiz_id: int, session_id: str, title: str, description: str, questions: list,
+                 started_at: datetime, is_completed: bool, completed_at: Optional[datetime], score: Optional[float]):
+        self.quiz_id = quiz_id
+        self.session_id = session_id
+        self.title = title
+        self.description = description
+        self.questions = questions
+        self.started_at = started_at
+        self.is_completed = is_completed
+        self.completed_at = completed_at
+        self.score = score
+
+
+# 퀴즈 제출 / 채점 결과
+class SubmitQuestion(ReadModel):
+    __slots__ = ("question_id", "question_text", "selected_choice_id", "selected_choice_text", "correct_choice_id", "correct_choice_text", "is_correct")
+
+    def __init__(self, question_id: int, question_text: str, selected_choice_id: Optional[int], selected_choice_text: Optional[str],
+                 correct_choice_id: Optional[int], correct_choice_text: Optional[str], is_correct: bool):
+        self.question_id = question_id
+        self.question_text = question_text
+        self.selected_choice_id = selected_choice_id
+        self.selected_choice_text = selected_choice_text
+        self.correct_choice_id = correct_choice_id
+        self.correct_choice_text = correct_choice_text
+        self.is_correct = is_correct
+
+
+class QuizSubmitResult(ReadModel):
+    __slots__ = ("quiz_id", "session_id", "title", "total_questions", "correct_answers", "score", "started_at", "completed_at", "questions")
+
+    def __init__(self, quiz_id: int, session_id: str, title: str, total_questions: int, correct_answers: int,
+                 score: float, started_at: datetime, completed_at: datetime, questions: list):
+        self.quiz_id = quiz_id
+        self.session_id = session_id
+        self.title = title
+        self.total_questions = total_questions
+        self.correct_answers = correct_answers
+        self.score = score
+        self.started_at = started_at
+        self.completed_at = completed_at
+        self.questions = questions
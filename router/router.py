@@ -2,9 +2,15 @@ import asyncio
 import os
 from fastapi import FastAPI, Request, APIRouter
 from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import PlainTextResponse
 from typing import Any
 from config.config import web_server_config
+from commons.cache.provider import CACHE_BACKEND, SESSION_BACKEND
 from commons.utils.gtime import GTime
+from commons.utils.metrics import METRICS
+from commons.utils.password import PASSWORD_HASHER
+from crud.answer_buffer import ANSWER_BUFFER
+from db.instrumentation import REQUEST_DB_QUERIES, REQUEST_DB_STATS, RequestDBStats
 import router.v1.auth
 import router.v1.auth.auth
 import router.v1.quiz.quiz
@@ -23,11 +29,49 @@ app = FastAPI(title="Project Quiz System Api Server")
 app.add_middleware(GZipMiddleware, minimum_size=1000)
 
 
+@app.on_event("startup")
+async def startup():
+    # 답안 write-behind 버퍼 주기 반영 시작
+    await ANSWER_BUFFER.start()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    # 남은 답안을 모두 반영한 뒤 종료
+    await ANSWER_BUFFER.stop()
+    await CACHE_BACKEND.close()
+    await SESSION_BACKEND.close()
+    PASSWORD_HASHER.shutdown()
+
+
+@app.middleware("http")
+async def db_stats_middleware(request: Request, call_next):
+    # 요청별 쿼리 수 / DB 시간 집계 (N+1 회귀 탐지용)
+    stats = RequestDBStats()
+    token = REQUEST_DB_STATS.set(stats)
+    try:
+        response = await call_next(request)
+    finally:
+        REQUEST_DB_STATS.reset(token)
+
+    REQUEST_DB_QUERIES.observe(stats.query_count)
+    if web_server_config.debug:
+        response.headers["X-DB-Query-Count"] = str(stats.query_count)
+        response.headers["X-DB-Time-Ms"] = f"{stats.db_time * 1000:.2f}"
+    return response
+
+
 @app.get(path="/healthz", responses={404: {"description": "Not found"}})
 async def healthz():
     return API_SERVER_START_TIME
 
 
+@app.get(path="/metrics", include_in_schema=False)
+async def metrics():
+    # Prometheus 텍스트 포맷
+    return PlainTextResponse(METRICS.render(), media_type="text/plain; version=0.0.4")
+
+
 
 # 퀴즈 라우터 등록
 app.include_router(router.v1.quiz.quiz.router, prefix="/v1")
@@ -7,9 +7,9 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from config.config import jwt_config
 
-from middleware.auth import create_access_token
-from models.quiz import tbl_user
-from router.v1.auth.protocol import Res_AccountRegister, Req_AccountCreate, Req_AccountLogin, Res_AccountLogin
+from middleware.auth import create_access_token, get_current_user
+from models.principal import Principal
+from router.v1.auth.protocol import Res_AccountLogout, Res_AccountRegister, Req_AccountCreate, Req_AccountLogin, Res_AccountLogin, Req_TokenRefresh, Res_TokenRefresh
 from router.v1.validator.dependencies import RemoveNoneResponse
 from services.auth_service import AuthService
 
@@ -35,7 +35,11 @@ async def login(req: Req_AccountLogin, service: AuthService = Depends()):
     
 
 
+@router.post("/refresh", response_model=Res_TokenRefresh, summary="토큰 재발급",description="리프레시 토큰으로 액세스 토큰을 재발급합니다. (리프레시 토큰도 교체)", status_code=status.HTTP_200_OK)
+async def refresh(req: Req_TokenRefresh, service: AuthService = Depends()):
+    return RemoveNoneResponse(await service.refresh(req.refresh_token))
 
 
-
-
+@router.post("/logout", response_model=Res_AccountLogout, summary="로그아웃",description="현재 세션의 토큰을 폐기합니다.", status_code=status.HTTP_200_OK)
+async def logout(service: AuthService = Depends(), user: Principal = Depends(get_current_user)):
+    return RemoveNoneResponse(await service.logout(user))
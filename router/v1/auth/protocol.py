@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Optional
 from pydantic import BaseModel, Field
 
 from commons.models.gmodel import WebPacketProtocol, Res_WebPacketProtocol
@@ -13,10 +14,23 @@ class Req_AccountLogin(AuthProtocol):
 
 class Res_AccountLogin(Res_WebPacketProtocol):
     username: str = ""
-    password: str = ""
+    # 더 이상 응답에 포함하지 않음 (하위 호환용 필드)
+    password: Optional[str] = None
     access_token: str = ""
     refresh_token: str = ""
 
+class Req_TokenRefresh(AuthProtocol):
+    refresh_token: str = Field(..., description="로그인/재발급 응답의 리프레시 토큰")
+
+
+class Res_TokenRefresh(Res_WebPacketProtocol):
+    access_token: str = ""
+    refresh_token: str = ""
+
+
+class Res_AccountLogout(Res_WebPacketProtocol):
+    pass
+
 class Req_AccountCreate(AuthProtocol):
     username: str = Field(..., description="사용자 이름", example="test")
     password: str = Field(..., description="사용자 비밀번호", example="test")
@@ -26,8 +40,9 @@ class Req_AccountCreate(AuthProtocol):
 
 class Res_AccountRegister(Res_WebPacketProtocol):
     username: str = ""
-    password: str = ""
-    created_at: datetime
+    # 더 이상 응답에 포함하지 않음 (하위 호환용 필드)
+    password: Optional[str] = None
+    created_at: Optional[datetime] = None
 
 # class Account(AccountBase):
 #     id: int
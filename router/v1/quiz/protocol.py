@@ -159,6 +159,7 @@ class Res_QuizList(Res_WebPacketProtocol):
     page_size: int = Field(10, description="페이지당 항목 수")
     total_pages: int = Field(0, description="총 페이지 수")
     quizzes: List[QuizListItem] = Field([], description="퀴즈 목록")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서")
     
 class Res_QuizDetail(Res_WebPacketProtocol):
     """퀴즈 상세 조회 응답"""
@@ -180,6 +181,7 @@ class Res_QuizDetail(Res_WebPacketProtocol):
     
     # 문제 목록
     questions: list[Question] = Field(default_factory=list, description="문제 목록")
+    next_cursor: Optional[str] = Field(None, description="다음 문제 페이지 커서")
     
 # 퀴즈 응시 시작 응답
 class QuizSessionChoice(BaseModel):
@@ -252,6 +254,18 @@ class Res_QuizSession(Res_WebPacketProtocol):
     completed_at: Optional[datetime] = Field(None, description="응시 완료 시간")
     score: Optional[int] = Field(None, description="점수 (완료된 경우)")
 
+# 퀴즈 결과 내보내기 응답 (에러 시에만 사용, 성공 시 NDJSON/CSV 스트림)
+class Res_QuizExport(Res_WebPacketProtocol):
+    """퀴즈 결과 내보내기 응답"""
+    quiz_id: Optional[int] = Field(None, description="퀴즈 ID")
+
+# 문제 가져오기 응답
+class Res_QuizImport(Res_WebPacketProtocol):
+    """문제 가져오기 응답"""
+    quiz_id: Optional[int] = Field(None, description="퀴즈 ID")
+    imported_questions: Optional[int] = Field(None, description="추가된 문제 수")
+    imported_choices: Optional[int] = Field(None, description="추가된 선택지 수")
+
 # 퀴즈 답안 저장 요청
 class Req_QuizSaveAnswer(BaseModel):
     """퀴즈 답안 저장 요청"""
@@ -1,15 +1,19 @@
-from fastapi import APIRouter, Depends, status, Path, Query, Body
+from typing import Optional
+from fastapi import APIRouter, Depends, File, Header, Response, UploadFile, status, Path, Query, Body
+from fastapi.responses import StreamingResponse
 
-from models.quiz import tbl_user
-from router.v1.quiz.protocol import Req_Quiz_Update, Req_QuizCreate, Req_QuizSubmit, Res_Quiz_Update, Res_QuizCreate, Res_QuizDelete, Res_QuizList, Res_QuizDetail, Res_QuizStart, Res_QuizSession, Res_QuizSubmit, Res_QuizSaveAnswer, Req_QuizSaveAnswer
+from models.principal import Principal
+from router.v1.quiz.protocol import Req_Quiz_Update, Req_QuizCreate, Req_QuizSubmit, Res_Quiz_Update, Res_QuizCreate, Res_QuizDelete, Res_QuizList, Res_QuizDetail, Res_QuizExport, Res_QuizImport, Res_QuizStart, Res_QuizSession, Res_QuizSubmit, Res_QuizSaveAnswer, Req_QuizSaveAnswer
 from router.v1.validator.dependencies import RemoveNoneResponse
-from services.quiz_service import QuizService
+from commons.utils.enums import ErrorType
+from commons.utils.question_import import guess_import_format
+from services.quiz_service import EXPORT_MEDIA_TYPES, QuizService
 from middleware.auth import get_current_admin_user, get_current_user
 
 router = APIRouter(prefix="/quiz", tags=["퀴즈"], responses={404: {"description": "Not found"}})
 
 @router.post(path="/create", response_model=Res_QuizCreate, summary="퀴즈 생성", description="퀴즈를 생성합니다.", status_code=status.HTTP_201_CREATED)
-async def create_quiz(req: Req_QuizCreate, service: QuizService = Depends(), user: tbl_user = Depends(get_current_admin_user)):
+async def create_quiz(req: Req_QuizCreate, service: QuizService = Depends(), user: Principal = Depends(get_current_admin_user)):
     """
     관리자만 퀴즈를 생성할 수 있습니다.
     """
@@ -17,47 +21,96 @@ async def create_quiz(req: Req_QuizCreate, service: QuizService = Depends(), use
 
 # TODO 쿼리문으로 받자. 그럴려면 create시 select 받아야함.
 @router.post("/update", response_model=Res_Quiz_Update, summary="퀴즈 수정", description="퀴즈를 수정합니다.", status_code=status.HTTP_200_OK)
-async def update_quiz(req: Req_Quiz_Update, service: QuizService = Depends(), user: tbl_user = Depends(get_current_admin_user)):
+async def update_quiz(req: Req_Quiz_Update, service: QuizService = Depends(), user: Principal = Depends(get_current_admin_user)):
     """
     관리자만 퀴즈를 수정할 수 있습니다.
     """
     return RemoveNoneResponse(await service.update_quiz(req, user))
 
 @router.delete("/delete/{quiz_id}", response_model=Res_QuizDelete, summary="퀴즈 삭제", description="퀴즈를 삭제합니다.", status_code=status.HTTP_200_OK)
-async def delete_quiz(quiz_id: int, service: QuizService = Depends(), user: tbl_user = Depends(get_current_admin_user)):
+async def delete_quiz(quiz_id: int, service: QuizService = Depends(), user: Principal = Depends(get_current_admin_user)):
     """
     관리자만 퀴즈를 삭제할 수 있습니다.
     """
     return RemoveNoneResponse(await service.delete_quiz(quiz_id, user))
 
+@router.post("/{quiz_id}/import", response_model=Res_QuizImport, summary="문제 가져오기", description="NDJSON / CSV 파일의 문제를 퀴즈에 추가합니다.", status_code=status.HTTP_200_OK)
+async def import_questions(quiz_id: int = Path(..., description="퀴즈 ID", ge=1), file: UploadFile = File(..., description="문제 파일 (.ndjson / .csv)"), import_format: Optional[str] = Query(None, alias="format", pattern="^(ndjson|csv)$", description="ndjson 또는 csv (생략 시 파일 확장자로 판단)"), service: QuizService = Depends(), user: Principal = Depends(get_current_admin_user)):
+    """
+    관리자만 문제를 가져올 수 있습니다.
+
+    - **ndjson**: 한 줄에 문제 하나, `{"question_text": "...", "choices": [{"text": "...", "is_correct": true}, ...]}`
+    - **csv**: 헤더 행 다음에 한 행에 문제 하나, `question_text, correct_choice(정답 번호, 1부터), choice_1, choice_2, ...`
+    
+    문제 생성과 같은 규칙(선택지 2개 이상, 정답 정확히 하나)으로 검증하며, 잘못된 행이 있으면 아무것도 추가하지 않고 행 번호를 msg 로 반환합니다.
+    """
+    import_format = import_format or guess_import_format(file.filename)
+    if import_format is None:
+        res = Res_QuizImport(quiz_id=quiz_id, msg="format 을 지정하거나 .ndjson / .csv 파일을 올려주세요")
+        res.result.SetResult(ErrorType.INVALID_IMPORT_ROW)
+        return RemoveNoneResponse(res)
+
+    return RemoveNoneResponse(await service.import_questions(quiz_id, file, import_format, user))
+
 @router.get("/list/{page}/{page_size}", response_model=Res_QuizList, summary="퀴즈 목록 조회", description="퀴즈 목록을 조회합니다.", status_code=status.HTTP_200_OK)
-async def get_quiz_list(page: int = Path(..., description="페이지 번호", ge=1), page_size: int = Path(..., description="페이지 크기", ge=1), service: QuizService = Depends(), user: tbl_user = Depends(get_current_admin_user)):
+async def get_quiz_list(page: int = Path(..., description="페이지 번호", ge=1), page_size: int = Path(..., description="페이지 크기", ge=1), cursor: Optional[str] = Query(None, description="다음 페이지 커서 (지정 시 page 대신 사용)"), service: QuizService = Depends(), user: Principal = Depends(get_current_admin_user)):
     """
     퀴즈 목록을 조회할 수 있습니다.
+
+    - **cursor**: 이전 응답의 next_cursor 를 지정하면 키셋 방식으로 다음 페이지를 조회합니다.
     """
-    return RemoveNoneResponse(await service.get_quiz_list(page, page_size, user))
+    return RemoveNoneResponse(await service.get_quiz_list(page, page_size, user, cursor))
 
-@router.get("/{quiz_id}", response_model=Res_QuizDetail, summary="퀴즈 상세 조회", description="퀴즈 상세 조회", status_code=status.HTTP_200_OK)
-async def get_quiz_detail(quiz_id: int = Path(..., description="퀴즈 ID", ge=1), page: int = Query(1, description="페이지 번호", ge=1), service: QuizService = Depends(), user: tbl_user = Depends(get_current_user)):
+@router.get("/{quiz_id}/export", response_model=Res_QuizExport, summary="퀴즈 결과 내보내기", description="퀴즈의 모든 응시 세션과 문제별 결과를 NDJSON / CSV 로 내보냅니다.", status_code=status.HTTP_200_OK, responses={200: {"content": {"application/x-ndjson": {}, "text/csv": {}}}})
+async def export_quiz_results(quiz_id: int = Path(..., description="퀴즈 ID", ge=1), export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$", description="ndjson 또는 csv"), service: QuizService = Depends(), user: Principal = Depends(get_current_admin_user)):
+    """
+    관리자만 퀴즈 결과를 내보낼 수 있습니다.
+
+    - **quiz_id**: 퀴즈 ID
+    - **format**: ndjson (기본값, 한 줄에 세션 x 문제 결과 하나) 또는 csv
+    
+    결과 크기와 무관하게 서버 측 커서로 일정 행 수씩 읽어 바로 전송합니다.
+    """
+    res, body = await service.export_quiz_results(quiz_id, export_format, user)
+    if body is None:
+        return RemoveNoneResponse(res)
+
+    filename = f"quiz_{quiz_id}_results.{export_format}"
+    return StreamingResponse(body, media_type=EXPORT_MEDIA_TYPES[export_format], headers={"Content-Disposition": f'attachment; filename="{filename}"'})
+
+@router.get("/{quiz_id}", response_model=Res_QuizDetail, summary="퀴즈 상세 조회", description="퀴즈 상세 조회", status_code=status.HTTP_200_OK, responses={304: {"description": "Not modified"}})
+async def get_quiz_detail(quiz_id: int = Path(..., description="퀴즈 ID", ge=1), page: int = Query(1, description="페이지 번호", ge=1), cursor: Optional[str] = Query(None, description="다음 문제 페이지 커서 (지정 시 page 대신 사용)"), if_none_match: Optional[str] = Header(None), service: QuizService = Depends(), user: Principal = Depends(get_current_user)):
     """
     퀴즈 상세 정보를 조회합니다.
     
     - **quiz_id**: 조회할 퀴즈 ID
     - **page**: 문제 페이지 번호 (기본값: 1)
+    - **cursor**: 이전 응답의 next_cursor (키셋 페이지네이션)
+    - **If-None-Match**: 이전 응답의 ETag, 퀴즈가 바뀌지 않았으면 304 를 반환합니다.
     """
-    return RemoveNoneResponse(await service.get_quiz_detail(quiz_id, page, user))
+    res, etag = await service.get_quiz_detail(quiz_id, page, user, cursor, if_none_match)
+    if res is None:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, "Cache-Control": "private, no-cache"})
+
+    response = RemoveNoneResponse(res)
+    if etag is not None:
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "private, no-cache"
+    return response
 
 @router.post("/{quiz_id}/start", response_model=Res_QuizStart, summary="퀴즈 응시 시작", description="퀴즈 응시를 시작합니다.", status_code=status.HTTP_200_OK)
-async def start_quiz(quiz_id: int = Path(..., description="퀴즈 ID", ge=1), service: QuizService = Depends(), user: tbl_user = Depends(get_current_user)):
+async def start_quiz(quiz_id: int = Path(..., description="퀴즈 ID", ge=1), seed: Optional[int] = Query(None, description="문제/선택지 랜덤 시드 (관리자 전용, 감사용 재현)", ge=0, le=2147483647), service: QuizService = Depends(), user: Principal = Depends(get_current_user)):
     """
     퀴즈 응시를 시작합니다.
     
     - **quiz_id**: 응시할 퀴즈 ID
+    - **seed**: 같은 시드와 문제 은행이면 같은 문제/선택지 순서가 출제됩니다. (관리자 전용)
+      지정하지 않으면 랜덤 출제 세션마다 새 시드를 만들어 세션(tbl_quiz_session.seed)에 저장합니다.
     """
-    return RemoveNoneResponse(await service.start_quiz(quiz_id, user))
+    return RemoveNoneResponse(await service.start_quiz(quiz_id, user, seed))
 
 @router.get("/session/{session_id}", response_model=Res_QuizSession, summary="퀴즈 응시 상태 조회", description="퀴즈 응시 상태를 조회합니다.", status_code=status.HTTP_200_OK)
-async def get_quiz_session(session_id: str = Path(..., description="세션 ID"), service: QuizService = Depends(), user: tbl_user = Depends(get_current_user)):
+async def get_quiz_session(session_id: str = Path(..., description="세션 ID"), service: QuizService = Depends(), user: Principal = Depends(get_current_user)):
     """
     퀴즈 응시 상태를 조회합니다.
     
@@ -66,7 +119,7 @@ async def get_quiz_session(session_id: str = Path(..., description="세션 ID"),
     return RemoveNoneResponse(await service.get_quiz_session(session_id, user))
 
 @router.post("/session/answer", response_model=Res_QuizSaveAnswer, summary="퀴즈 답안 저장", description="퀴즈 답안을 저장합니다.", status_code=status.HTTP_200_OK)
-async def save_quiz_answer(req: Req_QuizSaveAnswer = Body(...), service: QuizService = Depends(), user: tbl_user = Depends(get_current_user)):
+async def save_quiz_answer(req: Req_QuizSaveAnswer = Body(...), service: QuizService = Depends(), user: Principal = Depends(get_current_user)):
     """
     퀴즈 답안을 저장합니다.
     
@@ -77,7 +130,7 @@ async def save_quiz_answer(req: Req_QuizSaveAnswer = Body(...), service: QuizSer
     return RemoveNoneResponse(await service.save_quiz_answer(req, user))
 
 @router.post("/session/submit", response_model=Res_QuizSubmit, summary="퀴즈 답안 제출", description="퀴즈 답안을 제출하고 채점합니다.", status_code=status.HTTP_200_OK)
-async def submit_quiz(req: Req_QuizSubmit = Body(...), service: QuizService = Depends(), user: tbl_user = Depends(get_current_user)):
+async def submit_quiz(req: Req_QuizSubmit = Body(...), service: QuizService = Depends(), user: Principal = Depends(get_current_user)):
     """
     퀴즈 답안을 제출하고 채점합니다.
     
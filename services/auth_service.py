@@ -1,14 +1,20 @@
 
+import uuid
 from datetime import timedelta
 from fastapi import Depends
 from pydantic import with_config
 from sqlalchemy import Tuple
+from commons.cache.backend import ICacheBackend
+from commons.cache.provider import get_cache, get_session_backend
 from commons.utils.enums import ErrorType
+from commons.utils.password import PASSWORD_HASHER
 from crud.auth_crud import AuthCRUD, IAuthCRUD
-from db.database import DB_SESSION_MNG
-from middleware.auth import create_access_token
-from models.quiz import tbl_user
-from router.v1.auth.protocol import Res_AccountLogin, Res_AccountRegister
+from crud.user_cache import UserCache, UserRecord
+from db.database import get_async_db
+from middleware.auth import create_access_token, create_refresh_token, decode_refresh_token
+from middleware.session_store import AuthSessionStore
+from models.principal import Principal
+from router.v1.auth.protocol import Res_AccountLogin, Res_AccountLogout, Res_AccountRegister, Res_TokenRefresh
 from sqlalchemy.ext.asyncio import AsyncSession
 from config.config import jwt_config
 
@@ -16,66 +22,96 @@ class AuthService:
     def __init__(
         self,
         auth_crud: IAuthCRUD = Depends(AuthCRUD),
+        db: AsyncSession = Depends(get_async_db),
+        cache: ICacheBackend = Depends(get_cache),
+        session_backend: ICacheBackend = Depends(get_session_backend),
     ):
         self.auth_crud = auth_crud
+        self.db = db
+        self.session_store = AuthSessionStore(session_backend)
+        self.user_cache = UserCache(cache, auth_crud)
 
     async def create_user(self, username: str, password: str, is_admin: bool) -> Res_AccountRegister:
         res = Res_AccountRegister()
 
-        user, err_type = await DB_SESSION_MNG.execute_lambda(lambda s: self.auth_crud.get_user(s, username))
-        if err_type != ErrorType.SUCCESS:
-            res.result.SetResult(ErrorType.USER_NOT_EXISTS)
-            return res  
-
-        if user:
+        # 캐시에 있는 사용자면 해시 계산 없이 바로 중복 처리 (DB 조회는 하지 않음)
+        if await self.user_cache.get_cached(username) is not None:
             res.result.SetResult(ErrorType.USER_ALREADY_EXISTS)
             return res  
         
-        # 새 사용자 생성
-        new_user = tbl_user(
-            username=username, 
-            password=password, 
-            is_admin=is_admin
-        )
-        err = await self.auth_crud.create_user(new_user)
-        if err != ErrorType.SUCCESS:
-            res.result.SetResult(ErrorType.DB_RUN_FAILED)
+        # 새 사용자 생성 (비밀번호는 해시로 저장, 중복 확인은 INSERT 한 번으로)
+        password_hash = await PASSWORD_HASHER.hash(password)
+        new_user, err_type = await self.auth_crud.create_user(self.db, username, password_hash, is_admin)
+        if err_type != ErrorType.SUCCESS:
+            res.result.SetResult(err_type)
             return res
+
+        await self.user_cache.set(username, UserRecord(new_user.id, new_user.username, password_hash, new_user.is_admin))
         
         res.username = new_user.username
-        res.password = new_user.password
         res.created_at = new_user.created_at
 
         return res
 
     async def login(self, username: str, password: str) -> Res_AccountLogin:
         res = Res_AccountLogin()
-        user, err_type = await DB_SESSION_MNG.execute_lambda(lambda s: self.auth_crud.get_user(s, username))
+        user, err_type = await self.user_cache.get(self.db, username)
         if err_type != ErrorType.SUCCESS:
             res.result.SetResult(ErrorType.USER_NOT_EXISTS)
             return res  
         
-        # 사용자 존재여부 확인, 패스워드 체크
-        if not user or user.password != password:
+        # 사용자 존재여부 확인, 패스워드 체크 (스레드 풀에서 검증)
+        if not user:
             res.result.SetResult(ErrorType.INVALID_PASSWORD)
             return res
+
+        is_valid, new_password_hash = await PASSWORD_HASHER.verify(password, user.password)
+        if not is_valid:
+            res.result.SetResult(ErrorType.INVALID_PASSWORD)
+            return res
+
+        # 평문/이전 스킴으로 저장된 비밀번호는 새 해시로 교체 (실패해도 로그인은 진행)
+        if new_password_hash is not None:
+            if await self.auth_crud.update_password(self.db, user.id, new_password_hash) == ErrorType.SUCCESS:
+                await self.user_cache.set(username, UserRecord(user.id, user.username, new_password_hash, user.is_admin))
         
-        # 액세스 토큰 생성
-        access_token_expires = timedelta(minutes=jwt_config.access_expire_min)
-        access_token = create_access_token(
-            data={"username": user.username, "id": user.id, "is_admin": user.is_admin},
-            expires_delta=access_token_expires
-        )
-
-        # refresh_token_expires = timedelta(minutes=jwt_config.refresh_expire_min)
-        # refresh_token = create_refresh_token(
-        #     data={"username": user.username, "id": user.id, "is_admin": user.is_admin},
-        #     expires_delta=refresh_token_expires
-        # )
-    
-        res.access_token = access_token
-        res.refresh_token = "refresh_token"
+        # 로그인 세션 생성 후 액세스 / 리프레시 토큰 발급
+        sid = uuid.uuid4().hex
+        refresh_jti = uuid.uuid4().hex
+        await self.session_store.start(user.id, sid, refresh_jti)
+
+        claims = {"username": user.username, "id": user.id, "is_admin": user.is_admin, "sid": sid}
+        res.access_token = create_access_token(data=claims, expires_delta=timedelta(minutes=jwt_config.access_expire_min))
+        res.refresh_token = create_refresh_token(claims, refresh_jti)
         res.username = user.username
-        res.password = user.password
 
         return res
+
+    async def refresh(self, refresh_token: str) -> Res_TokenRefresh:
+        """
+        리프레시 토큰으로 액세스 토큰을 재발급합니다.
+        리프레시 토큰도 함께 교체(회전)하며, 이미 사용된 리프레시 토큰이 다시 오면 세션을 폐기합니다.
+        """
+        res = Res_TokenRefresh()
+
+        payload = decode_refresh_token(refresh_token)
+        if payload is None or await self.session_store.is_revoked(payload["id"], payload["sid"]):
+            res.result.SetResult(ErrorType.INVALID_TOKEN)
+            return res
+
+        new_refresh_jti = uuid.uuid4().hex
+        if not await self.session_store.rotate_refresh(payload["sid"], payload.get("jti"), new_refresh_jti):
+            res.result.SetResult(ErrorType.INVALID_TOKEN)
+            return res
+
+        claims = {"username": payload.get("username"), "id": payload["id"], "is_admin": payload.get("is_admin"), "sid": payload["sid"]}
+        res.access_token = create_access_token(data=claims, expires_delta=timedelta(minutes=jwt_config.access_expire_min))
+        res.refresh_token = create_refresh_token(claims, new_refresh_jti)
+        return res
+
+    async def logout(self, user: Principal) -> Res_AccountLogout:
+        """현재 로그인 세션의 액세스 / 리프레시 토큰을 폐기합니다."""
+        res = Res_AccountLogout()
+        if user.sid is not None:
+            await self.session_store.revoke(user.sid)
+        return res
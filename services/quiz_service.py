@@ -1,78 +1,71 @@
-from typing import List, Optional, Dict, Any, Tuple
-from fastapi import Depends, HTTPException
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
+from fastapi import Depends, HTTPException, UploadFile
 from datetime import datetime
+import csv
+import io
 import random
+import orjson
 
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
+from commons.cache.backend import ICacheBackend
+from commons.cache.provider import get_cache
 from commons.utils.enums import ErrorType
+from commons.utils.question_import import iter_question_chunks
+from crud.answer_buffer import ANSWER_BUFFER
 from crud.quiz_crud import IQuizCRUD, QuizCRUD
-from db.database import DB_SESSION_MNG
-from models.quiz import tbl_user
-from router.v1.quiz.protocol import Choice, Question, Req_Quiz_Update, Req_QuizCreate, Req_QuizSaveAnswer, Req_QuizSubmit,  Res_Quiz_Update, Res_QuizCreate, Res_QuizDelete, Res_QuizList, Res_QuizDetail, QuizListItem, Res_QuizSaveAnswer, Res_QuizSession, Res_QuizStart, Res_QuizSubmit
+from config.config import quiz_config
+from crud.quiz_detail_cache import QuizDetailCache, etag_matches, quiz_detail_etag
+from crud.statements import QUIZ_RESULTS_EXPORT_STMT
+from db.database import DB_SESSION_MNG, get_async_db
+from models.principal import Principal
+from models.read_models import DetailChoice, DetailQuestion, QuizDetail
+from router.v1.quiz.protocol import Choice, Question, Req_Quiz_Update, Req_QuizCreate, Req_QuizSaveAnswer, Req_QuizSubmit,  Res_Quiz_Update, Res_QuizCreate, Res_QuizDelete, Res_QuizList, Res_QuizDetail, Res_QuizExport, Res_QuizImport, QuizListItem, Res_QuizSaveAnswer, Res_QuizSession, Res_QuizStart, Res_QuizSubmit
 from sqlalchemy.ext.asyncio import AsyncSession
 # from schemas.quiz import QuizCreate, QuizUpdate, QuestionCreate, Quiz, Question, Choice
 
 security = HTTPBearer()
 
+# 결과 내보내기 컬럼 (CSV 헤더 / NDJSON 키)
+EXPORT_COLUMNS = tuple(QUIZ_RESULTS_EXPORT_STMT.selected_columns.keys())
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
 class QuizService:
     def __init__(self, 
                  credentials: HTTPAuthorizationCredentials = Depends(security),
                  quiz_crud: IQuizCRUD = Depends(QuizCRUD),
+                 db: AsyncSession = Depends(get_async_db),
+                 cache: ICacheBackend = Depends(get_cache),
                  ):
         self.credentials = credentials
         self.quiz_crud = quiz_crud 
-    async def create_quiz(self, req: Req_QuizCreate, user: tbl_user) -> Res_QuizCreate:
+        self.db = db
+        self.detail_cache = QuizDetailCache(cache)
+    async def create_quiz(self, req: Req_QuizCreate, user: Principal) -> Res_QuizCreate:
         res = Res_QuizCreate()
 
         if not user.is_admin:
             res.result.SetResult(ErrorType.NOT_ADMIN)
             return res
 
-        quiz, err_type = await DB_SESSION_MNG.execute_lambda(lambda s: self.quiz_crud.create_quiz(s, req, user.id))
+        quiz_data, err_type = await self.quiz_crud.create_quiz(self.db, req, user.id)
         if err_type != ErrorType.SUCCESS:
             res.result.SetResult(ErrorType.DB_RUN_FAILED)
             return res
         
-        default_choices = [Choice(text="임시 선택지 1", is_correct=True), Choice(text="임시 선택지 2", is_correct=False)]
-        
-        res.quiz_id = quiz.id
+        res.quiz_id = quiz_data.get("quiz_id")
         res.user_id = user.id
-        res.title = quiz.title
-        res.description = quiz.description
-        res.is_randomized_questions = quiz.is_randomized_questions
-        res.is_randomized_choices = quiz.is_randomized_choices
-        res.selected_questions = quiz.selected_questions
-        res.questions = []
-        
-        for question in quiz.questions:
-            question_data = {
-                "id": question.id,
-                "question_text": question.question_text,
-                "choices": []
-            }   
-            
-            # 기존 선택지가 있으면 기본 선택지를 대체
-            if hasattr(question, 'choices') and question.choices:
-                choices_list = []
-                for choice in question.choices:
-                    choice_data = {
-                        "id": choice.id,
-                        "text": choice.content,
-                        "is_correct": choice.is_correct
-                    }
-                    choices_list.append(choice_data)
-                
-                # 선택지가 2개 이상이면 기본 선택지 대신 사용
-                if len(choices_list) >= 2:
-                    question_data["choices"] = choices_list
-            
-            res.questions.append(question_data)
+        res.title = quiz_data.get("title")
+        res.description = quiz_data.get("description")
+        res.is_randomized_questions = quiz_data.get("is_randomized_questions")
+        res.is_randomized_choices = quiz_data.get("is_randomized_choices")
+        res.selected_questions = quiz_data.get("selected_questions")
+        res.questions = quiz_data.get("questions", [])
         
         res.result.SetResult(ErrorType.SUCCESS)
         return res
     
-    async def update_quiz(self, req: Req_Quiz_Update, user: tbl_user) -> Res_Quiz_Update:
+    async def update_quiz(self, req: Req_Quiz_Update, user: Principal) -> Res_Quiz_Update:
         res = Res_Quiz_Update()
 
         if not user.is_admin:
@@ -80,7 +73,7 @@ class QuizService:
             return res
 
         # 퀴즈 존재 확인
-        quiz, err_type = await DB_SESSION_MNG.execute_lambda(lambda s: self.quiz_crud.get_quiz_by_id(s, req.id))
+        quiz, err_type = await self.quiz_crud.get_quiz_by_id(self.db, req.id)
         if err_type != ErrorType.SUCCESS:
             res.result.SetResult(ErrorType.DB_RUN_FAILED)
             return res
@@ -89,7 +82,7 @@ class QuizService:
             res.result.SetResult(ErrorType.QUIZ_NOT_FOUND)
             return res
         
-        err_type = await DB_SESSION_MNG.execute_lambda(lambda s: self.quiz_crud.update_quiz(s, quiz, req))
+        err_type = await self.quiz_crud.update_quiz(self.db, quiz, req)
         if err_type != ErrorType.SUCCESS:
             res.result.SetResult(ErrorType.DB_RUN_FAILED)
             return res  
@@ -97,7 +90,7 @@ class QuizService:
         res.result.SetResult(ErrorType.SUCCESS)
         return res
 
-    async def delete_quiz(self, quiz_id: int, user: tbl_user) -> Res_QuizDelete:
+    async def delete_quiz(self, quiz_id: int, user: Principal) -> Res_QuizDelete:
         res = Res_QuizDelete()
 
         if not user.is_admin:
@@ -105,7 +98,7 @@ class QuizService:
             return res
 
         # 퀴즈 존재 확인
-        err_type = await DB_SESSION_MNG.execute_lambda(lambda s: self.quiz_crud.delete_quiz(s, quiz_id, user.id))
+        err_type = await self.quiz_crud.delete_quiz(self.db, quiz_id, user.id)
         if err_type != ErrorType.SUCCESS:
             res.result.SetResult(err_type)
             return res
@@ -113,15 +106,19 @@ class QuizService:
         res.result.SetResult(ErrorType.SUCCESS)
         return res
     
-    async def get_quiz_list(self, page: int, page_size: int, user: tbl_user) -> Res_QuizList:
+    async def get_quiz_list(self, page: int, page_size: int, user: Principal, cursor: Optional[str] = None) -> Res_QuizList:
         """퀴즈 목록을 조회합니다."""
         res = Res_QuizList()
         
         # 페이지네이션 파라미터 사용
-        quiz_data, err_type = await DB_SESSION_MNG.execute_lambda(
-            lambda s: self.quiz_crud.get_quiz_list(s, page, page_size, user)
+        quiz_data, err_type = await DB_SESSION_MNG.execute_read(
+            self.db, lambda s: self.quiz_crud.get_quiz_list(s, page, page_size, user, cursor)
         )
         
+        if err_type == ErrorType.INVALID_CURSOR:
+            res.result.SetResult(err_type)
+            return res
+
         if err_type != ErrorType.SUCCESS:
             res.result.SetResult(ErrorType.DB_RUN_FAILED)
             return res
@@ -131,6 +128,7 @@ class QuizService:
         res.page = page
         res.page_size = page_size
         res.total_pages = quiz_data.get("total_pages", 0)
+        res.next_cursor = quiz_data.get("next_cursor")
         
         # 퀴즈 목록 설정
         res.quizzes = []
@@ -160,74 +158,110 @@ class QuizService:
         res.result.SetResult(ErrorType.SUCCESS)
         return res
 
-    async def get_quiz_detail(self, quiz_id: int, page: int, user: tbl_user) -> Res_QuizDetail:
-        """퀴즈 상세 정보를 조회합니다."""
+    async def get_quiz_detail(self, quiz_id: int, page: int, user: Principal, cursor: Optional[str] = None, if_none_match: Optional[str] = None) -> Tuple[Optional[Res_QuizDetail], Optional[str]]:
+        """
+        퀴즈 상세 정보를 조회합니다.
+
+        먼저 primary 에서 tbl_quiz.version 을 확인하고, 캐시 키와 ETag 를 그 버전으로 만듭니다.
+        그래서 다른 워커에서 수정된 퀴즈도 이전 본문이나 304 로 응답하지 않습니다.
+        응답 데이터(선택지 섞기 전)는 캐시 백엔드에 저장하며, 동시 미스는 한 번만 조회합니다.
+        if_none_match 가 현재 ETag 와 같으면 상세 조회 없이 (None, ETag) 를 반환합니다. (304)
+
+        Returns:
+            응답, ETag
+        """
         res = Res_QuizDetail()
-        
-        # 퀴즈 상세 정보 조회
-        quiz_data, err_type = await DB_SESSION_MNG.execute_lambda(lambda s: self.quiz_crud.get_quiz_detail(s, quiz_id, page, user))
+
+        version, err_type = await self.quiz_crud.get_quiz_version(self.db, quiz_id)
         if err_type != ErrorType.SUCCESS:
             res.result.SetResult(err_type)
-            return res
-        
-        if not quiz_data:
-            res.result.SetResult(ErrorType.QUIZ_NOT_FOUND)
-            return res
-        
-        # 기본 퀴즈 정보 설정
-        res.quiz_id = quiz_data.get("quiz_id")
-        res.title = quiz_data.get("title")
-        res.description = quiz_data.get("description")
-        res.is_randomized_questions = quiz_data.get("is_randomized_questions")
-        res.is_randomized_choices = quiz_data.get("is_randomized_choices")
-        res.selected_questions = quiz_data.get("selected_questions")
-        res.total_questions = quiz_data.get("total_questions")
-        res.created_at = quiz_data.get("created_at")
-        res.updated_at = quiz_data.get("updated_at")
-        res.created_by = quiz_data.get("created_by")
-        
-        # 페이징 정보 설정
-        res.current_page = page
-        res.total_pages = quiz_data.get("total_pages")
-        res.questions_per_page = quiz_data.get("questions_per_page")
-        
-        # 문제 목록 설정
-        res.questions = []
-        for question_data in quiz_data.get("questions", []):
-            question = {
-                "id": question_data.get("id"),
-                "question_text": question_data.get("question_text"),
-                "choices": []
-            }
-            
-            # 선택지 설정
-            for choice_data in question_data.get("choices", []):
-                choice = {
-                    "id": choice_data.get("id"),
-                    "text": choice_data.get("text"),
-                    "is_correct": choice_data.get("is_correct") if user.is_admin else None  # 관리자만 정답 확인 가능
-                }
-                question["choices"].append(choice)
-            
-            # 선택지 순서 랜덤화 (설정된 경우)
-            if quiz_data.get("is_randomized_choices"):
-                random.shuffle(question["choices"])
-            
-            res.questions.append(question)
+            return res, None
+
+        etag = quiz_detail_etag(quiz_id, version, user.is_admin)
+        if etag_matches(if_none_match, etag):
+            return None, etag
+
+        async def load_detail():
+            # 퀴즈 상세 정보 조회 (복제본)
+            quiz_data, err_type = await DB_SESSION_MNG.execute_read(self.db, lambda s: self.quiz_crud.get_quiz_detail(s, quiz_id, page, user, cursor))
+            if err_type == ErrorType.SUCCESS and quiz_data and quiz_data.version != version:
+                # 복제본이 아직 이전 버전이면 이전 본문을 새 버전 키로 캐시하지 않도록 primary 에서 다시 조회
+                quiz_data, err_type = await self.quiz_crud.get_quiz_detail(self.db, quiz_id, page, user, cursor)
+            if err_type != ErrorType.SUCCESS:
+                return None, err_type
+            if not quiz_data:
+                return None, ErrorType.QUIZ_NOT_FOUND
+            return self._build_quiz_detail(quiz_data, user.is_admin), ErrorType.SUCCESS
+
+        detail, err_type = await self.detail_cache.get_or_load(quiz_id, version, page, cursor, user.is_admin, load_detail)
+        if err_type != ErrorType.SUCCESS:
+            res.result.SetResult(err_type)
+            return res, None
+
+        # 기본 퀴즈 정보 / 페이징 정보 설정
+        res.quiz_id = detail.quiz_id
+        res.title = detail.title
+        res.description = detail.description
+        res.is_randomized_questions = detail.is_randomized_questions
+        res.is_randomized_choices = detail.is_randomized_choices
+        res.selected_questions = detail.selected_questions
+        res.total_questions = detail.total_questions
+        res.created_at = detail.created_at
+        res.updated_at = detail.updated_at
+        res.created_by = detail.created_by
+        res.current_page = detail.current_page
+        res.total_pages = detail.total_pages
+        res.questions_per_page = detail.questions_per_page
+        res.next_cursor = detail.next_cursor
+
+        # 문제 목록 설정 (캐시된 객체는 수정하지 않고, 선택지를 섞을 때만 문제 객체를 새로 만듦)
+        if detail.is_randomized_choices:
+            res.questions = [
+                DetailQuestion(question.id, question.question_text, random.sample(question.choices, len(question.choices)))
+                for question in detail.questions
+            ]
+        else:
+            res.questions = detail.questions
         
         res.result.SetResult(ErrorType.SUCCESS)
-        return res
+        return res, etag
+
+    def _build_quiz_detail(self, quiz_data: QuizDetail, is_admin: bool) -> QuizDetail:
+        """CRUD 조회 결과를 캐시할 응답 데이터로 변환합니다. (관리자만 정답 확인 가능)"""
+        if is_admin:
+            return quiz_data
+
+        # ReadModel 은 수정하지 않으므로 정답을 뺀 문제 목록으로 새 객체를 만듦
+        questions = [
+            DetailQuestion(
+                question.id,
+                question.question_text,
+                [DetailChoice(choice.id, choice.text, None) for choice in question.choices]
+            )
+            for question in quiz_data.questions
+        ]
+        return QuizDetail(
+            quiz_data.quiz_id, quiz_data.title, quiz_data.description, quiz_data.is_randomized_questions,
+            quiz_data.is_randomized_choices, quiz_data.selected_questions, quiz_data.total_questions,
+            quiz_data.created_at, quiz_data.updated_at, quiz_data.created_by, quiz_data.version,
+            quiz_data.current_page, quiz_data.total_pages, quiz_data.questions_per_page, quiz_data.next_cursor,
+            questions
+        )
     
-    async def start_quiz(self, quiz_id: int, user: tbl_user) -> Res_QuizStart:
+    async def start_quiz(self, quiz_id: int, user: Principal, seed: Optional[int] = None) -> Res_QuizStart:
         """퀴즈 응시를 시작합니다."""
         res = Res_QuizStart()
         
         if not user:
             res.result.SetResult(ErrorType.NOT_AUTHORIZED)
             return res
+
+        # 출제 재현용 시드는 관리자(감사)만 지정 가능
+        if not user.is_admin:
+            seed = None
         
         # 퀴즈 응시 세션 시작
-        session_data, err_type = await DB_SESSION_MNG.execute_lambda(lambda s: self.quiz_crud.start_quiz_session(s, quiz_id, user.id))
+        session_data, err_type = await self.quiz_crud.start_quiz_session(self.db, quiz_id, user.id, seed)
         if err_type != ErrorType.SUCCESS:
             res.result.SetResult(err_type)
             return res
@@ -237,28 +271,20 @@ class QuizService:
             return res
         
         # 응답 설정
-        res.quiz_id = session_data.get("quiz_id")
-        res.session_id = session_data.get("session_id")
-        res.title = session_data.get("title")
-        res.description = session_data.get("description")
-        res.started_at = session_data.get("started_at")
-        res.is_completed = session_data.get("is_completed")
-        
-        # 문제 목록 설정
-        res.questions = []
-        for question_data in session_data.get("questions", []):
-            question = {
-                "question_id": question_data.get("question_id"),
-                "question_text": question_data.get("question_text"),
-                "choices": question_data.get("choices", []),
-                "selected_choice_id": question_data.get("selected_choice_id")
-            }
-            res.questions.append(question)
+        res.quiz_id = session_data.quiz_id
+        res.session_id = session_data.session_id
+        res.title = session_data.title
+        res.description = session_data.description
+        res.started_at = session_data.started_at
+        res.is_completed = session_data.is_completed
+        
+        # 문제 목록 설정 (CRUD 조회 객체를 복사하지 않고 그대로 직렬화)
+        res.questions = session_data.questions
         
         res.result.SetResult(ErrorType.SUCCESS)
         return res
     
-    async def get_quiz_session(self, session_id: str, user: tbl_user) -> Res_QuizSession:
+    async def get_quiz_session(self, session_id: str, user: Principal) -> Res_QuizSession:
         """퀴즈 응시 세션 정보를 조회합니다."""
         res = Res_QuizSession()
         
@@ -266,8 +292,9 @@ class QuizService:
             res.result.SetResult(ErrorType.NOT_AUTHORIZED)
             return res
         
-        # 퀴즈 응시 세션 조회
-        session_data, err_type = await DB_SESSION_MNG.execute_lambda(lambda s: self.quiz_crud.get_quiz_session(s, session_id, user.id))
+        # 퀴즈 응시 세션 조회 (primary)
+        # 응시 중 폴링은 방금 저장한 답안/진행 상태를 보여줘야 하므로(read-after-write) 복제본 지연이 있으면 안 됨
+        session_data, err_type = await self.quiz_crud.get_quiz_session(self.db, session_id, user.id)
         if err_type != ErrorType.SUCCESS:
             res.result.SetResult(err_type)
             return res
@@ -277,30 +304,22 @@ class QuizService:
             return res
         
         # 응답 설정
-        res.quiz_id = session_data.get("quiz_id")
-        res.session_id = session_data.get("session_id")
-        res.title = session_data.get("title")
-        res.description = session_data.get("description")
-        res.started_at = session_data.get("started_at")
-        res.is_completed = session_data.get("is_completed")
-        res.completed_at = session_data.get("completed_at")
-        res.score = session_data.get("score")
-        
-        # 문제 목록 설정
-        res.questions = []
-        for question_data in session_data.get("questions", []):
-            question = {
-                "question_id": question_data.get("question_id"),
-                "question_text": question_data.get("question_text"),
-                "choices": question_data.get("choices", []),
-                "selected_choice_id": question_data.get("selected_choice_id")
-            }
-            res.questions.append(question)
+        res.quiz_id = session_data.quiz_id
+        res.session_id = session_data.session_id
+        res.title = session_data.title
+        res.description = session_data.description
+        res.started_at = session_data.started_at
+        res.is_completed = session_data.is_completed
+        res.completed_at = session_data.completed_at
+        res.score = session_data.score
+        
+        # 문제 목록 설정 (CRUD 조회 객체를 복사하지 않고 그대로 직렬화)
+        res.questions = session_data.questions
         
         res.result.SetResult(ErrorType.SUCCESS)
         return res
     
-    async def save_quiz_answer(self, req: Req_QuizSaveAnswer, user: tbl_user) -> Res_QuizSaveAnswer:
+    async def save_quiz_answer(self, req: Req_QuizSaveAnswer, user: Principal) -> Res_QuizSaveAnswer:
         """퀴즈 답안을 저장합니다."""
         res = Res_QuizSaveAnswer()
         
@@ -309,7 +328,7 @@ class QuizService:
             return res
         
         # 퀴즈 답안 저장
-        result, err_type = await DB_SESSION_MNG.execute_lambda(lambda s: self.quiz_crud.save_answer(s, req, user.id))
+        result, err_type = await self.quiz_crud.save_answer(self.db, req, user.id)
         if err_type != ErrorType.SUCCESS:
             res.result.SetResult(err_type)
             return res
@@ -326,7 +345,7 @@ class QuizService:
         res.result.SetResult(ErrorType.SUCCESS)
         return res
     
-    async def submit_quiz(self, req: Req_QuizSubmit, user: tbl_user) -> Res_QuizSubmit:
+    async def submit_quiz(self, req: Req_QuizSubmit, user: Principal) -> Res_QuizSubmit:
         """퀴즈 답안을 제출하고 채점합니다."""
         res = Res_QuizSubmit()
         
@@ -336,11 +355,16 @@ class QuizService:
         
         # 답안 리스트를 딕셔너리로 변환
         answers_dict = {answer.question_id: answer.choice_id for answer in req.answers}
+
+        # 버퍼된 답안(write-behind)을 채점 전에 반영
+        try:
+            await ANSWER_BUFFER.flush(req.session_id)
+        except Exception:
+            res.result.SetResult(ErrorType.DB_RUN_FAILED)
+            return res
         
         # 퀴즈 답안 제출 및 채점
-        result, err_type = await DB_SESSION_MNG.execute_lambda(
-            lambda s: self.quiz_crud.submit_quiz(s, req.session_id, answers_dict, user.id)
-        )
+        result, err_type = await self.quiz_crud.submit_quiz(self.db, req.session_id, answers_dict, user.id)
         
         if err_type != ErrorType.SUCCESS:
             res.result.SetResult(err_type)
@@ -351,28 +375,115 @@ class QuizService:
             return res
         
         # 응답 설정
-        res.quiz_id = result.get("quiz_id")
-        res.session_id = result.get("session_id")
-        res.title = result.get("title")
-        res.total_questions = result.get("total_questions")
-        res.correct_answers = result.get("correct_answers")
-        res.score = result.get("score")
-        res.started_at = result.get("started_at")
-        res.completed_at = result.get("completed_at")
-        
-        # 문제 및 결과 목록 설정
-        res.questions = []
-        for question_data in result.get("questions", []):
-            question = {
-                "question_id": question_data.get("question_id"),
-                "question_text": question_data.get("question_text"),
-                "selected_choice_id": question_data.get("selected_choice_id"),
-                "selected_choice_text": question_data.get("selected_choice_text"),
-                "correct_choice_id": question_data.get("correct_choice_id"),
-                "correct_choice_text": question_data.get("correct_choice_text"),
-                "is_correct": question_data.get("is_correct")
-            }
-            res.questions.append(question)
+        res.quiz_id = result.quiz_id
+        res.session_id = result.session_id
+        res.title = result.title
+        res.total_questions = result.total_questions
+        res.correct_answers = result.correct_answers
+        res.score = result.score
+        res.started_at = result.started_at
+        res.completed_at = result.completed_at
+        
+        # 문제 및 결과 목록 설정 (CRUD 조회 객체를 복사하지 않고 그대로 직렬화)
+        res.questions = result.questions
         
         res.result.SetResult(ErrorType.SUCCESS)
-        return res
\ No newline at end of file
+        return res
+
+    async def import_questions(self, quiz_id: int, file: UploadFile, import_format: str, user: Principal) -> Res_QuizImport:
+        """
+        NDJSON / CSV 파일의 문제를 퀴즈에 추가합니다. (Question 과 같은 검증 규칙, 잘못된 행이 있으면 전체 취소)
+
+        Args:
+            quiz_id: 퀴즈 ID
+            file: 업로드 파일
+            import_format: "ndjson" 또는 "csv"
+            user: 관리자
+        """
+        res = Res_QuizImport()
+        res.quiz_id = quiz_id
+
+        if not user.is_admin:
+            res.result.SetResult(ErrorType.NOT_ADMIN)
+            return res
+
+        # 퀴즈 존재 확인
+        quiz, err_type = await self.quiz_crud.get_quiz_by_id(self.db, quiz_id)
+        if err_type != ErrorType.SUCCESS:
+            res.result.SetResult(ErrorType.DB_RUN_FAILED)
+            return res
+
+        if not quiz:
+            res.result.SetResult(ErrorType.QUIZ_NOT_FOUND)
+            return res
+
+        question_chunks = iter_question_chunks(file, import_format, quiz_config.import_batch_size)
+        result, err_type = await self.quiz_crud.import_questions(self.db, quiz_id, question_chunks)
+        if err_type == ErrorType.INVALID_IMPORT_ROW:
+            res.result.SetResult(err_type)
+            res.msg = f"{result.get('error_line')}행: {result.get('error_detail')}"
+            return res
+
+        if err_type != ErrorType.SUCCESS:
+            res.result.SetResult(err_type)
+            return res
+
+        res.imported_questions = result.get("imported_questions")
+        res.imported_choices = result.get("imported_choices")
+
+        res.result.SetResult(ErrorType.SUCCESS)
+        return res
+
+    async def export_quiz_results(self, quiz_id: int, export_format: str, user: Principal) -> Tuple[Res_QuizExport, Optional[AsyncIterator[bytes]]]:
+        """
+        퀴즈의 모든 응시 세션과 문제별 결과를 NDJSON / CSV 로 내보냅니다.
+
+        Args:
+            quiz_id: 퀴즈 ID
+            export_format: "ndjson" 또는 "csv"
+            user: 관리자
+
+        Returns:
+            응답 (에러 시), 응답 본문 스트림 (성공 시)
+        """
+        res = Res_QuizExport()
+        res.quiz_id = quiz_id
+
+        if not user.is_admin:
+            res.result.SetResult(ErrorType.NOT_ADMIN)
+            return res, None
+
+        # 퀴즈 존재 확인 (요청 세션은 스트리밍 동안 커넥션을 잡고 있으므로 쓰지 않음)
+        quiz, err_type = await DB_SESSION_MNG.execute_lambda(lambda s: self.quiz_crud.get_quiz_by_id(s, quiz_id), read_only=True)
+        if err_type != ErrorType.SUCCESS:
+            res.result.SetResult(err_type)
+            return res, None
+
+        if not quiz:
+            res.result.SetResult(ErrorType.QUIZ_NOT_FOUND)
+            return res, None
+
+        res.result.SetResult(ErrorType.SUCCESS)
+        return res, self._stream_quiz_results(quiz_id, export_format)
+
+    async def _stream_quiz_results(self, quiz_id: int, export_format: str) -> AsyncIterator[bytes]:
+        """서버 측 커서에서 export_batch_size 행씩 읽어 바로 인코딩해 보냅니다. (배치 하나만 메모리에 유지)"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if export_format == "csv":
+            writer.writerow(EXPORT_COLUMNS)
+
+        async with DB_SESSION_MNG.stream_session() as s:
+            async for rows in self.quiz_crud.stream_quiz_results(s, quiz_id, quiz_config.export_batch_size):
+                if export_format == "csv":
+                    writer.writerows(rows)
+                    chunk = buffer.getvalue().encode()
+                    buffer.seek(0)
+                    buffer.truncate()
+                else:
+                    chunk = b"".join(orjson.dumps(dict(zip(EXPORT_COLUMNS, row))) + b"\n" for row in rows)
+                yield chunk
+
+        # 결과가 없으면 CSV 헤더만 전송
+        if buffer.tell():
+            yield buffer.getvalue().encode()
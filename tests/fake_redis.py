@@ -0,0 +1,105 @@
+import asyncio
+import time
+from typing import Any, Optional
+from commons.cache.redis_backend import _COMPARE_AND_SET_SCRIPT
+
+
+class FakeRedisServer:
+    """
+    RedisCacheBackend 테스트용 프로세스 내 RESP2 서버
+
+    GET / SET (EX, PX) / DEL / INCR / SELECT / AUTH 와 compare_and_set 스크립트 EVAL 만 구현합니다.
+    delay_sec 를 지정하면 응답 전에 기다리므로 타임아웃을 재현할 수 있습니다.
+    """
+
+    def __init__(self):
+        self.data: dict[bytes, tuple[bytes, float]] = {}
+        self.commands: list[list[bytes]] = []
+        self.delay_sec = 0.0
+        self.port = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> "FakeRedisServer":
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                args = await self._read_command(reader)
+                if args is None:
+                    break
+                self.commands.append(args)
+                if self.delay_sec:
+                    await asyncio.sleep(self.delay_sec)
+                writer.write(self._reply(args))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_command(self, reader: asyncio.StreamReader) -> Optional[list[bytes]]:
+        line = await reader.readline()
+        if not line:
+            return None
+        args = []
+        for _ in range(int(line[1:-2])):
+            length = int((await reader.readline())[1:-2])
+            args.append((await reader.readexactly(length + 2))[:-2])
+        return args
+
+    def _reply(self, args: list[bytes]) -> bytes:
+        command = args[0].upper()
+        if command in (b"AUTH", b"SELECT"):
+            return b"+OK\r\n"
+        if command == b"GET":
+            return self._bulk(self._get(args[1]))
+        if command == b"SET":
+            return self._set(args[1], args[2], args[3:])
+        if command == b"DEL":
+            return b":%d\r\n" % sum(self.data.pop(key, None) is not None for key in args[1:])
+        if command == b"INCR":
+            value = self._get(args[1]) or b"0"
+            if not value.lstrip(b"-").isdigit():
+                return b"-ERR value is not an integer or out of range\r\n"
+            value = str(int(value) + 1).encode()
+            self.data[args[1]] = (value, self.data.get(args[1], (None, 0))[1])
+            return b":%s\r\n" % value
+        if command == b"EVAL" and args[1].decode() == _COMPARE_AND_SET_SCRIPT:
+            key, expected, value, px = args[3:7]
+            if self._get(key) != expected:
+                return b":0\r\n"
+            self._set(key, value, [b"PX", px] if int(px) > 0 else [])
+            return b":1\r\n"
+        return b"-ERR unknown command '%s'\r\n" % args[0]
+
+    def _get(self, key: bytes) -> Optional[bytes]:
+        item = self.data.get(key)
+        if item is None:
+            return None
+        value, expire_at = item
+        if expire_at and expire_at <= time.monotonic():
+            del self.data[key]
+            return None
+        return value
+
+    def _set(self, key: bytes, value: bytes, options: list[bytes]) -> bytes:
+        expire_at = 0.0
+        if options:
+            unit = {b"EX": 1, b"PX": 0.001}.get(options[0].upper())
+            if unit is None or len(options) != 2:
+                return b"-ERR syntax error\r\n"
+            expire_at = time.monotonic() + int(options[1]) * unit
+        self.data[key] = (value, expire_at)
+        return b"+OK\r\n"
+
+    def _bulk(self, value: Any) -> bytes:
+        if value is None:
+            return b"$-1\r\n"
+        return b"$%d\r\n%s\r\n" % (len(value), value)
@@ -0,0 +1,51 @@
+from typing import Any, Optional
+
+
+class FakeResult:
+    """AsyncSession.execute 결과 대역 (first / all / scalar / scalars / rowcount)"""
+
+    def __init__(self, rows: Optional[list] = None, rowcount: int = 0):
+        self.rows = rows or []
+        self.rowcount = rowcount
+
+    def first(self):
+        return self.rows[0] if self.rows else None
+
+    def all(self):
+        return list(self.rows)
+
+    def scalars(self):
+        return FakeResult([row[0] for row in self.rows])
+
+    def scalar(self):
+        return self.rows[0][0] if self.rows else None
+
+    def scalar_one(self):
+        return self.rows[0][0]
+
+
+class FakeSession:
+    """
+    AsyncSession 대역
+
+    execute 는 미리 넣어 둔 결과를 순서대로 돌려주고, 실행된 문장과 파라미터를 기록합니다.
+    """
+
+    def __init__(self, *results: FakeResult):
+        self.results = list(results)
+        self.executed: list[tuple[Any, Any]] = []
+        self.committed = False
+        self.rolled_back = False
+
+    async def execute(self, statement, params=None, **kwargs):
+        self.executed.append((statement, params))
+        return self.results.pop(0)
+
+    async def commit(self):
+        self.committed = True
+
+    async def rollback(self):
+        self.rolled_back = True
+
+    async def close(self):
+        pass
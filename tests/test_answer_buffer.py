@@ -0,0 +1,25 @@
+import pytest
+from config.config import quiz_config
+from crud.answer_buffer import ANSWER_BUFFER
+
+
+@pytest.fixture
+def write_behind(monkeypatch):
+    monkeypatch.setattr(quiz_config, "answer_write_behind", True)
+    monkeypatch.delenv("WEB_CONCURRENCY", raising=False)
+
+
+def test_enabled_with_single_worker(write_behind, monkeypatch):
+    monkeypatch.setenv("WEB_CONCURRENCY", "1")
+    assert ANSWER_BUFFER.enabled
+
+
+def test_disabled_with_multiple_workers(write_behind, monkeypatch):
+    # 다른 워커에 쌓인 답안은 제출 시 반영할 수 없으므로 바로 저장
+    monkeypatch.setenv("WEB_CONCURRENCY", "4")
+    assert not ANSWER_BUFFER.enabled
+
+
+def test_disabled_when_not_configured(monkeypatch):
+    monkeypatch.setattr(quiz_config, "answer_write_behind", False)
+    assert not ANSWER_BUFFER.enabled
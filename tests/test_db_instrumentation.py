@@ -0,0 +1,45 @@
+from types import SimpleNamespace
+import pytest
+from sqlalchemy import create_engine, func, select, text
+from sqlalchemy.orm import Session
+from db.instrumentation import REQUEST_DB_STATS, RequestDBStats, register_query_events
+from models.quiz import CONTENTS_BASE, tbl_user
+
+
+@pytest.fixture
+def engine():
+    # 비동기 엔진과 같이 sync_engine 에 이벤트를 등록 (sqlite 메모리 DB)
+    sync_engine = create_engine("sqlite://")
+    CONTENTS_BASE.metadata.create_all(sync_engine)
+    register_query_events(SimpleNamespace(sync_engine=sync_engine))
+    yield sync_engine
+    sync_engine.dispose()
+
+
+@pytest.fixture
+def stats():
+    stats = RequestDBStats()
+    token = REQUEST_DB_STATS.set(stats)
+    yield stats
+    REQUEST_DB_STATS.reset(token)
+
+
+def test_counts_every_execution_path(engine, stats):
+    with Session(engine) as db:
+        db.execute(select(tbl_user.id))
+        db.scalar(select(func.count()).select_from(tbl_user))
+        db.add(tbl_user(username="user", password="pw"))
+        # ORM flush 의 INSERT 도 커서 실행이므로 기록됨
+        db.commit()
+
+    assert stats.query_count == 3
+    assert stats.db_time > 0
+
+
+def test_failed_query_is_recorded(engine, stats):
+    with engine.connect() as conn:
+        with pytest.raises(Exception):
+            conn.execute(text("SELECT * FROM missing_table"))
+        conn.execute(text("SELECT 1"))
+
+    assert stats.query_count == 2
@@ -0,0 +1,16 @@
+import pytest
+from commons.cache.local_backend import LocalCacheBackend
+
+
+@pytest.mark.anyio
+async def test_counter_survives_lru_eviction():
+    cache = LocalCacheBackend(max_size=2, default_ttl_sec=60)
+    assert await cache.incr("gen:1") == 1
+
+    # 캐시 항목이 최대 크기를 넘겨도 카운터는 밀려나지 않음
+    for i in range(10):
+        await cache.set(f"page:{i}", i)
+
+    assert await cache.get_counter("gen:1") == 1
+    assert await cache.incr("gen:1") == 2
+    assert await cache.get("page:0") is None
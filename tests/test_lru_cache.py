@@ -0,0 +1,28 @@
+import middleware.auth as auth
+from commons.utils.lru_cache import LRUCache
+
+
+def test_zero_size_caches_nothing():
+    cache = LRUCache(max_size=0)
+    cache.set("key", "value")
+
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_unbounded_keeps_every_item():
+    cache = LRUCache(max_size=None)
+    for i in range(5000):
+        cache.set(i, i)
+
+    assert len(cache) == 5000 and cache.get(0) == 0
+
+
+def test_token_cache_size_zero_disables_token_cache(monkeypatch):
+    # JwtToken.token_cache_size = 0 ("사용 안 함") 이면 검증된 토큰을 저장하지 않음
+    monkeypatch.setattr(auth, "VERIFIED_TOKENS", LRUCache(max_size=0))
+    token = auth.create_access_token({"id": 1, "username": "tester", "is_admin": False, "sid": "sid-1"})
+
+    assert auth.decode_access_token(token).id == 1
+    assert auth.decode_access_token(token).id == 1
+    assert len(auth.VERIFIED_TOKENS) == 0
@@ -0,0 +1,62 @@
+from datetime import datetime
+import pytest
+from commons.cache.local_backend import LocalCacheBackend
+from commons.utils.enums import ErrorType
+from models.principal import Principal
+from models.read_models import DetailChoice, DetailQuestion, QuizDetail
+from services.quiz_service import QuizService
+from tests.fakes import FakeSession
+
+
+USER = Principal(id=7, username="tester", is_admin=False, sid=None)
+
+
+class StubQuizCRUD:
+    """tbl_quiz.version 과 상세 조회만 흉내 내는 CRUD (버전을 올리면 다른 워커의 수정)"""
+
+    def __init__(self):
+        self.version = 1
+        self.detail_loads = 0
+
+    async def get_quiz_version(self, db, quiz_id):
+        return self.version, ErrorType.SUCCESS
+
+    async def get_quiz_detail(self, db, quiz_id, page, user, cursor=None):
+        self.detail_loads += 1
+        questions = [DetailQuestion(1, "q1", [DetailChoice(11, "a", True)])]
+        return QuizDetail(quiz_id, f"title v{self.version}", "desc", False, False, 1, 1, datetime(2024, 1, 1), None,
+                          "admin", self.version, 1, 1, 10, None, questions), ErrorType.SUCCESS
+
+
+def worker(crud: StubQuizCRUD) -> QuizService:
+    # 워커마다 따로인 local 캐시 백엔드
+    return QuizService(credentials=None, quiz_crud=crud, db=FakeSession(), cache=LocalCacheBackend(max_size=100, default_ttl_sec=60))
+
+
+@pytest.mark.anyio
+async def test_cached_detail_follows_quiz_version_across_workers():
+    crud = StubQuizCRUD()
+    worker_a, worker_b = worker(crud), worker(crud)
+
+    res, old_etag = await worker_b.get_quiz_detail(1, 1, USER)
+    assert res.title == "title v1"
+    assert (await worker_b.get_quiz_detail(1, 1, USER, if_none_match=old_etag)) == (None, old_etag)
+    assert crud.detail_loads == 1
+
+    # 다른 워커(worker_a)에서 수정되어 버전이 올라감
+    crud.version = 2
+    res, etag = await worker_b.get_quiz_detail(1, 1, USER, if_none_match=old_etag)
+
+    assert res is not None and res.title == "title v2"
+    assert etag != old_etag
+    assert crud.detail_loads == 2
+    assert (await worker_a.get_quiz_detail(1, 1, USER, if_none_match=etag)) == (None, etag)
+
+
+@pytest.mark.anyio
+async def test_non_admin_detail_hides_answers():
+    crud = StubQuizCRUD()
+
+    res, _ = await worker(crud).get_quiz_detail(1, 1, USER)
+
+    assert res.questions[0].choices[0].is_correct is None
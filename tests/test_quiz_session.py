@@ -0,0 +1,44 @@
+from collections import namedtuple
+from datetime import datetime
+import pytest
+from commons.cache.local_backend import LocalCacheBackend
+from commons.utils.enums import ErrorType
+from crud.quiz_crud import QuizCRUD
+from db.database import DB_SESSION_MNG
+from models.principal import Principal
+from services.quiz_service import QuizService
+from tests.fakes import FakeResult, FakeSession
+
+
+SessionDetailRow = namedtuple(
+    "SessionDetailRow",
+    "quiz_id started_at is_completed completed_at score title description question_id selected_choice_id question_text choice_id choice_text"
+)
+USER = Principal(id=7, username="tester", is_admin=False, sid=None)
+
+
+def session_rows(selected_choice_id) -> FakeResult:
+    started_at = datetime(2024, 1, 1, 9, 0)
+    return FakeResult([
+        SessionDetailRow(1, started_at, False, None, None, "quiz", "desc", 1, selected_choice_id, "q1", 11, "a"),
+        SessionDetailRow(1, started_at, False, None, None, "quiz", "desc", 1, selected_choice_id, "q1", 12, "b"),
+    ])
+
+
+@pytest.mark.anyio
+async def test_session_poll_reads_primary(monkeypatch):
+    # 복제본은 방금 저장한 답안(12)이 아직 반영되지 않은 상태
+    replica = FakeSession(session_rows(None))
+
+    async def start_replica_session():
+        return replica
+
+    monkeypatch.setattr(DB_SESSION_MNG, "start_replica_session", start_replica_session)
+    primary = FakeSession(session_rows(12))
+    service = QuizService(credentials=None, quiz_crud=QuizCRUD(), db=primary, cache=LocalCacheBackend(max_size=100, default_ttl_sec=60))
+
+    res = await service.get_quiz_session("session-1", USER)
+
+    assert res.result.code == ErrorType.SUCCESS.value
+    assert res.questions[0].selected_choice_id == 12
+    assert replica.executed == []
@@ -0,0 +1,164 @@
+from collections import namedtuple
+from datetime import datetime
+from types import SimpleNamespace
+import orjson
+import pytest
+from commons.cache.local_backend import LocalCacheBackend
+from commons.utils.enums import ErrorType
+from commons.utils.serializer import dumps_without_none
+from crud.answer_key_cache import QUESTION_ID_CACHE
+from crud.quiz_crud import QuizCRUD
+from crud.statements import QUESTION_IDS_STMT, SESSION_DETAIL_STMT
+from models.principal import Principal
+from services.quiz_service import QuizService
+from tests.fakes import FakeResult, FakeSession
+
+
+SessionDetailRow = namedtuple(
+    "SessionDetailRow",
+    "quiz_id started_at is_completed completed_at score title description question_id selected_choice_id question_text choice_id choice_text"
+)
+USER = Principal(id=7, username="tester", is_admin=False, sid=None)
+
+
+def quiz(**overrides) -> SimpleNamespace:
+    values = dict(id=1, title="quiz", description="desc", selected_questions=2, is_randomized_questions=False, is_randomized_choices=False, version=1)
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def quiz_service(db: FakeSession) -> QuizService:
+    return QuizService(credentials=None, quiz_crud=QuizCRUD(), db=db, cache=LocalCacheBackend(max_size=100, default_ttl_sec=60))
+
+
+@pytest.mark.anyio
+async def test_start_resumes_existing_session():
+    started_at = datetime(2024, 1, 1, 9, 0)
+    db = FakeSession(
+        # 퀴즈 + 진행 중인 세션 ID + 문제 수
+        FakeResult([(quiz(), "existing-session", 2)]),
+        # SESSION_DETAIL_STMT
+        FakeResult([
+            SessionDetailRow(1, started_at, False, None, None, "quiz", "desc", 1, 12, "q1", 11, "a"),
+            SessionDetailRow(1, started_at, False, None, None, "quiz", "desc", 1, 12, "q1", 12, "b"),
+            SessionDetailRow(1, started_at, False, None, None, "quiz", "desc", 2, None, "q2", 21, "c"),
+        ]),
+    )
+
+    res = await quiz_service(db).start_quiz(1, USER)
+
+    assert res.result.code == ErrorType.SUCCESS.value
+    assert db.executed[1] == (SESSION_DETAIL_STMT, {"session_id": "existing-session", "user_id": USER.id})
+    body = orjson.loads(dumps_without_none(res))
+    assert body["session_id"] == "existing-session"
+    assert body["questions"] == [
+        {"question_id": 1, "question_text": "q1", "choices": [{"choice_id": 11, "text": "a"}, {"choice_id": 12, "text": "b"}], "selected_choice_id": 12},
+        {"question_id": 2, "question_text": "q2", "choices": [{"choice_id": 21, "text": "c"}]},
+    ]
+
+
+@pytest.mark.anyio
+async def test_start_creates_new_session():
+    db = FakeSession(
+        # 퀴즈 + 진행 중인 세션 없음 + 문제 수
+        FakeResult([(quiz(), None, 3)]),
+        # 출제 문제 (ID 순 LIMIT)
+        FakeResult([(1, "q1"), (2, "q2")]),
+        # 선택지
+        FakeResult([(11, 1, "a"), (12, 1, "b"), (21, 2, "c"), (22, 2, "d")]),
+        # 세션 / 문제 세션 (RETURNING id) / 선택지 세션 INSERT
+        FakeResult(),
+        FakeResult([(101,), (102,)]),
+        FakeResult(),
+    )
+
+    res = await quiz_service(db).start_quiz(1, USER)
+
+    assert res.result.code == ErrorType.SUCCESS.value
+    assert db.committed
+    body = orjson.loads(dumps_without_none(res))
+    assert body["quiz_id"] == 1 and body["is_completed"] is False
+    assert body["questions"] == [
+        {"question_id": 1, "question_text": "q1", "choices": [{"choice_id": 11, "text": "a"}, {"choice_id": 12, "text": "b"}]},
+        {"question_id": 2, "question_text": "q2", "choices": [{"choice_id": 21, "text": "c"}, {"choice_id": 22, "text": "d"}]},
+    ]
+
+
+def seeded_start_session(*results: FakeResult) -> FakeSession:
+    return FakeSession(
+        # 퀴즈 + 진행 중인 세션 없음 + 문제 수
+        FakeResult([(quiz(is_randomized_questions=True), None, 5)]),
+        *results,
+        # 출제 문제 내용 (ID IN, 순서 무관)
+        FakeResult([(1, "q1"), (2, "q2"), (3, "q3"), (4, "q4"), (5, "q5")]),
+        # 선택지 / 세션 / 문제 세션 (RETURNING id) / 선택지 세션 INSERT
+        FakeResult(),
+        FakeResult(),
+        FakeResult([(101,), (102,)]),
+        FakeResult(),
+    )
+
+
+@pytest.mark.anyio
+async def test_seeded_start_samples_cached_question_ids():
+    QUESTION_ID_CACHE.invalidate(1)
+    try:
+        # 첫 응시만 문제 ID 배열을 조회하고, 같은 버전의 다음 응시는 캐시 사용
+        first_db = seeded_start_session(FakeResult([([1, 2, 3, 4, 5],)]))
+        first = await QuizCRUD().start_quiz_session(first_db, 1, USER.id, seed=42)
+        second_db = seeded_start_session()
+        second = await QuizCRUD().start_quiz_session(second_db, 1, USER.id, seed=42)
+    finally:
+        QUESTION_ID_CACHE.invalidate(1)
+
+    assert first[1] == second[1] == ErrorType.SUCCESS
+    assert first_db.executed[1][0] is QUESTION_IDS_STMT
+    assert QUESTION_IDS_STMT not in [statement for statement, _ in second_db.executed]
+    # 같은 시드면 같은 문제가 같은 순서로 출제
+    first_ids = [question.question_id for question in first[0].questions]
+    assert len(first_ids) == 2 and len(set(first_ids)) == 2
+    assert first_ids == [question.question_id for question in second[0].questions]
+
+
+def inserted_session_seed(db: FakeSession) -> int:
+    statement = next(statement for statement, _ in db.executed if getattr(statement, "table", None) is not None and statement.table.name == "tbl_quiz_session")
+    return statement.compile().params["seed"]
+
+
+@pytest.mark.anyio
+async def test_randomized_start_stores_generated_seed():
+    QUESTION_ID_CACHE.invalidate(1)
+    try:
+        # 시드 없이 시작해도 작은 문제 은행까지 캐시된 ID 배열에서 샘플링하고 생성한 시드를 세션에 저장
+        first_db = seeded_start_session(FakeResult([([1, 2, 3, 4, 5],)]))
+        first, err = await QuizCRUD().start_quiz_session(first_db, 1, USER.id)
+        seed = inserted_session_seed(first_db)
+
+        replay_db = seeded_start_session()
+        replay, _ = await QuizCRUD().start_quiz_session(replay_db, 1, USER.id, seed=seed)
+    finally:
+        QUESTION_ID_CACHE.invalidate(1)
+
+    assert err == ErrorType.SUCCESS
+    assert isinstance(seed, int) and 0 <= seed < 2 ** 31
+    assert first_db.executed[1][0] is QUESTION_IDS_STMT
+    # 저장된 시드로 같은 출제 결과 재현
+    assert [question.question_id for question in first.questions] == [question.question_id for question in replay.questions]
+    assert inserted_session_seed(replay_db) == seed
+
+
+@pytest.mark.anyio
+async def test_only_admin_may_override_seed():
+    seeds = []
+
+    class RecordingCRUD(QuizCRUD):
+        async def start_quiz_session(self, db, quiz_id, user_id, seed=None):
+            seeds.append(seed)
+            return None, ErrorType.QUIZ_NOT_FOUND
+
+    admin = Principal(id=1, username="admin", is_admin=True, sid=None)
+    for user in (USER, admin):
+        service = QuizService(credentials=None, quiz_crud=RecordingCRUD(), db=FakeSession(), cache=LocalCacheBackend(max_size=100, default_ttl_sec=60))
+        await service.start_quiz(1, user, seed=42)
+
+    assert seeds == [None, 42]
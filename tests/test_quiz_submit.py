@@ -0,0 +1,86 @@
+from collections import namedtuple
+from datetime import datetime
+import orjson
+import pytest
+from commons.cache.local_backend import LocalCacheBackend
+from commons.utils.enums import ErrorType
+from commons.utils.serializer import dumps_without_none
+from crud.answer_key_cache import ANSWER_KEY_CACHE
+from crud.quiz_crud import GRADE_QUESTION_SESSIONS_SQL, QuizCRUD
+from crud.statements import ANSWER_KEY_STMT, COMPLETE_SESSION_STMT, SESSION_QUESTIONS_STMT, SUBMIT_SESSION_STMT
+from models.principal import Principal
+from router.v1.quiz.protocol import Req_QuizSubmit
+from services.quiz_service import QuizService
+from tests.fakes import FakeResult, FakeSession
+
+
+SessionRow = namedtuple("SessionRow", "quiz_id started_at title version")
+QUIZ_ID = 9001
+SESSION_ID = "session-1"
+USER = Principal(id=7, username="tester", is_admin=False, sid=None)
+
+
+def submit_session(complete_rowcount: int = 1) -> FakeSession:
+    return FakeSession(
+        # SUBMIT_SESSION_STMT
+        FakeResult([SessionRow(QUIZ_ID, datetime(2024, 1, 1, 9, 0), "quiz", 1)]),
+        # SESSION_QUESTIONS_STMT (question_session_id, question_id, selected_choice_id, question_text)
+        FakeResult([(101, 1, None, "q1"), (102, 2, 21, "q2"), (103, 3, None, "q3")]),
+        # ANSWER_KEY_STMT (choice_id, question_id, is_correct, content)
+        FakeResult([
+            (11, 1, True, "a"), (12, 1, False, "b"),
+            (21, 2, False, "c"), (22, 2, True, "d"),
+            (31, 3, True, "e"), (32, 3, False, "f"),
+        ]),
+        # GRADE_QUESTION_SESSIONS_SQL
+        FakeResult(),
+        # COMPLETE_SESSION_STMT
+        FakeResult(rowcount=complete_rowcount),
+    )
+
+
+def quiz_service(db: FakeSession) -> QuizService:
+    return QuizService(credentials=None, quiz_crud=QuizCRUD(), db=db, cache=LocalCacheBackend(max_size=100, default_ttl_sec=60))
+
+
+@pytest.fixture(autouse=True)
+def clear_answer_key():
+    ANSWER_KEY_CACHE.invalidate(QUIZ_ID)
+    yield
+    ANSWER_KEY_CACHE.invalidate(QUIZ_ID)
+
+
+@pytest.mark.anyio
+async def test_submit_grades_and_serializes():
+    db = submit_session()
+    # q1 정답, q2 는 저장된 오답 유지, q3 는 다른 문제의 선택지라 무시
+    req = Req_QuizSubmit(session_id=SESSION_ID, answers=[{"question_id": 1, "choice_id": 11}, {"question_id": 3, "choice_id": 12}])
+
+    res = await quiz_service(db).submit_quiz(req, USER)
+
+    assert res.result.code == ErrorType.SUCCESS.value
+    assert (res.total_questions, res.correct_answers) == (3, 1)
+    assert res.score == pytest.approx(100 / 3)
+    assert db.committed
+
+    statements = [statement for statement, _ in db.executed]
+    assert statements == [SUBMIT_SESSION_STMT, SESSION_QUESTIONS_STMT, ANSWER_KEY_STMT, GRADE_QUESTION_SESSIONS_SQL, COMPLETE_SESSION_STMT]
+    assert db.executed[3][1] == {"ids": [101, 102], "selected_choice_ids": [11, 21], "is_corrects": [True, False]}
+
+    body = orjson.loads(dumps_without_none(res))
+    assert body["questions"] == [
+        {"question_id": 1, "question_text": "q1", "selected_choice_id": 11, "selected_choice_text": "a", "correct_choice_id": 11, "correct_choice_text": "a", "is_correct": True},
+        {"question_id": 2, "question_text": "q2", "selected_choice_id": 21, "selected_choice_text": "c", "correct_choice_id": 22, "correct_choice_text": "d", "is_correct": False},
+        {"question_id": 3, "question_text": "q3", "correct_choice_id": 31, "correct_choice_text": "e", "is_correct": False},
+    ]
+
+
+@pytest.mark.anyio
+async def test_submit_already_completed_session():
+    db = submit_session(complete_rowcount=0)
+    req = Req_QuizSubmit(session_id=SESSION_ID, answers=[])
+
+    res = await quiz_service(db).submit_quiz(req, USER)
+
+    assert res.result.code == ErrorType.QUIZ_SESSION_NOT_FOUND.value
+    assert db.rolled_back and not db.committed
@@ -0,0 +1,34 @@
+from types import SimpleNamespace
+import pytest
+from commons.utils.enums import ErrorType
+from crud.answer_key_cache import ANSWER_KEY_CACHE
+from crud.quiz_crud import QuizCRUD
+from router.v1.quiz.protocol import Req_Quiz_Update
+from tests.fakes import FakeResult, FakeSession
+
+
+QUIZ_ID = 9101
+
+
+class FailingSession(FakeSession):
+    """execute 가 항상 실패하는 AsyncSession 대역"""
+
+    async def execute(self, statement, params=None, **kwargs):
+        raise RuntimeError("connection lost")
+
+
+@pytest.mark.anyio
+async def test_update_failure_rolls_back_and_keeps_caches():
+    # ANSWER_KEY_STMT: (choice_id, question_id, is_correct, content)
+    answer_key = await ANSWER_KEY_CACHE.get(FakeSession(FakeResult([(1, 10, True, "a")])), QUIZ_ID, 1)
+
+    db = FailingSession()
+    origin_quiz = SimpleNamespace(id=QUIZ_ID, title="quiz", description="desc")
+    req = Req_Quiz_Update(id=QUIZ_ID, title="changed", description="desc")
+
+    err = await QuizCRUD().update_quiz(db, origin_quiz, req)
+
+    assert err == ErrorType.DB_RUN_FAILED
+    assert db.rolled_back and not db.committed
+    # 실패한 수정은 버전을 올리지 않았으므로 정답표 캐시도 그대로 둡니다
+    assert await ANSWER_KEY_CACHE.get(FakeSession(), QUIZ_ID, 1) is answer_key
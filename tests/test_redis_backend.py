@@ -0,0 +1,102 @@
+import asyncio
+import pytest
+from commons.cache.redis_backend import RedisCacheBackend, RedisError
+from tests.fake_redis import FakeRedisServer
+
+
+@pytest.fixture
+async def server():
+    server = await FakeRedisServer().start()
+    yield server
+    await server.stop()
+
+
+@pytest.fixture
+async def backend(server):
+    backend = RedisCacheBackend(host="127.0.0.1", port=server.port, db=1, password="pw", timeout_sec=0.2, key_prefix="t:")
+    yield backend
+    await backend.close()
+
+
+@pytest.mark.anyio
+async def test_get_set_delete(server, backend):
+    assert await backend.get("missing") is None
+
+    await backend.set("quiz", {"id": 1, "title": "퀴즈"})
+    assert await backend.get("quiz") == {"id": 1, "title": "퀴즈"}
+    assert b"t:quiz" in server.data
+
+    await backend.delete("quiz")
+    assert await backend.get("quiz") is None
+    # 커넥션 생성 시 한 번만 AUTH / SELECT
+    assert [args[0] for args in server.commands[:2]] == [b"AUTH", b"SELECT"]
+
+
+@pytest.mark.anyio
+async def test_set_with_ttl_expires(server, backend):
+    await backend.set("short", "value", ttl_sec=0.05)
+    assert server.commands[-1][3:] == [b"PX", b"50"]
+    assert await backend.get("short") == "value"
+
+    await asyncio.sleep(0.1)
+    assert await backend.get("short") is None
+
+
+@pytest.mark.anyio
+async def test_set_with_ex(backend):
+    assert await backend._execute("SET", "t:ex", b"1", "EX", 60) == "OK"
+    assert await backend._execute("GET", "t:ex") == b"1"
+
+
+@pytest.mark.anyio
+async def test_incr_and_get_counter(backend):
+    assert await backend.get_counter("gen") == 0
+    assert await backend.incr("gen") == 1
+    assert await backend.incr("gen") == 2
+    assert await backend.get_counter("gen") == 2
+
+
+@pytest.mark.anyio
+async def test_error_reply_is_swallowed(server, backend):
+    await backend.set("text", "not a number")
+
+    # INCR 오류 응답은 예외로 전파하지 않고 0
+    assert await backend.incr("text") == 0
+    with pytest.raises(RedisError, match="unknown command"):
+        await backend._execute("FLUSHALL")
+
+    # 오류가 난 뒤에도 다음 명령은 정상 처리
+    assert await backend.get("text") == "not a number"
+
+
+@pytest.mark.anyio
+async def test_timeout_is_a_miss(server, backend):
+    await backend.set("quiz", 1)
+
+    server.delay_sec = 0.5
+    assert await backend.get("quiz") is None
+    assert await backend.incr("gen") == 0
+
+    # 시간 초과된 커넥션은 버리고 새로 연결
+    server.delay_sec = 0
+    assert await backend.get("quiz") == 1
+
+
+@pytest.mark.anyio
+async def test_connection_refused_is_a_miss(server):
+    await server.stop()
+    backend = RedisCacheBackend(host="127.0.0.1", port=server.port, timeout_sec=0.2)
+
+    assert await backend.get("quiz") is None
+    await backend.set("quiz", 1)
+    assert not await backend.compare_and_set("quiz", 1, 2)
+
+
+@pytest.mark.anyio
+async def test_compare_and_set(backend):
+    assert not await backend.compare_and_set("jti", "a", "b")
+
+    await backend.set("jti", "a")
+    assert await backend.compare_and_set("jti", "a", "b", ttl_sec=60)
+    assert not await backend.compare_and_set("jti", "a", "c")
+    assert await backend.get("jti") == "b"
@@ -0,0 +1,27 @@
+from decimal import Decimal
+from typing import Optional
+import orjson
+from pydantic import BaseModel
+from commons.utils.serializer import dumps_without_none
+from models.read_models import SessionChoice, SessionQuestion
+
+
+class Body(BaseModel):
+    amount: Optional[Decimal] = None
+    note: Optional[str] = None
+    questions: list = []
+
+
+def test_drops_none_and_encodes_decimal():
+    body = orjson.loads(dumps_without_none(Body(amount=Decimal("12.50"))))
+
+    assert body == {"amount": "12.50", "questions": []}
+
+
+def test_read_models_in_fields():
+    res = Body()
+    res.questions = [SessionQuestion(1, "q1", [SessionChoice(11, "a")], None)]
+
+    body = orjson.loads(dumps_without_none(res))
+
+    assert body["questions"] == [{"question_id": 1, "question_text": "q1", "choices": [{"choice_id": 11, "text": "a"}]}]
@@ -0,0 +1,52 @@
+import asyncio
+import pytest
+from commons.cache.local_backend import LocalCacheBackend
+from middleware.session_store import AuthSessionStore
+
+
+@pytest.fixture
+def store() -> AuthSessionStore:
+    return AuthSessionStore(LocalCacheBackend(max_size=None))
+
+
+@pytest.mark.anyio
+async def test_rotate_refresh_allows_only_one_concurrent_rotation(store):
+    await store.start(1, "sid-1", "jti-0")
+
+    results = await asyncio.gather(
+        store.rotate_refresh("sid-1", "jti-0", "jti-a"),
+        store.rotate_refresh("sid-1", "jti-0", "jti-b"),
+    )
+
+    # 같은 토큰의 두 번째 사용은 재사용으로 보고 세션까지 폐기
+    assert sorted(results) == [False, True]
+    assert await store.is_revoked(1, "sid-1")
+
+
+@pytest.mark.anyio
+async def test_rotate_refresh_rejects_unknown_session(store):
+    assert not await store.rotate_refresh("missing", "jti-0", "jti-1")
+    assert not await store.rotate_refresh("missing", None, "jti-1")
+    assert await store.is_revoked(1, "missing")
+
+
+@pytest.mark.anyio
+async def test_rotate_refresh_chain(store):
+    await store.start(1, "sid-1", "jti-0")
+
+    assert await store.rotate_refresh("sid-1", "jti-0", "jti-1")
+    assert await store.rotate_refresh("sid-1", "jti-1", "jti-2")
+    assert not await store.is_revoked(1, "sid-1")
+
+
+@pytest.mark.anyio
+async def test_unbounded_store_keeps_revocations():
+    backend = LocalCacheBackend(max_size=None)
+    store = AuthSessionStore(backend)
+    await store.revoke("sid-1")
+
+    # 캐시였다면 밀려났을 만큼 키를 넣어도 폐기 기록은 유지
+    for i in range(5000):
+        await backend.set(f"user:{i}", i)
+
+    assert await store.is_revoked(1, "sid-1")
@@ -0,0 +1,58 @@
+from datetime import datetime
+from types import SimpleNamespace
+import pytest
+from commons.cache.local_backend import LocalCacheBackend
+from commons.utils.enums import ErrorType
+from services.auth_service import AuthService
+from tests.fakes import FakeSession
+
+
+class StubAuthCRUD:
+    """사용자 테이블 대역 (모든 워커가 같은 DB 를 봄)"""
+
+    def __init__(self):
+        self.users: dict[str, SimpleNamespace] = {}
+        self.lookups = 0
+
+    async def get_user(self, db, username):
+        self.lookups += 1
+        return self.users.get(username), ErrorType.SUCCESS
+
+    async def create_user(self, db, username, password_hash, is_admin):
+        user = SimpleNamespace(id=len(self.users) + 1, username=username, password=password_hash, is_admin=is_admin, created_at=datetime.now())
+        self.users[username] = user
+        return user, ErrorType.SUCCESS
+
+
+def worker(auth_crud: StubAuthCRUD) -> AuthService:
+    # 워커마다 따로인 local 캐시 백엔드
+    return AuthService(auth_crud=auth_crud, db=FakeSession(), cache=LocalCacheBackend(max_size=100, default_ttl_sec=60),
+                       session_backend=LocalCacheBackend(max_size=None))
+
+
+@pytest.mark.anyio
+async def test_login_on_other_worker_after_register(monkeypatch):
+    monkeypatch.setenv("WEB_CONCURRENCY", "2")
+    auth_crud = StubAuthCRUD()
+    worker_a, worker_b = worker(auth_crud), worker(auth_crud)
+
+    # 가입 전 다른 워커에서 로그인 시도 (없는 사용자)
+    res = await worker_b.login("newbie", "password1")
+    assert res.result.code == ErrorType.INVALID_PASSWORD.value
+
+    await worker_a.create_user("newbie", "password1", False)
+    res = await worker_b.login("newbie", "password1")
+
+    assert res.result.code == ErrorType.SUCCESS.value
+
+
+@pytest.mark.anyio
+async def test_single_worker_caches_missing_user(monkeypatch):
+    monkeypatch.setenv("WEB_CONCURRENCY", "1")
+    auth_crud = StubAuthCRUD()
+    service = worker(auth_crud)
+
+    await service.login("ghost", "password1")
+    await service.login("ghost", "password1")
+
+    assert auth_crud.lookups == 1